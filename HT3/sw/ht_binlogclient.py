@@ -18,26 +18,66 @@
 #
 #################################################################
 # Ver:0.1.8  / Datum 01.05.2015 first release
+# Ver:0.2    / 2026-10-18       binlog-format v2 (timestamped, compressed blocks, file-rotation)
+#                                with ht_binlog.cht_binlogwriter, block-reads with 'read_into()'.
+#                               option '--raw' writes plain binlog-files like before.
+# Ver:0.2.1  / 2026-10-18       default binfile 'ht_binlog.htb' (--raw: 'ht_binlog.log').
+# Ver:0.2.2  / 2026-10-18       buffered data written and file closed also on SIGTERM.
 #################################################################
 
 import sys, os
+import signal
+import argparse
 sys.path.append('lib')
 import ht_proxy_if
+import ht_binlog
+
+__author__  = "junky-zs"
+__status__  = "draft"
+__version__ = "0.2.2"
+__date__    = "2026-10-18"
 
 
 configfile="./etc/config/ht_proxy_cfg.xml"
 
-binfile="./var/log/ht_binlog.log"
+parser = argparse.ArgumentParser(prog='ht_binlogclient.py',
+                                 formatter_class=argparse.RawDescriptionHelpFormatter,
+                                 description='''----------------------------------------------------------
+Logging of binary heater-bus data from ht_proxy to file
+----------------------------------------------------------
+ example: ht_binlogclient.py -s 50 ht_binlog.htb
+  -> writes binlog v2 to ./var/log/ht_binlog_<date_time>.htb,
+     new file after 50 MByte''')
+parser.add_argument('binfile', nargs='?', default=None,
+                    help = 'binlog-file, without path written to ./var/log; default = ht_binlog.htb (--raw: ht_binlog.log)')
+parser.add_argument('-z', '--compression', default = 'zlib', choices = ['none', 'zlib', 'lzma'],
+                    help = 'block-compression; default = zlib')
+parser.add_argument('-s', '--maxsize', default = 0, type = float,
+                    help = 'new file after maxsize MByte; default = 0 (no rotation)')
+parser.add_argument('-a', '--maxage', default = 0, type = float,
+                    help = 'new file after maxage hours; default = 0 (no rotation)')
+parser.add_argument('-f', '--flushtime', default = 60.0, type = float,
+                    help = 'write buffered data at least after flushtime seconds; default = 60')
+parser.add_argument('--raw', action = 'store_true',
+                    help = 'write plain binlog-file (no timestamps, no compression)')
+arguments = vars(parser.parse_args())
+
+binfile = arguments['binfile']
+if binfile == None:
+    binfile = 'ht_binlog.log' if arguments['raw'] else 'ht_binlog.htb'
+if not '/' in binfile:
+    binfile = os.path.join("./var/log", binfile)
 
-if len(sys.argv) > 1:
-    if '/' in str(sys.argv[1]):
-        binfile=str(sys.argv[1])
-    else:
-        binfile=os.path.join("./var/log", str(sys.argv[1]))
-    
 try:
     print("   -- start binaer data logging to file: {0} --".format(binfile))
-    fobj=open(binfile,"wb")
+    if arguments['raw']:
+        fobj = open(binfile, "wb")
+    else:
+        fobj = ht_binlog.cht_binlogwriter(binfile,
+                                          compression=ht_binlog.compression_id(arguments['compression']),
+                                          flushinterval=arguments['flushtime'],
+                                          maxfilesize=int(arguments['maxsize'] * 1024 * 1024),
+                                          maxfileage=arguments['maxage'] * 3600.0)
 except:
     print("couldn't open file:{0}".format(binfile))
     raise
@@ -48,19 +88,25 @@ except:
     print("couldn't open proxy-client;check config-file:{0}".format(configfile))
     raise
 
-loop=True
-while loop:
-    try:
-        fobj.write(client.read())
-    except (KeyboardInterrupt):
-        loop=False
-    except IOError:
-        loop=False
-        print("couldn't write to file:{0}".format(binfile))
-        raise
-
-    fobj.flush()
+def sigterm_handler(signum, frame):
+    # terminate like Ctrl-C, buffered data are written in 'finally'
+    raise KeyboardInterrupt
 
+signal.signal(signal.SIGTERM, sigterm_handler)
 
-fobj.flush()
-fobj.close()
+buffer = bytearray(4096)
+loop=True
+try:
+    while loop:
+        try:
+            readsize = client.read_into(buffer)
+            fobj.write(bytes(buffer[:readsize]))
+        except (KeyboardInterrupt):
+            loop=False
+        except IOError:
+            loop=False
+            print("couldn't write to file:{0}".format(binfile))
+            raise
+finally:
+    fobj.flush()
+    fobj.close()
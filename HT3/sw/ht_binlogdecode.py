@@ -0,0 +1,77 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+# Ver:0.2    / 2026-10-18       option '-j' for parallel decoding added
+#################################################################
+
+import sys
+import argparse
+sys.path.append('lib')
+import ht_bulkdecode
+
+__author__  = "agent"
+__status__  = "draft"
+__version__ = "0.2"
+__date__    = "2026-10-18"
+
+
+def set_options():
+    parser = argparse.ArgumentParser(prog='ht_binlogdecode.py',
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     description='''----------------------------------------------------------
+Offline decoding of binlog-files (see: ht_binlogclient.py)
+  to CSV- and NumPy-files for each syspart
+----------------------------------------------------------
+ example: ht_binlogdecode.py -o ./var/decoded ./var/log/ht_binlog.log
+  -> writes HG.csv, HG.npy, HK1.csv ... to ./var/decoded''')
+    parser.add_argument('binlogfiles', nargs='+',
+                        help = 'binlog-file(s) decoded in given order')
+    parser.add_argument('-c', '--config', default = './etc/config/HT3_db_cfg.xml', type = str,
+                        help = 'configuration-file; default = ./etc/config/HT3_db_cfg.xml')
+    parser.add_argument('-o', '--output', default = './var/decoded', type = str,
+                        help = 'output-directory; default = ./var/decoded')
+    parser.add_argument('--no-npy', dest = 'npy', action = 'store_false',
+                        help = 'write only CSV-files')
+    parser.add_argument('-j', '--jobs', default = 1, type = int,
+                        help = 'number of decoding processes, 0 := number of CPUs; default = 1')
+    return vars(parser.parse_args())
+
+
+def main(arguments):
+    bulkdecode = ht_bulkdecode.cht_bulkdecode(arguments['config'], arguments['output'], numpy_output=arguments['npy'])
+    (frames, seconds) = (0, 0.0)
+    for binlogfile in arguments['binlogfiles']:
+        if arguments['jobs'] == 1:
+            statistic = bulkdecode.decode(binlogfile)
+        else:
+            statistic = bulkdecode.decode_parallel(binlogfile, workers=arguments['jobs'] or None)
+        print("{0}: {1} frames, {2} bytes, {3:.2f} sec, {4:.0f} frames/sec".format(binlogfile,
+              statistic['frames'], statistic['bytes'], statistic['seconds'], statistic['frames_per_sec']))
+        frames += statistic['frames']
+        seconds += statistic['seconds']
+    rowcounts = bulkdecode.close()
+    for (nickname, rowcount) in sorted(rowcounts.items()):
+        print("  {0:4}: {1} rows".format(nickname, rowcount))
+    if seconds > 0:
+        print("total: {0} frames, {1:.2f} sec, {2:.0f} frames/sec".format(frames, seconds, frames / seconds))
+
+
+if __name__ == "__main__":
+    main(set_options())
@@ -0,0 +1,102 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+# Ver:0.2    / 2026-10-18       time-window options '--begin' and '--end' for binlog-files v2
+#################################################################
+
+import sys
+import os
+import argparse
+import datetime
+sys.path.append('lib')
+import ht_binindex
+
+__author__  = "agent"
+__status__  = "draft"
+__version__ = "0.2"
+__date__    = "2026-10-18"
+
+
+def set_options():
+    parser = argparse.ArgumentParser(prog='ht_binlogindex.py',
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     description='''----------------------------------------------------------
+Create frame-index (<binlogfile>.idx) of a binlog-file and
+  show/decode the frames matching the filters
+----------------------------------------------------------
+ example: ht_binlogindex.py -m 190 -d ./var/log/ht_binlog.log
+  -> decodes all frames with msgID:190''')
+    parser.add_argument('binlogfile',
+                        help = 'binlog-file')
+    parser.add_argument('-c', '--config', default = './etc/config/HT3_db_cfg.xml', type = str,
+                        help = 'configuration-file; default = ./etc/config/HT3_db_cfg.xml')
+    parser.add_argument('-m', '--msgid', default = None, type = int,
+                        help = 'show only frames with that msgID')
+    parser.add_argument('-s', '--source', default = None, type = lambda value: int(value, 0),
+                        help = 'show only frames from that source-address')
+    parser.add_argument('-t', '--target', default = None, type = lambda value: int(value, 0),
+                        help = 'show only frames to that target-address')
+    parser.add_argument('--begin', default = None, type = datetime.datetime.fromisoformat,
+                        help = 'show only frames received at/after that time (binlog v2), like: 2026-10-18T12:00')
+    parser.add_argument('--end', default = None, type = datetime.datetime.fromisoformat,
+                        help = 'show only frames received before that time (binlog v2)')
+    parser.add_argument('-d', '--decode', action = 'store_true',
+                        help = 'decode the frames')
+    parser.add_argument('-r', '--rebuild', action = 'store_true',
+                        help = 'rebuild the index, also if available')
+    return vars(parser.parse_args())
+
+
+def __timestr(frametime):
+    if frametime > 0.0:
+        return datetime.datetime.fromtimestamp(frametime).isoformat(timespec='milliseconds')
+    return "-"
+
+
+def main(arguments):
+    binlogfile = arguments['binlogfile']
+    indexfile = binlogfile + ".idx"
+    if arguments['rebuild'] or not os.path.exists(indexfile) or \
+            os.path.getmtime(indexfile) < os.path.getmtime(binlogfile):
+        count = ht_binindex.cht_binindex.create(binlogfile, arguments['config'], indexfile)
+        print("index created: {0}; {1} frames".format(indexfile, count))
+    index = ht_binindex.cht_binindex(indexfile)
+    filters = (arguments['msgid'], arguments['source'], arguments['target'],
+               None if arguments['begin'] == None else arguments['begin'].timestamp(),
+               None if arguments['end'] == None else arguments['end'].timestamp())
+    if filters == (None, None, None, None, None):
+        print("{0} frames indexed".format(len(index)))
+        return
+    if arguments['decode']:
+        seeker = ht_binindex.cht_binlogseeker(binlogfile, arguments['config'], index)
+        for (record, nickname, values) in seeker.frames(*filters):
+            print("offset:{0:<10} {1} msgID:{2:4}_{3:<2} S{4:02x} T{5:02x} {7}:{8}".format(
+                record[0], __timestr(record[1]), *record[2:], nickname, values))
+        seeker.close()
+    else:
+        for number in index.find(*filters):
+            record = index[number]
+            print("offset:{0:<10} {1} msgID:{2:4}_{3:<2} S{4:02x} T{5:02x} size:{6}".format(
+                record[0], __timestr(record[1]), *record[2:]))
+    index.close()
+
+
+if __name__ == "__main__":
+    main(set_options())
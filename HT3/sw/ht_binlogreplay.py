@@ -0,0 +1,94 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+#################################################################
+
+import sys
+import time
+import argparse
+sys.path.append('lib')
+import ht_replay
+
+__author__  = "agent"
+__status__  = "draft"
+__version__ = "0.1"
+__date__    = "2026-10-18"
+
+
+def set_options():
+    parser = argparse.ArgumentParser(prog='ht_binlogreplay.py',
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     description='''----------------------------------------------------------
+Replay of binlog-files as ht_proxy-server or pseudo-terminal
+ for load-tests without heater-hardware.
+ Every binlog-file is replayed as own stream on port, port+1, ...
+ or on an own pseudo-terminal.
+----------------------------------------------------------
+ example: ht_binlogreplay.py -x 10 -l ./var/log/ht_binlog.htb
+  -> replays the binlog-file endless with 10 times speed
+     to ht_proxy-clients on port 48088''')
+    parser.add_argument('binlogfiles', nargs='+',
+                        help = 'binlog-file(s), repeat the same file for more streams')
+    parser.add_argument('-x', '--speed', default = 1.0, type = float,
+                        help = 'replay-speed; 1 = realtime, 0 = maximum; default = 1')
+    parser.add_argument('-l', '--loop', action = 'store_true',
+                        help = 'replay endless')
+    parser.add_argument('--pty', action = 'store_true',
+                        help = 'replay to pseudo-terminal(s) instead of ht_proxy-server')
+    parser.add_argument('-a', '--address', default = 'localhost', type = str,
+                        help = 'server-address; default = localhost')
+    parser.add_argument('-p', '--port', default = 48088, type = int,
+                        help = 'server-port of first stream; default = 48088')
+    parser.add_argument('-b', '--baudrate', default = 9600, type = int,
+                        help = 'byte-timing for plain binlog-files (without timestamps); default = 9600')
+    parser.add_argument('-g', '--maxgap', default = 10.0, type = float,
+                        help = 'shorten pauses of the recording to maxgap seconds; default = 10')
+    return vars(parser.parse_args())
+
+
+def main(arguments):
+    streams = []
+    for (number, binlogfile) in enumerate(arguments['binlogfiles']):
+        source = ht_replay.cht_replaysource(binlogfile, speed=arguments['speed'], loop=arguments['loop'],
+                                            baudrate=arguments['baudrate'], maxgap=arguments['maxgap'])
+        if arguments['pty']:
+            stream = ht_replay.cht_replaypty(source)
+            print("stream:{0}; {1} -> {2}".format(number, binlogfile, stream.devicename()))
+        else:
+            stream = ht_replay.cht_replayserver(source, (arguments['address'], arguments['port'] + number))
+            print("stream:{0}; {1} -> {2}:{3}".format(number, binlogfile, *stream.server_address()))
+        streams.append((stream, source))
+        stream.start()
+
+    try:
+        while any(stream.is_alive() for (stream, source) in streams):
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    for (number, (stream, source)) in enumerate(streams):
+        stream.close()
+        stats = source.stats()
+        print("stream:{0}; frames:{1}; bytes:{2}; loops:{3}; {4:.1f} sec; {5:.0f} bytes/sec; max. lag:{6:.3f} sec".format(
+            number, stats['frames'], stats['bytes'], stats['loops'], stats['elapsed'],
+            stats['bytes_per_s'], stats['maxlag']))
+
+
+if __name__ == "__main__":
+    main(set_options())
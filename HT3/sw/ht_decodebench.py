@@ -0,0 +1,170 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+#################################################################
+
+import sys
+import os
+import json
+import timeit
+import logging
+import argparse
+import tempfile
+import tracemalloc
+sys.path.append('lib')
+import data
+import ht_discode
+import ht_bulkdecode
+import ht_telegram
+
+__author__  = "agent"
+__status__  = "draft"
+__version__ = "0.1"
+__date__    = "2026-10-18"
+
+_MODES = ("raw", "transceiver")
+
+
+def set_options():
+    parser = argparse.ArgumentParser(prog='ht_decodebench.py',
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     description='''----------------------------------------------------------
+Throughput-benchmark of 'cht_discode.discoder()' with synthetic
+ telegrams for all msgIDs in raw- and transceiver-mode
+----------------------------------------------------------
+ example: ht_decodebench.py --save ./var/decodebench.json
+  -> later runs with '--baseline ./var/decodebench.json' are
+     failing (exit-code 1) if frames/sec are less than tolerance''')
+    parser.add_argument('-c', '--config', default = './etc/config/HT3_db_cfg.xml', type = str,
+                        help = 'configuration-file; default = ./etc/config/HT3_db_cfg.xml')
+    parser.add_argument('-n', '--frames', default = 20000, type = int,
+                        help = 'number of telegrams; default = 20000')
+    parser.add_argument('-r', '--repeat', default = 3, type = int,
+                        help = 'number of runs, the fastest one is used; default = 3')
+    parser.add_argument('--seed', default = 1, type = int,
+                        help = 'seed of the telegram-generator; default = 1')
+    parser.add_argument('--noise', default = 0.05, type = float,
+                        help = 'probability of random bytes before a telegram; default = 0.05')
+    parser.add_argument('--black', default = 0.1, type = float,
+                        help = 'probability of a polling-sequence before a telegram; default = 0.1')
+    parser.add_argument('-m', '--mode', default = None, choices = _MODES,
+                        help = 'run only that mode; default = all')
+    parser.add_argument('--save', default = None, type = str,
+                        help = 'write the results as json to that file')
+    parser.add_argument('--baseline', default = None, type = str,
+                        help = 'compare with results of that json-file')
+    parser.add_argument('--tolerance', default = 10.0, type = float,
+                        help = 'allowed frames/sec decrease to baseline in percent; default = 10')
+    return vars(parser.parse_args())
+
+
+def decode(binfile, commondata, logger):
+    """
+    decodes the complete binfile, returns the number of decoded telegrams.
+    """
+    filehandle = ht_bulkdecode.cht_filesource(binfile)
+    decoder = ht_discode.cht_discode(None, commondata, 0, filehandle, logger=logger)
+    frames = 0
+    last_message = None
+    try:
+        while True:
+            decoder.discoder()
+            if not decoder.last_message() is last_message:
+                last_message = decoder.last_message()
+                frames += 1
+    except EOFError:
+        pass
+    filehandle.close()
+    return frames
+
+
+def benchmark(binfile, commondata, logger, repeat):
+    """
+    returns the result of one mode as dict.
+    """
+    times = []
+    for run in range(repeat):
+        starttime = timeit.default_timer()
+        frames = decode(binfile, commondata, logger)
+        times.append(timeit.default_timer() - starttime)
+    # memory used while decoding, measured in an extra run
+    tracemalloc.start()
+    startsize = tracemalloc.get_traced_memory()[0]
+    decode(binfile, commondata, logger)
+    (currentsize, peaksize) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"frames": frames,
+            "seconds": min(times),
+            "frames_per_s": frames / min(times),
+            "us_per_frame": min(times) / frames * 1e6,
+            "peak_kb": (peaksize - startsize) / 1024.0,
+            "retained_bytes_per_frame": (currentsize - startsize) / frames}
+
+
+def main(arguments):
+    logger = logging.getLogger("ht_decodebench")
+    logger.addHandler(logging.NullHandler())
+    logger.setLevel(logging.INFO)
+    commondata = data.cdata()
+    commondata.setlogger(logger)
+    commondata.read_db_config(arguments['config'], logger=logger)
+
+    generator = ht_telegram.cht_telegramgenerator(seed=arguments['seed'])
+    results = {}
+    for mode in _MODES:
+        if arguments['mode'] != None and arguments['mode'] != mode:
+            continue
+        stream = generator.stream(arguments['frames'], transceiver=(mode == "transceiver"),
+                                  noise=arguments['noise'], black_sequences=arguments['black'])
+        (handle, binfile) = tempfile.mkstemp(suffix=".bin")
+        with os.fdopen(handle, "wb") as fobj:
+            fobj.write(stream)
+        try:
+            results[mode] = benchmark(binfile, commondata, logger, arguments['repeat'])
+        finally:
+            os.remove(binfile)
+        result = results[mode]
+        print("{0:<12} frames:{1:>7}/{2:<7} {3:8.3f} sec {4:10.0f} frames/sec {5:7.1f} us/frame; peak:{6:.0f} kB; retained:{7:.1f} bytes/frame".format(
+            mode, result['frames'], arguments['frames'], result['seconds'], result['frames_per_s'],
+            result['us_per_frame'], result['peak_kb'], result['retained_bytes_per_frame']))
+
+    if arguments['save'] != None:
+        with open(arguments['save'], "w") as fobj:
+            json.dump({"python": sys.version.split()[0], "frames": arguments['frames'],
+                       "seed": arguments['seed'], "results": results}, fobj, indent=2)
+
+    regression = False
+    if arguments['baseline'] != None:
+        with open(arguments['baseline']) as fobj:
+            baseline = json.load(fobj)["results"]
+        for (mode, result) in results.items():
+            if not mode in baseline:
+                continue
+            change = (result['frames_per_s'] / baseline[mode]['frames_per_s'] - 1.0) * 100.0
+            state = "ok"
+            if change < -arguments['tolerance']:
+                state = "REGRESSION"
+                regression = True
+            print("{0:<12} {1:+6.1f}% to baseline: {2}".format(mode, change, state))
+    return 1 if regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(set_options()))
@@ -24,14 +24,28 @@
 #                                port.setInterCharTimeout() removed
 # Ver:0.4    / 2023-10-06  logitems matching with the values now exported.
 # Ver:0.4.1  / 2023-11-20  Exception logging modified.
+# Ver:0.5    / 2026-10-18  cht_if_worker logs the decode-statistics of 'ht_discode' periodically.
+# Ver:0.5.1  / 2026-10-18  decode-statistics logged by a timer-thread, also if the bus is quiet.
+# Ver:0.5.2  / 2026-10-18  cht_if_worker loads the values from the optional state-file at startup,
+#                           no waittime if values updated since system-boot are restored.
+#                           The state-file is written periodically and on stop.
+# Ver:0.6    / 2026-10-18  more heaters in one collgate: every 'ht_if' in configuration is
+#                           one heater with own cht_if_worker and namespace (topic-/table-prefix).
+#                           One cstore2db-thread and one mqtt-client are shared by all heaters.
+# Ver:0.6.1  / 2026-10-18  with restored values the waittime ends for every systempart after
+#                           its first refresh from the bus, not for all systemparts at startup.
+# Ver:0.6.2  / 2026-10-18  cht_namespace_router puts accessnames with unknown topic-prefix to the
+#                           heater without topic-prefix, nested topics work again with one heater.
 #################################################################
 
 import sys
 import os
+import re
 import time
 import serial
 import threading
 import socket
+import sqlite3
 import queue
 import data
 import ht_discode
@@ -95,12 +109,18 @@ __date__    = "2023-11-20"
 #    For sending heater-commands the ht_proxy-server is         #
 ä    required.                                                  #
 #                                                               #
+# class: cht_namespace_queue() / cht_namespace_router()        #
+#  These classes are used with more heaters ('ht_if') to put    #
+#  the data of all heaters with namespace to shared queues and  #
+#  to route the mqtt set-commands to the matching heater.       #
+#                                                               #
 # class: ccollgate_cfg()                                        #
 #  This class is used for reading the collgate-configurationfile#
 #                                                               #
 # class: cstore2db()                                            #
-#  This class stores the decoded heater-data into the           #
-#  sqlite-database and the rrdtool-database (if enabled).       #
+#  This class stores the decoded heater-data of all heaters     #
+#  into the sqlite-database and the rrdtool-database (if        #
+#  enabled).                                                    #
 #  Automatic draw for rrdtool-draw ist called every 60 sec.     #
 #  Automatic erase of old data is done fore the sqlite-db.      #
 #  This class has the same functionality of HT3_logger and      #
@@ -399,11 +419,19 @@ class cht_if_worker(threading.Thread):
     """class 'cht_if_worker' is used to start the dispathing and decoding of
         ht_rawdata.
         Method 'run' calls the dispatcher and decoder and runs endless.
+        The decode-statistics are logged every 'decode_stats_interval' seconds
+         by an own timer-thread, so they are logged also if the bus is quiet.
     """
+    decode_stats_interval = 3600.0
+
     def __init__(self, configurationfilename,
                  putdata_flag=True,
                  logging=None,
-                 loglevel_in=logging.INFO):
+                 loglevel_in=logging.INFO,
+                 dataqueues=None):
+        """ optional: dataqueues (tuple of decoded_data_queue and decoded_data_4_DBs)
+             used instead of own queues, e.g. namespace-queues shared by more heaters.
+        """
         threading.Thread.__init__(self)
         # setup data-struct
         self._data = data.cdata()
@@ -412,13 +440,17 @@ class cht_if_worker(threading.Thread):
         self._loglevel = loglevel_in
 
         self.__thread_run = True
+        self.__stats_stopped = threading.Event()
         self.__filehandle = None
         self.__cfgfilename =str(configurationfilename)
         self.__data_input_mode="ASYNC "   #default value
         self.__port      = None
         # common used queues for RX- and TX-data exchange
-        self.__decoded_data_queue = queue.Queue()
-        self.__decoded_data_4_DBs = queue.Queue()
+        if dataqueues == None:
+            self.__decoded_data_queue = queue.Queue()
+            self.__decoded_data_4_DBs = queue.Queue()
+        else:
+            (self.__decoded_data_queue, self.__decoded_data_4_DBs) = dataqueues
         self.__data_2_send_queue = queue.Queue()
         self.__putdata_flag = putdata_flag
 
@@ -449,6 +481,15 @@ class cht_if_worker(threading.Thread):
         self._loglevel = self._data.loglevel()
         #setup current loglevel read from cfg-file
         self._logging.setLevel(self._loglevel)
+        # restore values from state-file, values updated since system-boot are valid
+        self.__state_restored = False
+        # systemparts refreshed from the bus since startup
+        self.__refreshed_systemparts = set()
+        if len(self._data.state_filename()) > 0:
+            validvalues = self._data.load_state(self._data.state_filename())
+            self.__state_restored = (validvalues > 0)
+            self._logging.info("cht_if_worker(); state-file:{0}; valid values restored:{1}".format(
+                self._data.state_filename(), validvalues))
         # setup interface
         self.__setup()
         self.__startup_time = time.time()
@@ -501,11 +542,15 @@ class cht_if_worker(threading.Thread):
             (Nickname, logitem, itemname, set_param) = self.ht_if_data().get_access_names()[accessname]
             self.__allowed_cmds.update({accessname:set_param})
 
-    def WaitTimeElapsed(self):
-        """Waiting more then 2 minutes for valid heater-data."""
+    def WaitTimeElapsed(self, nickname=None):
+        """Waiting more then 2 minutes for valid heater-data,
+            with valid values restored from state-file only until systempart
+            'nickname' is refreshed from the bus."""
         rtnvalue = False
         if time.time() > self.__startup_time + int(130):
             rtnvalue = True
+        elif self.__state_restored and nickname in self.__refreshed_systemparts:
+            rtnvalue = True
         # force to True on debugging
         if self._loglevel == logging.DEBUG:
             rtnvalue = True
@@ -530,6 +575,31 @@ class cht_if_worker(threading.Thread):
     def ht_if_data(self):
         return self._data
 
+    def __log_decode_stats(self, decoder):
+        """logs the decode-statistics (see: cht_discode.decode_stats()) and resets them."""
+        stats = decoder.decode_stats()
+        decoder.reset_decode_stats()
+        frames = sum(msgid_stats["frames"] for msgid_stats in stats["msgids"].values())
+        crc_errors = sum(source_stats["crc_errors"] for source_stats in stats["sources"].values())
+        self._logging.info("cht_if_worker(); decode-stats since:{0}; frames:{1}; crc-errors:{2}; discarded bytes:{3}; black-sequence bytes:{4}; msgID out of range:{5}".format(
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stats["since"])), frames, crc_errors,
+            stats["discarded_bytes"], stats["black_sequence_bytes"], stats["msgid_out_of_range"]))
+        for (msgid, msgid_stats) in sorted(stats["msgids"].items()):
+            self._logging.info("cht_if_worker();  msgID:{0:4}; frames:{1}; unknown:{2}; rejects:{3}; errors:{4}; decode-time:{5:.1f} us/frame".format(
+                msgid, msgid_stats["frames"], msgid_stats["unknown"], msgid_stats["rejects"], msgid_stats["errors"],
+                msgid_stats["decode_time"] / msgid_stats["frames"] * 1e6 if msgid_stats["frames"] > 0 else 0.0))
+        for (address, source_stats) in sorted(stats["sources"].items()):
+            self._logging.info("cht_if_worker();  source:0x{0:02x}; frames:{1}; crc-errors:{2}; rejects:{3}".format(
+                address, source_stats["frames"], source_stats["crc_errors"], source_stats["rejects"]))
+
+    def __decode_stats_timer(self, decoder):
+        """timer-thread logging the decode-statistics every 'decode_stats_interval' seconds."""
+        while not self.__stats_stopped.wait(self.decode_stats_interval):
+            try:
+                self.__log_decode_stats(decoder)
+            except Exception as e:
+                self._logging.critical("cht_if_worker(); decode-stats logging failed; Error:{}".format(e))
+
     def run(self):
         """
         """
@@ -577,6 +647,10 @@ class cht_if_worker(threading.Thread):
             self.__port.close()
             raise
 
+        threading.Thread(target=self.__decode_stats_timer, args=(decoded_data,),
+                         name="decode_stats_Thread", daemon=True).start()
+        if len(self._data.state_filename()) > 0:
+            self._data.start_state_saving(self._data.state_filename(), self._data.state_interval())
         try:
             while self.__thread_run:
                 # blocking call to discoder() returns nickname/value-tuple
@@ -588,10 +662,12 @@ class cht_if_worker(threading.Thread):
                     break
                 if len(nickname) > 0:
                     logitems = sorted_logitem_names.get(nickname)
+                    if values != None:
+                        self.__refreshed_systemparts.add(nickname)
                 else:
                     logitems = []
                 #send data only if waittime is elapsed (valid data) and value is not 'None'
-                if self.WaitTimeElapsed() and values != None:
+                if self.WaitTimeElapsed(nickname) and values != None:
 
                     # put data to message-queue for Database-saving
                     self.decoded_data_4_DBs().put((nickname, (logitems, values)))
@@ -603,21 +679,84 @@ class cht_if_worker(threading.Thread):
             errorstr="cht_if_worker(); 'discoder()' thread terminated; Error:{}".format(e)
             self._logging.critical(errorstr)
             self.__thread_run = False
+            self.__stats_stopped.set()
+            self.__save_state()
             self.__port.close()
             raise
 
+        self.__stats_stopped.set()
+        self.__save_state()
         self._logging.info("cht_if_worker(); End ----------------------")
 
+    def __save_state(self):
+        """stops the periodic writing of the state-file and writes it the last time."""
+        if len(self._data.state_filename()) > 0:
+            self._data.stop_state_saving()
+            try:
+                self._data.save_state(self._data.state_filename())
+            except EnvironmentError as e:
+                self._logging.critical("cht_if_worker(); state-file not written; Error:{}".format(e))
+
     def stop(self):
         """ """
         if self.__putdata_flag:
             self.decoded_data_queue().put((None, None))
         self.decoded_data_4_DBs().put((None, None))
         self.__thread_run = False
+        self.__stats_stopped.set()
         self.__ht_if_tx_data.stop()
 #--- class cht_if_worker end ---#
 ################################################
 
+class cht_namespace_queue():
+    """class 'cht_namespace_queue' is used by the 'cht_if_worker' of one heater
+        instead of an own queue. The data: (nickname, (logitems, values)) are put
+        as: ((namespace, nickname), (logitems, values)) to the queue shared by all heaters.
+        The stop-entry (None, None) of one heater is not passed to the shared queue.
+    """
+    def __init__(self, shared_queue, namespace):
+        self.__queue = shared_queue
+        self.__namespace = namespace
+
+    def namespace(self):
+        """returns the namespace of the heater."""
+        return self.__namespace
+
+    def put(self, item, block=True, timeout=None):
+        """puts item with namespace to the shared queue."""
+        (nickname, payload) = item
+        if (nickname, payload) != (None, None):
+            self.__queue.put(((self.__namespace, nickname), payload), block, timeout)
+#--- class cht_namespace_queue end ---#
+################################################
+
+class cht_namespace_router():
+    """class 'cht_namespace_router' is used as tx-queue of the mqtt-client shared by all heaters.
+        The received accessname: '<topic_prefix>/<accessname>' is put without prefix
+        to the tx-queue of the heater with that topic-prefix. Unknown prefixes are
+        put to the heater without topic-prefix (like a single heater), if available.
+    """
+    def __init__(self, logging):
+        self._logging = logging
+        self.__tx_queues = {}
+
+    def add(self, topic_prefix, tx_queue):
+        """adds the tx-queue of the heater with 'topic_prefix'."""
+        self.__tx_queues.update({topic_prefix:tx_queue})
+
+    def put(self, item, block=True, timeout=None):
+        """puts item to the tx-queue of the heater matching the topic-prefix."""
+        (accessname, value) = item
+        (topic_prefix, separator, name) = str(accessname).rpartition('/')
+        tx_queue = self.__tx_queues.get(topic_prefix, self.__tx_queues.get(""))
+        if tx_queue == None:
+            errorstr = "cht_namespace_router; unknown topic-prefix:'{0}'; accessname:{1}".format(topic_prefix, accessname)
+            self._logging.warning(errorstr)
+        else:
+            tx_queue.put((name, value), block, timeout)
+#--- class cht_namespace_router end ---#
+################################################
+
 class ccollgate_cfg():
     """class 'ccollgate_cfg' is used for reading the collgate-configurationfile
     """
@@ -630,6 +769,7 @@ class ccollgate_cfg():
         self._logger = logger
         self.__configfilename = ""
         self.__interfaces_cfg = {}
+        self.__heaters_cfg = []
 
     def read_collgate_config(self, xmlcfgpathname="./etc/config/collgate_cfg.xml", logger=None):
         """ Method 'read_collgate_config()' reads the collgate config-parameter from xml-file
@@ -649,10 +789,21 @@ class ccollgate_cfg():
 
         try:
             for if_part in self.__root.findall('interfaces'):
-                # parameter for if: ht
+                # parameter for if: ht, one entry for every heater.
+                #  the first heater is also available as interface: 'ht'
                 for param in if_part.findall('ht_if'):
                     cfg_file = param.find('cfg_file').text
-                    self.__interfaces_cfg.update({ccollgate_cfg.IF_ht:(True, cfg_file)})
+                    name = self.__optional_text(param, 'name', "heater{0}".format(len(self.__heaters_cfg) + 1))
+                    topic_prefix = self.__optional_text(param, 'topic_prefix', "").strip('/')
+                    table_prefix = self.__optional_text(param, 'table_prefix', "")
+                    if re.fullmatch("[A-Za-z0-9_]*", table_prefix) == None:
+                        raise ValueError("ht_if:{0}; table_prefix:'{1}' not allowed".format(name, table_prefix))
+                    for (used_name, used_file, used_topic_prefix, used_table_prefix) in self.__heaters_cfg:
+                        if name == used_name or topic_prefix == used_topic_prefix:
+                            raise ValueError("ht_if:{0}; name or topic_prefix:'{1}' not unique".format(name, topic_prefix))
+                    self.__heaters_cfg.append((name, cfg_file, topic_prefix, table_prefix))
+                    if not ccollgate_cfg.IF_ht in self.__interfaces_cfg:
+                        self.__interfaces_cfg.update({ccollgate_cfg.IF_ht:(True, cfg_file)})
 
                 # parameter for if: MQTT
                 for param in if_part.findall('MQTT_client_if'):
@@ -687,6 +838,21 @@ class ccollgate_cfg():
         """
         return self.__interfaces_cfg
 
+    def get_heaters_config(self):
+        """This method returns the configuration of all heater-interfaces ('ht_if').
+            return-value structure is like:
+                [ ( name, cfg_filename, topic_prefix, table_prefix ), ... ]
+        """
+        return self.__heaters_cfg
+
+    def __optional_text(self, element, tag, default):
+        """returns the text of the optional sub-element 'tag', if not available 'default'."""
+        rtnvalue = default
+        sub_element = element.find(tag)
+        if sub_element != None and sub_element.text != None:
+            rtnvalue = sub_element.text.strip()
+        return rtnvalue
+
     def get_enable_flag(self, interface_name):
         """returns the enable-flag value for this interface."""
         (enable_flag, file) = self.__interfaces_cfg[interface_name]
@@ -705,28 +871,97 @@ class ccollgate_cfg():
 #--- class ccollgate_cfg end ---#
 ################################################
 
+class cstore2db_heater():
+    """class 'cstore2db_heater' holds the databases and timers of one heater
+        used by the storage-thread 'cstore2db'.
+    """
+    def __init__(self, cfg_file, ht_if, tableprefix, database):
+        self.cfg_file = cfg_file
+        self.ht_if = ht_if
+        self.tableprefix = tableprefix
+        self.database = database
+        self.rrdtooldb = None
+        self.sqlite_autoerase = False
+        self.autoerasechecktime = int(time.time()) + 120
+        self.nextTimeStep = time.time()
+        self.nextTimeautocreate = time.time()
+#--- class cstore2db_heater end ---#
+################################################
+
 class cstore2db(threading.Thread):
     """StoreData to DB: created databases are required fore storing the results in db.
         automatic draw for rrdtool-draw ist called every 60 sec. if db is enabled.
         automatic erase of old data is done in sqlite-db if it is enabled.
+        One thread stores the data of all heaters added with 'add_heater()', they are read
+         from the shared queue as: ((namespace, nickname), (logitems, values)).
+        Heaters with the same sqlite-db are using one connection, their tables are
+         separated by the table-prefix. Tables with prefix are created on startup.
     """
-    def __init__(self, cfg_file, ht_if, logging):
+    def __init__(self, dataqueue, logging):
         threading.Thread.__init__(self)
-        self._ht_if = ht_if
-        self._cfg_file = cfg_file
+        self.__dataqueue = dataqueue
         self._logging = logging
         self.__thread_run = True
-        self.__autoerasechecktime = int(time.time()) + 120
+        self.__heaters = {}
+        self.__databases = {}
 
     def __del__(self):
         """class desctructor """
 
-    def __Autoerasing_sqlitedb(self, h_database):
+    def add_heater(self, namespace, cfg_file, ht_if, tableprefix=""):
+        """adds the heater with 'namespace', must be called before start().
+            raises ValueError if the sqlite-tables are already used by another heater.
+        """
+        import db_sqlite
+        database = db_sqlite.cdb_sqlite(cfg_file, logger=self._logging)
+        if database.is_sql_db_enabled():
+            dbfilename = os.path.abspath(database.db_sqlite_filename())
+            for heater in self.__heaters.values():
+                if heater.database is self.__databases.get(dbfilename) and heater.tableprefix == tableprefix:
+                    errorstr = "cstore2db.add_heater();Error;heater:{0}; sqlite-db:{1} and table-prefix:'{2}' already used".format(namespace, dbfilename, tableprefix)
+                    raise ValueError(errorstr)
+            # the connection of the first heater is used for that sqlite-db
+            database = self.__databases.setdefault(dbfilename, database)
+        self.__heaters.update({namespace:cstore2db_heater(cfg_file, ht_if, tableprefix, database)})
+
+    def __Setup_heater(self, heater):
+        """connects the sqlite-db, creates the tables with prefix and the rrdtool-db (if enabled)."""
+        import db_sqlite
+        import db_rrdtool
+        if heater.database.is_sql_db_enabled():
+            if len(heater.tableprefix) > 0:
+                # tables are created with the heater's own configuration
+                database = db_sqlite.cdb_sqlite(heater.cfg_file, logger=self._logging)
+                database.connect()
+                database.createdb_sqlite(heater.tableprefix)
+                database.close()
+            heater.database.connect()
+            # set flag for erasing sqlite-db if enabled
+            if heater.ht_if.ht_if_data().Sqlite_autoerase_seconds() > 0:
+                heater.sqlite_autoerase = True
+
+        if heater.ht_if.ht_if_data().is_db_rrdtool_enabled():
+            try:
+                heater.rrdtooldb = db_rrdtool.cdb_rrdtool(heater.cfg_file, self._logging)
+                heater.rrdtooldb.createdb_rrdtool()
+                # setup the first 'nextTimeStep' to 3 times stepseconds waiting for valid data
+                heater.nextTimeStep = time.time() + int(heater.ht_if.ht_if_data().db_rrdtool_stepseconds()) * 3
+            except Exception as e:
+                errorstr = "cstore2db.run(); could not init rrdtool-db; Error:{}".format(e)
+                self._logging.critical(errorstr)
+                self._logging.info("cstore2db.run(); End   ----------------------")
+                quit()
+            # setup first timestep-value for autocreating draw
+            if heater.ht_if.ht_if_data().IsAutocreate_draw() > 0:
+                heater.nextTimeautocreate = time.time() + 240
+
+    def __Autoerasing_sqlitedb(self, heater):
         """check sqlite database for the oldest entries and delete them if time_limit is reached."""
-        if int(time.time()) >= int(self.__autoerasechecktime):
-            time_limit = int(time.time()) - int(self._ht_if._data.Sqlite_autoerase_seconds())
+        if int(time.time()) >= int(heater.autoerasechecktime):
+            h_database = heater.database
+            time_limit = int(time.time()) - int(heater.ht_if.ht_if_data().Sqlite_autoerase_seconds())
             # get oldest UTC in database
-            firstentry_UTC = self.__GetOldestEntry(h_database)
+            firstentry_UTC = self.__GetOldestEntry(heater)
             if firstentry_UTC == None:
                 firstentry_UTC = int(time.time())
 
@@ -738,9 +973,9 @@ class cstore2db(threading.Thread):
                     debugstr = "sqlite-db autoerasing started;  time:{0}".format(int(time.time()))
                     self._logging.info(debugstr)
                     # erase old datacontend in sqlite-db
-                    for systempartname in self._ht_if._data.syspartnames():
-                        h_database.delete(systempartname, "UTC", str(time_limit), "<")
-                        debugstr = "table-content:<{0}> deleted where UTC is less then:<{1}>".format(systempartname, time_limit)
+                    for systempartname in heater.ht_if.ht_if_data().syspartnames():
+                        h_database.delete(heater.tableprefix + systempartname, "UTC", str(time_limit), "<")
+                        debugstr = "table-content:<{0}> deleted where UTC is less then:<{1}>".format(heater.tableprefix + systempartname, time_limit)
                         self._logging.info(debugstr)
                     # cleanup db
                     h_database.vacuum()
@@ -751,11 +986,11 @@ class cstore2db(threading.Thread):
                     self._logging.critical(errorstr)
 
             # setup next check-time
-            self.__autoerasechecktime = int(time.time()) + 120
+            heater.autoerasechecktime = int(time.time()) + 120
 
-    def __GetOldestEntry(self, h_database):
+    def __GetOldestEntry(self, heater):
         """try to find the first timestamp-entry in column 'UTC' and table
-            'heizgeraet' and return the value. If not found then return 'None'
+            'heizgeraet' (with table-prefix) and return the value. If not found then return 'None'
              search - excample:
               SELECT UTC FROM heizgeraet WHERE UTC NOT NULL ORDER UTC ASC
         """
@@ -763,7 +998,7 @@ class cstore2db(threading.Thread):
         sqlorderbystring = "ORDER BY UTC ASC"
         rtnvalue = None
         try:
-            selectrtn = h_database.selectwhere('heizgeraet', 'UTC', sqlorderbystring, sqlsearchstring, 'UTC')
+            selectrtn = heater.database.selectwhere(heater.tableprefix + 'heizgeraet', 'UTC', sqlorderbystring, sqlsearchstring, 'UTC')
             if not selectrtn == []:
                 for valuetmp in list(selectrtn):
                     # get first UTC-timestamp
@@ -777,109 +1012,85 @@ class cstore2db(threading.Thread):
 
     def run(self):
         """worker thread for sqlite-db using 'threading.Thread'"""
-        import sqlite3
-        import db_sqlite
-        import db_rrdtool
         debug = 0
-        rrdtooldb = None
-        nextTimeStep = time.time()
-        nextTimeautocreate = time.time()
-        sqlite_autoerase = False
-
-        # get db-instance
-        database = db_sqlite.cdb_sqlite(self._cfg_file, logger=self._logging)
-        database.connect()
-
-        # set flag for erasing sqlite-db if enabled
-        if database.is_sql_db_enabled() and self._ht_if.ht_if_data().Sqlite_autoerase_seconds() > 0:
-            sqlite_autoerase = True
-
-        if self._ht_if.ht_if_data().is_db_rrdtool_enabled():
-            try:
-                rrdtooldb = db_rrdtool.cdb_rrdtool(self._cfg_file, self._logging)
-                rrdtooldb.createdb_rrdtool()
-                # setup the first 'nextTimeStep' to 3 times stepseconds waiting for valid data
-                nextTimeStep = time.time() + int(self._ht_if.ht_if_data().db_rrdtool_stepseconds()) * 3
-            except Exception as e:
-                errorstr = "cstore2db.run(); could not init rrdtool-db; Error:{}".format(e)
-                self._logging.critical(errorstr)
-                self._logging.info("cstore2db.run(); End   ----------------------")
-                quit()
-            # setup first timestep-value for autocreating draw
-            if self._ht_if.ht_if_data().IsAutocreate_draw() > 0:
-                nextTimeautocreate = time.time() + 240
+        for heater in self.__heaters.values():
+            self.__Setup_heater(heater)
 
         while self.__thread_run:
             try:
-                # read values from queue, wait if empty or stop if (None, None)
-                (nickname, (logitems, values)) = self._ht_if.decoded_data_4_DBs().get()
-                # terminate thread if both values are None, else process them
-                if (nickname, (logitems, values)) == (None, (None, None)):
+                # read values from queue, wait if empty or stop if (None, (None, None))
+                (namespace_nickname, (logitems, values)) = self.__dataqueue.get()
+                # terminate thread if all values are None, else process them
+                if (namespace_nickname, (logitems, values)) == (None, (None, None)):
                     self.stop()
                     break
+                (namespace, nickname) = namespace_nickname
+                heater = self.__heaters[namespace]
+                ht_if_data = heater.ht_if.ht_if_data()
 
-                if database.is_sql_db_enabled():
-                    database.insert(str(self._ht_if.ht_if_data().getlongname(nickname)), values)
-                    database.commit()
+                if heater.database.is_sql_db_enabled():
+                    heater.database.insert(heater.tableprefix + str(ht_if_data.getlongname(nickname)), values)
+                    heater.database.commit()
 
-                if self._ht_if.ht_if_data().is_db_rrdtool_enabled() and rrdtooldb != None:
+                if ht_if_data.is_db_rrdtool_enabled() and heater.rrdtooldb != None:
                     # write data to rrdtool-db after 'stepseconds' seconds
-                    if time.time() >= nextTimeStep:
+                    if time.time() >= heater.nextTimeStep:
                         # setup next timestep
-                        nextTimeStep = time.time() + int(self._ht_if.ht_if_data().db_rrdtool_stepseconds())
+                        heater.nextTimeStep = time.time() + int(ht_if_data.db_rrdtool_stepseconds())
                         # update rrdtool database
-                        for syspartshortname in rrdtooldb.syspartnames():
+                        for syspartshortname in heater.rrdtooldb.syspartnames():
                             if syspartshortname.upper() == 'DT':
                                 continue
-                            syspartname = rrdtooldb.syspartnames()[syspartshortname]
-                            itemvalue_array = self._ht_if.ht_if_data().getfiltered_sorted_items_with_values(syspartshortname)
-                            error = rrdtooldb.update(syspartname, itemvalue_array, time.time())
+                            syspartname = heater.rrdtooldb.syspartnames()[syspartshortname]
+                            itemvalue_array = ht_if_data.getfiltered_sorted_items_with_values(syspartshortname)
+                            error = heater.rrdtooldb.update(syspartname, itemvalue_array, time.time())
                             if error:
                                 self._logging.critical("rrdtooldb.update();Error;syspartname:{0}".format(syspartname))
 
-                if self._ht_if.ht_if_data().is_db_rrdtool_enabled() and self._ht_if.ht_if_data().IsAutocreate_draw() > 0:
-                    if time.time() >= nextTimeautocreate:
+                if ht_if_data.is_db_rrdtool_enabled() and ht_if_data.IsAutocreate_draw() > 0:
+                    if time.time() >= heater.nextTimeautocreate:
                         # setup next timestep for autocreating draw
-                        nextTimeautocreate = time.time() + 60 * self._ht_if.ht_if_data().IsAutocreate_draw()
+                        heater.nextTimeautocreate = time.time() + 60 * ht_if_data.IsAutocreate_draw()
                         # create draw calling script
-                        (db_path, dbfilename) = self._ht_if.ht_if_data().db_rrdtool_filepathname()
-                        (html_path, filename) = self._ht_if.ht_if_data().db_rrdtool_filepathname('.')
+                        (db_path, dbfilename) = ht_if_data.db_rrdtool_filepathname()
+                        (html_path, filename) = ht_if_data.db_rrdtool_filepathname('.')
                         
-                        second_solar_drawflag = int (self._ht_if.ht_if_data().IsSecondCollectorValue_SO() | \
-                                                 self._ht_if.ht_if_data().IsSecondBuffer_SO()
+                        second_solar_drawflag = int (ht_if_data.IsSecondCollectorValue_SO() | \
+                                                 ht_if_data.IsSecondBuffer_SO()
                                                 )
                         try:
-                            rrdtooldb.create_draw(db_path, html_path,
-                                              int(self._ht_if.ht_if_data().heatercircuits_amount()),
-                                              int(self._ht_if.ht_if_data().controller_type_nr()),
-                                              self._ht_if.ht_if_data().GetAllMixerFlags(),
-                                              int(self._ht_if.ht_if_data().IsTempSensor_Hydrlic_Switch()),
-                                              int(self._ht_if.ht_if_data().IsSolarAvailable()),
+                            heater.rrdtooldb.create_draw(db_path, html_path,
+                                              int(ht_if_data.heatercircuits_amount()),
+                                              int(ht_if_data.controller_type_nr()),
+                                              ht_if_data.GetAllMixerFlags(),
+                                              int(ht_if_data.IsTempSensor_Hydrlic_Switch()),
+                                              int(ht_if_data.IsSolarAvailable()),
                                               int(second_solar_drawflag)
                                             )
                         except Exception as e:
                             errorstr = "cstore2db.run(); Error:{}".format(e)
                             self._logging.critical(errorstr)
 
-                if sqlite_autoerase:
-                    self.__Autoerasing_sqlitedb(database)
+                if heater.sqlite_autoerase:
+                    self.__Autoerasing_sqlitedb(heater)
 
                 # clear last queue-entry with task_done()
-                self._ht_if.decoded_data_4_DBs().task_done()
+                self.__dataqueue.task_done()
             except Exception as e:
-                errorstr = "cstore2db.run(); on ht_if.decoded_data_4_DBs().get(); Error:{}".format(e)
+                errorstr = "cstore2db.run(); on decoded_data_4_DBs.get(); Error:{}".format(e)
                 self._logging.critical(errorstr)
                 self.stop()
                 raise
-        #close db at the end of thread
-        database.close()
+        #close dbs at the end of thread
+        for database in self.__databases.values():
+            database.close()
         errorstr = "cstore2db.run();Error; thread terminated unexpected"
         self._logging.critical(errorstr)
 
     def stop(self):
         """ """
         self.__thread_run = False
-        self._ht_if.decoded_data_4_DBs().put(None, (None, None))
+        self.__dataqueue.put((None, (None, None)))
 #--- class cstore2db end ---#
 ################################################
 
@@ -911,7 +1122,12 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
             raise
 
         self.__thread_run = True
+        # queues shared by all heaters
+        self.__decoded_data_queue = queue.Queue()
+        self.__decoded_data_4_DBs = queue.Queue()
+        self.__tx_router = cht_namespace_router(self._logger)
         self._ht_if = None
+        self._ht_ifs = {}
         self._store2db = None
         self._mqtt_pub_client = None
         self._sps_if = None
@@ -955,15 +1171,34 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
         try:
             try:
                 data_flag = self.__Queuedata_required()
-                ht_cfg_filename = self.get_cfg_file(ccollgate_cfg.IF_ht)
-                # start ht - interface for receiving and decoding heater bus-data
-                self._ht_if = cht_if_worker(ht_cfg_filename,
-                                  putdata_flag=data_flag,
-                                  logging=self._logger,
-                                  loglevel_in=self.__loglevel_in)
-                self._ht_if.setDaemon(True)
-                self._ht_if.start()
-                accessnames = self._ht_if.get_accessnames()
+                ht_cfg_filename = ""
+                if len(self.get_heaters_config()) == 0:
+                    raise ValueError("no 'ht_if' configured")
+                # start ht - interfaces for receiving and decoding heater bus-data,
+                #  one for every heater with own namespace
+                for (name, ht_cfg_filename, topic_prefix, table_prefix) in self.get_heaters_config():
+                    dataqueues = (cht_namespace_queue(self.__decoded_data_queue, name),
+                                  cht_namespace_queue(self.__decoded_data_4_DBs, name))
+                    ht_if = cht_if_worker(ht_cfg_filename,
+                                      putdata_flag=data_flag,
+                                      logging=self._logger,
+                                      loglevel_in=self.__loglevel_in,
+                                      dataqueues=dataqueues)
+                    ht_if.setName("ht_if_" + name)
+                    ht_if.setDaemon(True)
+                    ht_if.start()
+                    self._ht_ifs.update({name:ht_if})
+                    if self._ht_if == None:
+                        self._ht_if = ht_if
+                    # topics of the heater are: <topic_root_name>/[<topic_prefix>/]<accessname>
+                    self.__tx_router.add(topic_prefix, ht_if.data_2_send_queue())
+                    for (nickname, heater_accessnames) in ht_if.get_accessnames().items():
+                        if len(topic_prefix) > 0:
+                            heater_accessnames = [topic_prefix + "/" + accessname for accessname in heater_accessnames]
+                        accessnames.update({(name, nickname):heater_accessnames})
+                    infostr = "ccollgate().run(); heater:{0}; file:'{1}'; topic-prefix:'{2}'; table-prefix:'{3}'".format(
+                        name, ht_cfg_filename, topic_prefix, table_prefix)
+                    self._logger.info(infostr)
             except Exception as e:
                 errorstr = "ccollgate().run();could not start 'ht-interface'; file:'{}'; Error:{}".format(ht_cfg_filename, e)
                 self._logger.critical(errorstr)
@@ -971,9 +1206,10 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
                 raise SystemExit
 
             try:
-                # start thread storing decoded data to databases sqlite and rrdtool
-                cfg_file = self.get_cfg_file(ccollgate_cfg.IF_ht)
-                self._store2db = cstore2db(cfg_file, self._ht_if, logging=self._logger)
+                # start one thread storing decoded data of all heaters to databases sqlite and rrdtool
+                self._store2db = cstore2db(self.__decoded_data_4_DBs, logging=self._logger)
+                for (name, cfg_file, topic_prefix, table_prefix) in self.get_heaters_config():
+                    self._store2db.add_heater(name, cfg_file, self._ht_ifs[name], table_prefix)
                 self._store2db.setDaemon(True)
                 self._store2db.start()
             except Exception as e:
@@ -987,7 +1223,8 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
                 try:
                     import mqtt_client_if
                     cfg_file = self.get_cfg_file(ccollgate_cfg.IF_mqtt)
-                    dataqueues = (self._ht_if.decoded_data_queue(), self._ht_if.data_2_send_queue())
+                    # one broker-connection for all heaters
+                    dataqueues = (self.__decoded_data_queue, self.__tx_router)
                     self._mqtt_pub_client = mqtt_client_if.cmqtt_client(cfg_file, accessnames_in=accessnames)
                     self._mqtt_pub_client.set_dataqueues(dataqueues_rx_tx=dataqueues)
                     self._mqtt_pub_client.setDaemon(True)
@@ -999,7 +1236,7 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
                     self.stop()
                     raise SystemExit
 
-            # start SPS - interface if enabled
+            # start SPS - interface if enabled, it's connected to the first heater
             if self.get_enable_flag(ccollgate_cfg.IF_sps):
                 try:
                     import SPS_if
@@ -1018,9 +1255,9 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
                 # sleep a bit
                 time.sleep(2.0)
                 #check running threads, on error raise exception
-                if self._ht_if != None:
-                    if not self._ht_if.is_alive():
-                        errorstr = "ccollgate().run();Error;cht_if_worker-thread terminated."
+                for (name, ht_if) in self._ht_ifs.items():
+                    if not ht_if.is_alive():
+                        errorstr = "ccollgate().run();Error;cht_if_worker-thread of heater:{0} terminated.".format(name)
                         self._logger.critical(errorstr)
                         raise
                 if self._store2db != None:
@@ -1048,9 +1285,10 @@ class ccollgate(threading.Thread, ccollgate_cfg, ht_utils.clog):
     def stop(self):
         """ """
         self.__thread_run = False
-        if self._ht_if != None:
-            self._ht_if.stop()
-            self._ht_if = None
+        for ht_if in self._ht_ifs.values():
+            ht_if.stop()
+        self._ht_ifs = {}
+        self._ht_if = None
         if self._store2db != None:
             self._store2db.stop()
             self._store2db = None
@@ -1076,6 +1314,11 @@ if __name__ == "__main__":
         (flag, file) = cfg[key]
         print("  {0:12.12} |  {1:10.10} | {2}".format(key, str(flag), file))
     print("---------------+-------------+-------------------")
+    print("Heater-Name    | Topic-/Table-Prefix | Configuration-File")
+    print("---------------+---------------------+-------------------")
+    for (name, file, topic_prefix, table_prefix) in collgate.get_heaters_config():
+        print("  {0:12.12} | {1:9.9} {2:9.9} | {3}".format(name, "'" + topic_prefix + "'", "'" + table_prefix + "'", file))
+    print("---------------+---------------------+-------------------")
 ##
 #   for testpurposes
 #    print("if:{0};flag:{1};file:{2}".format(ccollgate_cfg.IF_ht,
@@ -20,6 +20,8 @@
 # Ver:0.1.8  / Datum 05.10.2015 first release
 # Ver:0.2.x  / Datum xx.yy.2017 renaming modul and test-releases
 # Ver:0.3    / Datum 19.06.2017 fixed errors
+# Ver:0.3.1  / 2026-10-18       additional configured systemparts (like HK5...) mapped to the next
+#                                free command-letters after 'H'.
 #################################################################
 
 import sys
@@ -192,6 +194,12 @@ class cSPS_if(threading.Thread, cSPS_cfg):
         self.__SPS_nickname_map.append(("WW" ,"F"))
         self.__SPS_nickname_map.append(("SO" ,"G"))
         self.__SPS_nickname_map.append(("DT" ,"H"))
+        # additional systemparts from configuration, letter 'S' is used for special commands
+        mapped_nicknames = [nickname for (nickname, cmd_letter) in self.__SPS_nickname_map]
+        free_letters = [letter for letter in "IJKLMNOPQRTUVWXYZ"]
+        for nickname in self.__heater_data.systempart_nicknames():
+            if not nickname in mapped_nicknames and len(free_letters) > 0:
+                self.__SPS_nickname_map.append((nickname, free_letters.pop(0)))
 
     def __SPS_special_cmd_mapping(self):
         """
@@ -49,6 +49,43 @@
 #                               setall_values2default() and showall_values() added.
 #                               defaultvalue() updated.
 #                               getall_nicknames(), getfiltered_sorted_items_with_values() added.
+# Ver:0.4.1  / 2026-10-18       black_sequences() added, read from <data_interface>.
+# Ver:0.4.2  / 2026-10-18       deviceaddresses(), msgid_blacklist() and msgid_mapping() added,
+#                                read from <data_interface>.
+# Ver:0.4.3  / 2026-10-18       handle(), set() and get() added for value-access without
+#                                name-resolving, update() and values() are using them.
+# Ver:0.5    / 2026-10-18       systempart-data stored in 'csyspart_schema' (static data from
+#                                configuration) and 'csyspart_values' (values in array('d') and
+#                                array('q') with value-types and valid-flags),
+#                                per-syspart attributes removed.
+# Ver:0.5.1  / 2026-10-18       version() and changes_since() added, version-number of the last
+#                                value-change for every item.
+# Ver:0.5.2  / 2026-10-18       snapshot() and snapshot_all() added, consistent copies of values
+#                                read without blocking the writer (seqlock), write-sequence set
+#                                with set()/update() and begin_write()/end_write().
+# Ver:0.5.3  / 2026-10-18       subscribe() and unsubscribe() added, changed values delivered
+#                                to callbacks or queues of subscribers ('csubscription').
+# Ver:0.5.4  / 2026-10-18       config_root() added, xml-configfile parsed once per process.
+#                                read_db_config() loads the compiled configuration from
+#                                cache-file '<configfile>.cache' if path and mtime are unchanged.
+# Ver:0.5.5  / 2026-10-18       optional history of numeric values in ring-buffers ('csyspart_history',
+#                                numpy required), size per systempart from tag:<history_samples>.
+#                                history(), history_statistics(), history_rate() and
+#                                history_time_above() added.
+# Ver:0.5.6  / 2026-10-18       freshness-timestamp of every value added ('csyspart_values.timestamps').
+#                                save_state() and load_state() for the snapshot of all values in a
+#                                state-file, written periodically with start_state_saving().
+#                                optional tag:<state_snapshot> in configuration.
+# Ver:0.5.7  / 2026-10-18       systemparts registered by their configured shortname, any number
+#                                of heating-circuits (HK1..HKn), DHW-systems and solar-circuits.
+#                                systempart_nicknames() and IsSystempart() added.
+# Ver:0.5.8  / 2026-10-18       writers serialized by a write-lock (set() and begin_write()/end_write()),
+#                                reader of snapshots sleeps shortly after some retries.
+# Ver:0.5.9  / 2026-10-18       compiled configuration stored as json (no pickle) in cache-file
+#                                './var/cache/<configfile>.<hash>.cache' with the configuration-
+#                                attributes only, values created again from the defaults.
+# Ver:0.5.10 / 2026-10-18       load_state() loads only valid values not older than max. age,
+#                                optional tag:<max_age_seconds> in <state_snapshot>.
 #################################################################
 
 import xml.etree.ElementTree as ET
@@ -56,10 +93,372 @@ import sys
 import os
 import tempfile
 import _thread
+import time
+import array
+import queue
+import threading
+import pickle
+import json
+import hashlib
+import collections
 import ht_utils
 import logging
 import ht_const
 
+try:
+    import numpy
+except ImportError:
+    # numpy is optional, used only for the history of values
+    numpy = None
+
+# value-types of 'csyspart_values.types'
+_FLOAT  = 0
+_INT    = 1
+_OBJECT = 2
+# range of int-values stored in array('q')
+_INT_MIN = -2 ** 63
+_INT_MAX = 2 ** 63 - 1
+
+# compiled configuration (see: cdata.read_db_config()), must be changed with the
+#  data-structure of 'cdata' and 'csyspart_schema'
+_CONFIGCACHE_VERSION = 6
+# attributes of 'cdata' stored in compiled configuration, all other attributes are runtime-data
+_CONFIGCACHE_ATTRIBUTES = ("_loglevel", "_fileonly", "_pathonly", "_logfilepath",
+                           "_cdata__nickname", "_cdata__HKcount", "_cdata__accesscontext", "_cdata__syspartnames",
+                           "_cdata__unmixedHK", "_cdata__systemparts", "_cdata__LoadpumpWW",
+                           "_cdata__state_filename", "_cdata__state_interval", "_cdata__state_maxage",
+                           "_cdata__dbname_sqlite", "_cdata__sql_enable", "_sqlite_autoerase_afterSeconds",
+                           "_cdata__dbname_rrdtool", "_cdata__rrdtool_enable", "_cdata__rrdtool_stepseconds",
+                           "_cdata__rrdtool_starttime_utc", "_rrdtool_autocreate_draw_minutes",
+                           "_cdata__dataif_commtype", "_cdata__dataif_prototype", "_cdata__dataif_param_serialdevice",
+                           "_cdata__dataif_param_baudrate", "_cdata__dataif_param_config",
+                           "_cdata__dataif_param_proxy_cfg_file", "_cdata__dataif_param_testfilepath",
+                           "_cdata__black_sequences", "_cdata__deviceaddresses", "_cdata__msgid_blacklist",
+                           "_cdata__msgid_mapping")
+# directory of the cache-files, used only if './var' is available
+_CONFIGCACHE_PATH = os.path.join(".", "var", "cache")
+# format-version of the state-file (see: cdata.save_state())
+_STATEFILE_VERSION = 1
+# default max. age (seconds) of the values loaded from state-file
+_STATE_MAXAGE = 3600
+# in-process caches of configuration-files {abspath: (configkey, content)}
+_config_roots = {}
+_compiled_configs = {}
+
+
+def _boottime():
+    """
+    returns the system boot-time (seconds since epoch).
+    """
+    return time.time() - time.monotonic()
+
+
+def _configkey(xmlconfigpathname):
+    """
+    returns the key (abspath, mtime, size) of the configuration-file.
+    """
+    status = os.stat(xmlconfigpathname)
+    return (os.path.abspath(xmlconfigpathname), status.st_mtime_ns, status.st_size)
+
+
+def _configcache_filename(abspath):
+    """
+    returns the cache-file of the compiled configuration for configuration-file 'abspath'.
+    """
+    return os.path.join(_CONFIGCACHE_PATH, "{0}.{1}.cache".format(os.path.basename(abspath),
+                                                                   hashlib.sha1(abspath.encode()).hexdigest()[:12]))
+
+
+def config_root(xmlconfigpathname):
+    """
+    returns the root-element of the parsed xml-configfile.
+     The file is parsed only once per process and modification, all callers
+     get the same element-tree which must not be modified.
+    """
+    configkey = _configkey(xmlconfigpathname)
+    (cachedkey, root) = _config_roots.get(configkey[0], (None, None))
+    if cachedkey != configkey:
+        root = ET.parse(xmlconfigpathname).getroot()
+        _config_roots[configkey[0]] = (configkey, root)
+    return root
+
+
+class csyspart_schema(object):
+    """
+    Class: csyspart_schema.
+     Static data of one systempart read from configuration. The item-attributes
+     are lists with the item-index from 'itemindex' {itemname: index}.
+    """
+    __slots__ = ("hwtype", "itemindex", "logitems", "displaynames", "units",
+                 "maxvalues", "defaults", "accessnames", "minvalues", "historysamples")
+
+    def __init__(self):
+        self.hwtype = ""
+        self.historysamples = 0
+        self.itemindex = {}
+        self.logitems = []
+        self.displaynames = []
+        self.units = []
+        self.maxvalues = []
+        self.defaults = []
+        self.accessnames = []
+        self.minvalues = []
+
+    def append(self, itemname, logitem):
+        """
+        adds the item 'itemname' and returns its index.
+        """
+        index = len(self.logitems)
+        self.itemindex[itemname] = index
+        self.logitems.append(logitem)
+        for attribute in (self.displaynames, self.units, self.maxvalues,
+                          self.defaults, self.accessnames, self.minvalues):
+            attribute.append(None)
+        return index
+
+#--- class csyspart_schema end ---#
+################################################
+
+
+class csyspart_values(object):
+    """
+    Class: csyspart_values.
+     Values of one systempart with the item-index of 'csyspart_schema'.
+      values    := array('d') with the float-values
+      intvalues := array('q') with the int-values
+      types     := value-type of every item (_FLOAT, _INT or _OBJECT)
+      objects   := {index: value} for other values (like strings)
+      valid     := 1 for every item updated since start, else 0 (default-value)
+      updated   := True if any item is updated since last 'IsSyspartUpdate()'
+      versions  := array('Q') with the version-number of the last value-change of every item
+      version   := highest version-number in 'versions'
+      timestamps:= array('d') with the time of the last update of every item (0.0 := never)
+     'floatindexes' := (typechanges, [index, ...]) are the indexes of float-values, created
+      again if 'typechanges' (counter of value-type changes) is changed.
+    """
+    __slots__ = ("values", "intvalues", "types", "objects", "valid", "updated", "versions", "version",
+                 "timestamps", "typechanges", "floatindexes")
+
+    def __init__(self):
+        self.values = array.array('d')
+        self.intvalues = array.array('q')
+        self.types = bytearray()
+        self.objects = {}
+        self.valid = bytearray()
+        self.updated = False
+        self.versions = array.array('Q')
+        self.version = 0
+        self.timestamps = array.array('d')
+        self.typechanges = 0
+        self.floatindexes = (-1, [])
+
+    def append(self, value):
+        """
+        adds a not valid item with 'value'.
+        """
+        self.values.append(0.0)
+        self.intvalues.append(0)
+        self.types.append(_INT)
+        self.valid.append(0)
+        self.versions.append(0)
+        self.timestamps.append(0.0)
+        self.typechanges += 1
+        self.put(len(self.types) - 1, value)
+
+    def put(self, index, value):
+        """
+        stores 'value' at 'index' with its value-type.
+         returns True if value or value-type is changed, else False.
+        """
+        oldtype = self.types[index]
+        if type(value) is int and _INT_MIN <= value <= _INT_MAX:
+            if oldtype == _INT and self.intvalues[index] == value:
+                return False
+            valuetype = _INT
+            self.intvalues[index] = value
+        elif type(value) is float:
+            if oldtype == _FLOAT and self.values[index] == value:
+                return False
+            valuetype = _FLOAT
+            self.values[index] = value
+        else:
+            if oldtype == _OBJECT and self.objects[index] == value:
+                return False
+            valuetype = _OBJECT
+            self.objects[index] = value
+        if valuetype != oldtype:
+            if oldtype == _OBJECT:
+                del self.objects[index]
+            self.types[index] = valuetype
+            self.typechanges += 1
+        return True
+
+    def get(self, index):
+        """
+        returns the value at 'index' with its value-type.
+        """
+        valuetype = self.types[index]
+        if valuetype == _INT:
+            return self.intvalues[index]
+        elif valuetype == _FLOAT:
+            return self.values[index]
+        return self.objects[index]
+
+    def tolist(self):
+        """
+        returns all values as list.
+        """
+        values = self.intvalues.tolist()
+        (typechanges, floatindexes) = self.floatindexes
+        if typechanges != self.typechanges:
+            # counter read before the types, so changes while reading are detected with the next call
+            typechanges = self.typechanges
+            floatindexes = [index for (index, valuetype) in enumerate(self.types) if valuetype == _FLOAT]
+            self.floatindexes = (typechanges, floatindexes)
+        floatvalues = self.values
+        for index in floatindexes:
+            values[index] = floatvalues[index]
+        for (index, value) in self.objects.items():
+            values[index] = value
+        return values
+
+#--- class csyspart_values end ---#
+################################################
+
+
+class csyspart_history(object):
+    """
+    Class: csyspart_history.
+     History of the numeric values of one systempart, every item has its own
+     ring-buffer with the last 'samples' values and timestamps (numpy-arrays).
+      positions := next write-position of every item
+      counts    := number of stored samples of every item (max. 'samples')
+    """
+    __slots__ = ("samples", "timestamps", "values", "positions", "counts")
+
+    def __init__(self, items, samples):
+        self.samples = samples
+        self.timestamps = numpy.zeros((items, samples))
+        self.values = numpy.zeros((items, samples))
+        self.positions = [0] * items
+        self.counts = [0] * items
+
+    def append(self, index, timestamp, value):
+        """
+        stores 'value' with 'timestamp' in the ring-buffer of item 'index'.
+         Items added after creation of the history are ignored.
+        """
+        if index < len(self.positions):
+            position = self.positions[index]
+            self.timestamps[index, position] = timestamp
+            self.values[index, position] = value
+            self.positions[index] = (position + 1) % self.samples
+            if self.counts[index] < self.samples:
+                self.counts[index] += 1
+
+    def series(self, index, since=None):
+        """
+        returns the tuple (timestamps, values) of item 'index' as copied numpy-arrays,
+         oldest sample first and only samples with timestamp >= 'since' if set.
+        """
+        if index >= len(self.positions):
+            return (numpy.zeros(0), numpy.zeros(0))
+        count = self.counts[index]
+        if count < self.samples:
+            timestamps = self.timestamps[index, :count].copy()
+            values = self.values[index, :count].copy()
+        else:
+            position = self.positions[index]
+            timestamps = numpy.roll(self.timestamps[index], -position)
+            values = numpy.roll(self.values[index], -position)
+        if since != None:
+            first = numpy.searchsorted(timestamps, since)
+            (timestamps, values) = (timestamps[first:], values[first:])
+        return (timestamps, values)
+
+#--- class csyspart_history end ---#
+################################################
+
+
+class csyspart_snapshot(collections.namedtuple("csyspart_snapshot",
+                                                ["nickname", "version", "logitems", "values", "valid",
+                                                 "timestamps"])):
+    """
+    Class: csyspart_snapshot.
+     Immutable copy of the values of one systempart (see: cdata.snapshot()).
+      version  := version-number of cdata at snapshot-time (see: cdata.version())
+      logitems := tuple of logitem-names
+      values   := tuple of values
+      valid    := bytes with the valid-flag of every item
+      timestamps := tuple with the time of the last update of every item (0.0 := never)
+    """
+    __slots__ = ()
+
+    def value(self, logitem):
+        """
+        returns the value of 'logitem', None if not available.
+        """
+        itemname = logitem.replace("_", "").lower()
+        for (name, value) in zip(self.logitems, self.values):
+            if name.replace("_", "").lower() == itemname:
+                return value
+        return None
+
+    def items(self):
+        """
+        returns the list of (logitem, value).
+        """
+        return list(zip(self.logitems, self.values))
+
+#--- class csyspart_snapshot end ---#
+################################################
+
+
+class csubscription(object):
+    """
+    Class: csubscription.
+     Subscriber of changed values (see: cdata.subscribe()), every subscriber has
+     its own version-number (cursor) of the already delivered changes.
+     The changes [(nickname, logitem, value), ...] are delivered to 'callback'
+     or, without callback, to the queue read with 'get()'. Changes are collected
+     and delivered at most every 'interval' seconds.
+    """
+    __slots__ = ("nicknames", "itemnames", "callback", "interval", "version", "nexttime", "_queue")
+
+    def __init__(self, version, callback=None, nicknames=None, logitems=None, interval=0.0):
+        self.nicknames = None if nicknames == None else list(nicknames)
+        self.itemnames = None if logitems == None else frozenset(logitem.replace("_", "").lower()
+                                                                 for logitem in logitems)
+        self.callback = callback
+        self.interval = float(interval)
+        self.version = version
+        self.nexttime = 0.0
+        self._queue = queue.Queue() if callback == None else None
+
+    def deliver(self, changes):
+        """
+        delivers 'changes' to the callback or queue.
+        """
+        if self.callback != None:
+            self.callback(changes)
+        else:
+            self._queue.put(changes)
+
+    def get(self, timeout=None):
+        """
+        returns the next delivered changes, waits max. 'timeout' seconds.
+         returns None on timeout or if the subscriber has a callback.
+        """
+        if self._queue == None:
+            return None
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+#--- class csubscription end ---#
+################################################
+
 
 class cdata(ht_utils.clog):
     """
@@ -71,123 +470,42 @@ class cdata(ht_utils.clog):
         """
         ht_utils.clog.__init__(self)
         self.__nickname = {}
-        self.__logitemHG = {}
         self.__HKcount = 1
-        self.__logitemHK1 = {}
-        self.__logitemHK2 = {}
-        self.__logitemHK3 = {}
-        self.__logitemHK4 = {}
-        self.__logitemWW = {}
-        self.__logitemSO = {}
-        self.__logitemDT = {}
-        self.__logitemNN = {}
-        self.__valuesHG = []
-        self.__valuesHK1 = []
-        self.__valuesHK2 = []
-        self.__valuesHK3 = []
-        self.__valuesHK4 = []
-        self.__valuesWW = []
-        self.__valuesSO = []
-        self.__valuesDT = []
-        self.__valuesNN = []
-        self.__UpdateHG = False
-        self.__UpdateHK1 = False
-        self.__UpdateHK2 = False
-        self.__UpdateHK3 = False
-        self.__UpdateHK4 = False
-        self.__UpdateWW = False
-        self.__UpdateSO = False
-        self.__UpdateDT = False
-        self.__UpdateNN = False
-        # dir's for hardwaretype to be displayed
-        self.__hwtypeHG = ""
-        self.__hwtypeHK1 = ""
-        self.__hwtypeHK2 = ""
-        self.__hwtypeHK3 = ""
-        self.__hwtypeHK4 = ""
-        self.__hwtypeWW = ""
-        self.__hwtypeSO = ""
-        self.__hwtypeDT = ""
-        self.__hwtypeNN = ""
-        self.__logitemMapHG = {}
-        self.__logitemMapHK1 = {}
-        self.__logitemMapHK2 = {}
-        self.__logitemMapHK3 = {}
-        self.__logitemMapHK4 = {}
-        self.__logitemMapWW = {}
-        self.__logitemMapSO = {}
-        self.__logitemMapDT = {}
-        self.__logitemMapNN = {}
-        # dir's for Logitem Display-Names
-        self.__logitemDisplaynameHG = {}
-        self.__logitemDisplaynameHK1 = {}
-        self.__logitemDisplaynameHK2 = {}
-        self.__logitemDisplaynameHK3 = {}
-        self.__logitemDisplaynameHK4 = {}
-        self.__logitemDisplaynameWW = {}
-        self.__logitemDisplaynameSO = {}
-        self.__logitemDisplaynameDT = {}
-        self.__logitemDisplaynameNN = {}
-        # dir's for Logitem: 'unit' to be displayed
-        self.__logitemUnitHG = {}
-        self.__logitemUnitHK1 = {}
-        self.__logitemUnitHK2 = {}
-        self.__logitemUnitHK3 = {}
-        self.__logitemUnitHK4 = {}
-        self.__logitemUnitWW = {}
-        self.__logitemUnitSO = {}
-        self.__logitemUnitDT = {}
-        self.__logitemUnitNN = {}
-        # dir's for Logitem: 'maxvalue'
-        self.__maxvalueHG = {}
-        self.__maxvalueHK1 = {}
-        self.__maxvalueHK2 = {}
-        self.__maxvalueHK3 = {}
-        self.__maxvalueHK4 = {}
-        self.__maxvalueWW = {}
-        self.__maxvalueSO = {}
-        self.__maxvalueDT = {}
-        self.__maxvalueNN = {}
-        # dir's for Logitem: 'defaultvalue'
-        self.__defaultvalueHG = {}
-        self.__defaultvalueHK1 = {}
-        self.__defaultvalueHK2 = {}
-        self.__defaultvalueHK3 = {}
-        self.__defaultvalueHK4 = {}
-        self.__defaultvalueWW = {}
-        self.__defaultvalueSO = {}
-        self.__defaultvalueDT = {}
-        self.__defaultvalueNN = {}
-        # dir's for Logitem: 'accessname'
-        self.__accessnameHG = {}
-        self.__accessnameHK1 = {}
-        self.__accessnameHK2 = {}
-        self.__accessnameHK3 = {}
-        self.__accessnameHK4 = {}
-        self.__accessnameWW = {}
-        self.__accessnameSO = {}
-        self.__accessnameDT = {}
-        self.__accessnameNN = {}
-        # dir's for Logitem: 'minvalue'
-        self.__minvalueHG = {}
-        self.__minvalueHK1 = {}
-        self.__minvalueHK2 = {}
-        self.__minvalueHK3 = {}
-        self.__minvalueHK4 = {}
-        self.__minvalueWW = {}
-        self.__minvalueSO = {}
-        self.__minvalueDT = {}
-        self.__minvalueNN = {}
         # other required values
         self.__accesscontext = {}
         self.__syspartnames = []
-        self.__unmixedHK1_HK4 = {}
+        self.__unmixedHK = {}
+        # registered systemparts {kind: [nickname, ...]}, kind is the nickname without number
+        self.__systemparts = {}
         self.__LoadpumpWW = False
         self.__SecondBufferSO = False
         self.__SecondCollect_ValueSO = False
         self.__ReloadBuffer_OptionIJ_SO = False
         self.__TempSensor_HydraulicSwitch = 0
-        self.__data = {}
+        # systempart-data {nickname: csyspart_schema} and {nickname: csyspart_values}
+        self.__schemas = {}
+        self.__stores = {}
+        # version-number of the last value-change
+        self.__version = 0
+        # write-sequence (seqlock), odd while values are written
+        self.__sequence = 0
+        self.__write_depth = 0
+        self.__writer_ident = None
+        # serializes writers, keeps the write-sequence even/odd with more writing threads
+        self.__write_lock = threading.RLock()
+        # subscribers of changed values and notify-thread
+        self.__subscriptions = []
+        self.__changed = threading.Event()
+        self.__notify_thread = None
+        # history of numeric values {nickname: csyspart_history}
+        self.__histories = {}
+        # time of the values written with begin_write()/end_write()
+        self.__write_time = 0.0
+        # state-file with the snapshot of all values
+        self.__state_filename = ""
+        self.__state_interval = 0
+        self.__state_maxage = _STATE_MAXAGE
+        self.__state_saving = None
         self.__thread_lock = _thread.allocate_lock()
         self.__newdata_available = False
         self.__configfilename = ""
@@ -213,6 +531,12 @@ class cdata(ht_utils.clog):
         self.__controller_type_nr = ht_const.CONTROLLER_TYPE_NR_Fxyz
         self.__bus_type = "---"
         self.__busmodulAdr = ""
+        # additional black-sequences for bus-decoding from configuration
+        self.__black_sequences = []
+        # additional address- and msgID-filters for bus-decoding from configuration
+        self.__deviceaddresses = []
+        self.__msgid_blacklist = {}
+        self.__msgid_mapping = {}
 
 
     def setlogger(self, logger):
@@ -237,18 +561,16 @@ class cdata(ht_utils.clog):
             raise EnvironmentError(errorstr)
         return rtnvalue
 
-    def read_db_config(self, xmlconfigpathname, logger=None):
+    def read_db_config(self, xmlconfigpathname, logger=None, usecache=True):
         """
         reading xml-configfile and setup datastructure.
             The 'shortname' from config-file is used as main-key 'nickname'
             data-structur:
-            {nickname:[{itemname:arrayindex},[value1,value2,...],Update-Flag,{itemname:logitem},
-                                                                {itemname:displayname},
-                                                                {itemname:unit},
-                                                                {itemname:maxvalue},
-                                                                {itemname:defaultvalue},
-                                                                {itemname:minvalue},
-                                                                hardwaretype]}
+             {nickname: csyspart_schema} static data from configuration
+             {nickname: csyspart_values} values
+            With 'usecache' the compiled configuration is loaded from memory or
+             cache-file in './var/cache' if path and mtime of configfile are unchanged,
+             else it is stored there after parsing (only on first call of that instance).
         """
         # init/setup logging-file if not already forced from external call
         if self._logging == None:
@@ -256,23 +578,21 @@ class cdata(ht_utils.clog):
                 self._logging = self.create_mylogger()
             else:
                 self._logging = logger
+        usecache = usecache and len(self.__schemas) == 0
         try:
             self.__configfilename = xmlconfigpathname
-            self.__tree = ET.parse(xmlconfigpathname)
+            configkey = _configkey(xmlconfigpathname)
+            if usecache and self.__load_compiled_config(configkey):
+                self.__configfilename = xmlconfigpathname
+                self.__create_histories()
+                return
+            self.__root = config_root(xmlconfigpathname)
         except (NameError, EnvironmentError) as e:
             errorstr = "data.read_db_config();Error;{0} on file:'{1}'".format(e.args[0], xmlconfigpathname)
             self._logging.critical(errorstr)
             print(errorstr)
             raise
         else:
-            try:
-                self.__root = self.__tree.getroot()
-            except:
-                errorstr = "data.read_db_config();Error on getroot()"
-                print(errorstr)
-                self._logging.critical(errorstr)
-                raise
-
             try:
                 #  find sql_db-entries
                 self.__dbname_sqlite = self.__root.find('dbname_sqlite').text
@@ -366,6 +686,25 @@ class cdata(ht_utils.clog):
 
                         if param.attrib["name"].upper()[0:3] in ("SOC"):
                             self.__dataif_param_proxy_cfg_file = str(param.find('proxy_config_file').text)
+
+                    # optional black-sequences as hex-strings, like: '09 00 89 00'
+                    for black_sequences in data_if.findall('black_sequences'):
+                        for sequence in black_sequences.findall('sequence'):
+                            self.black_sequences(list(bytes.fromhex(sequence.text)))
+
+                    # optional device-addresses and msgID-filters, like:
+                    #  <address>0x1c</address> / <device address='0x10'>10 11 12</device>
+                    for deviceaddresses in data_if.findall('deviceaddresses'):
+                        for address in deviceaddresses.findall('address'):
+                            self.deviceaddresses(int(address.text, 0))
+                    for msgid_blacklist in data_if.findall('msgid_blacklist'):
+                        for device in msgid_blacklist.findall('device'):
+                            self.msgid_blacklist(int(device.get('address'), 0),
+                                                 [int(msgid) for msgid in device.text.split()])
+                    for msgid_mapping in data_if.findall('msgid_mapping'):
+                        for device in msgid_mapping.findall('device'):
+                            self.msgid_mapping(int(device.get('address'), 0),
+                                               [int(msgid) for msgid in device.text.split()])
             except:
                 errorstr = "data.read_db_config();Error on data_interface parameter"
                 print(errorstr)
@@ -390,6 +729,19 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise
 
+            try:
+                #  find optional state_snapshot -entries
+                for state_snapshot in self.__root.findall('state_snapshot'):
+                    self.__state_filename = state_snapshot.find('filename').text
+                    self.__state_interval = max(1, int(state_snapshot.find('interval_seconds').text))
+                    if state_snapshot.find('max_age_seconds') != None:
+                        self.__state_maxage = max(1, int(state_snapshot.find('max_age_seconds').text))
+            except:
+                errorstr = "data.read_db_config();Error on state_snapshot parameter"
+                print(errorstr)
+                self._logging.critical(errorstr)
+                raise
+
             try:
                 #  find amount of heizkreise -entries
                 self.__HKcount = int(self.__root.find('anzahl_heizkreise').text)
@@ -399,11 +751,6 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise
 
-            if self.__HKcount > 4 or self.__HKcount < 1:
-                errorstr = "data.read_db_config();Error;amount of:'anzahl_heizkreise' out of range (1...4)"
-                self._logging.critical(errorstr)
-                raise IndexError(errorstr)
-
             try:
                 syspart = ""
                 for syspart in self.__root.findall('systempart'):
@@ -413,11 +760,11 @@ class cdata(ht_utils.clog):
                     hardwaretype = ""
                     for shortname in syspart.findall('shortname'):
                         shortname = shortname.attrib["name"].upper()
-                        if shortname in ("HK1", "HK2", "HK3", "HK4"):
+                        if shortname.rstrip("0123456789") == "HK":
                             if syspart.find('unmixed').text.upper() in ('TRUE'):
-                                self.__unmixedHK1_HK4.update({shortname: True})
+                                self.__unmixedHK.update({shortname: True})
                             else:
-                                self.__unmixedHK1_HK4.update({shortname: False})
+                                self.__unmixedHK.update({shortname: False})
 
                         try:
                             if shortname in ("WW"):
@@ -429,9 +776,15 @@ class cdata(ht_utils.clog):
                             print(errorstr)
 
                     hardwaretype = syspart.find('hardwaretype').text
+                    # optional number of samples in history of every item
+                    try:
+                        historysamples = max(0, int(syspart.find('history_samples').text))
+                    except (AttributeError, TypeError, ValueError):
+                        historysamples = 0
 
                     # set nicknames
                     self._setnickname(shortname, syspartname)
+                    self.__schemas[shortname].historysamples = historysamples
                     logitem = ""
                     try:
                         for logitem in syspart.findall('logitem'):
@@ -494,6 +847,82 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise
 
+            # at least 4 heating-circuits are possible, more if configured
+            maxHKcount = max(4, len(self.__systemparts.get("HK", [])))
+            if self.__HKcount > maxHKcount or self.__HKcount < 1:
+                errorstr = "data.read_db_config();Error;amount of:'anzahl_heizkreise' out of range (1...{0})".format(maxHKcount)
+                self._logging.critical(errorstr)
+                raise IndexError(errorstr)
+
+            if usecache:
+                self.__save_compiled_config(configkey)
+            self.__create_histories()
+
+    def __load_compiled_config(self, configkey):
+        """
+        loads the compiled configuration of 'configkey' from memory or cache-file.
+         The values of all items are created again with their default-values.
+         returns True if loaded, else False.
+        """
+        try:
+            (cachedkey, compiled) = _compiled_configs.get(configkey[0], (None, None))
+            if cachedkey != configkey:
+                with open(_configcache_filename(configkey[0]), "r") as cachefile:
+                    compiled = cachefile.read()
+                if tuple(json.loads(compiled)[0]) != (_CONFIGCACHE_VERSION,) + configkey:
+                    return False
+                _compiled_configs[configkey[0]] = (configkey, compiled)
+            (cachedkey, attributes, compiledschemas) = json.loads(compiled)
+            # tuples and int-keys are not available in json
+            attributes["_cdata__accesscontext"] = dict((name, tuple(context))
+                                                       for (name, context) in attributes["_cdata__accesscontext"].items())
+            for name in ("_cdata__msgid_blacklist", "_cdata__msgid_mapping"):
+                attributes[name] = dict((int(address), msgids) for (address, msgids) in attributes[name].items())
+            schemas = {}
+            stores = {}
+            for (nickname, slots) in compiledschemas:
+                schemas[nickname] = csyspart_schema()
+                stores[nickname] = csyspart_values()
+                for (name, value) in slots.items():
+                    setattr(schemas[nickname], name, value)
+                for default in schemas[nickname].defaults:
+                    stores[nickname].append(default)
+                stores[nickname].updated = False
+        except Exception as e:
+            errorstr = "data.read_db_config();Warning;compiled configuration not loaded:{0}".format(e)
+            self._logging.debug(errorstr)
+            _compiled_configs.pop(configkey[0], None)
+            return False
+        self.__dict__.update(attributes)
+        self.__schemas.update(schemas)
+        self.__stores.update(stores)
+        self.__newdata_available = True
+        return True
+
+    def __save_compiled_config(self, configkey):
+        """
+        stores the compiled configuration in memory and cache-file.
+         Errors are logged only, the parsed configuration is used anyway.
+        """
+        try:
+            attributes = dict((name, self.__dict__[name]) for name in _CONFIGCACHE_ATTRIBUTES
+                              if name in self.__dict__)
+            schemas = [(nickname, dict((name, getattr(schema, name)) for name in csyspart_schema.__slots__))
+                       for (nickname, schema) in self.__schemas.items()]
+            compiled = json.dumps(((_CONFIGCACHE_VERSION,) + configkey, attributes, schemas))
+            _compiled_configs[configkey[0]] = (configkey, compiled)
+            if os.path.isdir(os.path.dirname(_CONFIGCACHE_PATH)):
+                os.makedirs(_CONFIGCACHE_PATH, exist_ok=True)
+                cachefilename = _configcache_filename(configkey[0])
+                # written to temporary file first, other processes are reading only complete files
+                with open(cachefilename + ".tmp", "w") as cachefile:
+                    cachefile.write(compiled)
+                os.replace(cachefilename + ".tmp", cachefilename)
+        except Exception as e:
+            _compiled_configs.pop(configkey[0], None)
+            errorstr = "data.read_db_config();Warning;compiled configuration not stored:{0}".format(e)
+            self._logging.warning(errorstr)
+
     def configfilename(self, xmlconfigpathname=""):
         """
         return and setup of used xml-config filename.
@@ -571,9 +1000,9 @@ class cdata(ht_utils.clog):
         """
         save nickname attached to longname. Additional the assignment for
         'Systempart' to the attached value-arrays are done here.
-         Values are set in configuration-file.
+         Values are set in configuration-file, every shortname is an own systempart.
         """
-        shortname = shortname.upper()[0:3]
+        shortname = shortname.upper()
         try:
             if not len(shortname):
                 errorstr = "data._setnickname();Error; shortname undefined')"
@@ -584,126 +1013,44 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             self.__nickname.update({shortname: longname})
-            if "HG" in shortname:
-                self.__data.update({"HG": [self.__logitemHG,
-                                          self.__valuesHG,
-                                          self.__UpdateHG,
-                                          self.__logitemMapHG,
-                                          self.__logitemDisplaynameHG,
-                                          self.__logitemUnitHG,
-                                          self.__maxvalueHG,
-                                          self.__defaultvalueHG,
-                                          self.__accessnameHG,
-                                          self.__minvalueHG,
-                                          self.__hwtypeHG]})
-            elif "HK1" in shortname:
-                self.__data.update({"HK1": [self.__logitemHK1,
-                                          self.__valuesHK1,
-                                          self.__UpdateHK1,
-                                          self.__logitemMapHK1,
-                                          self.__logitemDisplaynameHK1,
-                                          self.__logitemUnitHK1,
-                                          self.__maxvalueHK1,
-                                          self.__defaultvalueHK1,
-                                          self.__accessnameHK1,
-                                          self.__minvalueHK1,
-                                          self.__hwtypeHK1]})
-            elif "HK2" in shortname:
-                self.__data.update({"HK2": [self.__logitemHK2,
-                                          self.__valuesHK2,
-                                          self.__UpdateHK2,
-                                          self.__logitemMapHK2,
-                                          self.__logitemDisplaynameHK2,
-                                          self.__logitemUnitHK2,
-                                          self.__maxvalueHK2,
-                                          self.__defaultvalueHK2,
-                                          self.__accessnameHK2,
-                                          self.__minvalueHK2,
-                                          self.__hwtypeHK2]})
-
-            elif "HK3" in shortname:
-                self.__data.update({"HK3": [self.__logitemHK3,
-                                          self.__valuesHK3,
-                                          self.__UpdateHK3,
-                                          self.__logitemMapHK3,
-                                          self.__logitemDisplaynameHK3,
-                                          self.__logitemUnitHK3,
-                                          self.__maxvalueHK3,
-                                          self.__defaultvalueHK3,
-                                          self.__accessnameHK3,
-                                          self.__minvalueHK3,
-                                          self.__hwtypeHK3]})
-
-            elif "HK4" in shortname:
-                self.__data.update({"HK4": [self.__logitemHK4,
-                                          self.__valuesHK4,
-                                          self.__UpdateHK4,
-                                          self.__logitemMapHK4,
-                                          self.__logitemDisplaynameHK4,
-                                          self.__logitemUnitHK4,
-                                          self.__maxvalueHK4,
-                                          self.__defaultvalueHK4,
-                                          self.__accessnameHK4,
-                                          self.__minvalueHK4,
-                                          self.__hwtypeHK4]})
-
-            elif "WW" in shortname:
-                self.__data.update({"WW": [self.__logitemWW,
-                                          self.__valuesWW,
-                                          self.__UpdateWW,
-                                          self.__logitemMapWW,
-                                          self.__logitemDisplaynameWW,
-                                          self.__logitemUnitWW,
-                                          self.__maxvalueWW,
-                                          self.__defaultvalueWW,
-                                          self.__accessnameWW,
-                                          self.__minvalueWW,
-                                          self.__hwtypeWW]})
-
-            elif "SO" in shortname:
-                self.__data.update({"SO": [self.__logitemSO,
-                                          self.__valuesSO,
-                                          self.__UpdateSO,
-                                          self.__logitemMapSO,
-                                          self.__logitemDisplaynameSO,
-                                          self.__logitemUnitSO,
-                                          self.__maxvalueSO,
-                                          self.__defaultvalueSO,
-                                          self.__accessnameSO,
-                                          self.__minvalueSO,
-                                          self.__hwtypeSO]})
-
-            elif "DT" in shortname:
-                self.__data.update({"DT": [self.__logitemDT,
-                                          self.__valuesDT,
-                                          self.__UpdateDT,
-                                          self.__logitemMapDT,
-                                          self.__logitemDisplaynameDT,
-                                          self.__logitemUnitDT,
-                                          self.__maxvalueDT,
-                                          self.__defaultvalueDT,
-                                          self.__accessnameDT,
-                                          self.__minvalueDT,
-                                          self.__hwtypeDT]})
-
-            else:
-                self.__data.update({"NN": [self.__logitemNN,
-                                          self.__valuesNN,
-                                          self.__UpdateNN,
-                                          self.__logitemMapNN,
-                                          self.__logitemDisplaynameNN,
-                                          self.__logitemUnitNN,
-                                          self.__maxvalueNN,
-                                          self.__defaultvalueNN,
-                                          self.__accessnameNN,
-                                          self.__minvalueNN,
-                                          self.__hwtypeNN]})
+            if not shortname in self.__schemas:
+                self.__schemas[shortname] = csyspart_schema()
+                self.__stores[shortname] = csyspart_values()
+                kind = shortname.rstrip("0123456789") or shortname
+                self.__systemparts.setdefault(kind, []).append(shortname)
+            self.__stores[shortname].updated = False
 
         except (NameError, AttributeError) as e:
             errorstr = "data._setnickname();Error;{0}".format(e.args[0])
             print(errorstr)
             self._logging.critical(errorstr)
 
+    def __nickname_key(self, nickname):
+        """
+        returns the registered nickname for 'nickname' (upper- and lower-case is possible),
+         not registered ones are shortened to the first three chars.
+        """
+        nickname = nickname.upper()
+        if nickname in self.__nickname:
+            return nickname
+        return nickname[0:3]
+
+    def systempart_nicknames(self, kind=None):
+        """
+        returns the list of nicknames of the systemparts with 'kind' (nickname without
+         number like: "HK" for heating-circuits "HK1".."HKn") in order of configuration.
+         All nicknames if 'kind' is not set.
+        """
+        if kind == None:
+            return list(self.__nickname.keys())
+        return list(self.__systemparts.get(kind.upper(), []))
+
+    def IsSystempart(self, nickname):
+        """
+        returns True if systempart 'nickname' is configured, else False.
+        """
+        return nickname.upper() in self.__schemas
+
     def getlongname(self, shortname):
         """
         return the 'systempart' longname attached to input:'shortname'.
@@ -712,7 +1059,7 @@ class cdata(ht_utils.clog):
          Undefined 'shortnames' returns: 'None'
         """
         try:
-            return self.__nickname[shortname.upper()[0:3]]
+            return self.__nickname[self.__nickname_key(shortname)]
         except (KeyError, IndexError, AttributeError) as e:
             errorstr = "data.getlongname();Error;longname'{0}' not found".format(e.args[0])
             print(errorstr)
@@ -723,20 +1070,15 @@ class cdata(ht_utils.clog):
         """
         returns sorted list of logitem-names for the nickname.
         """
-        nickname = nickname.upper()[0:3]
-        all_logitem_names = []
-        length = 0
+        nickname = self.__nickname_key(nickname)
         if nickname in self.__nickname:
-            length = len(self.__data[nickname][0])
-            for x in range(0, length):
-                all_logitem_names.append("")
-
-            for (key, value) in self.__data[nickname][0].items():
-                itemname = key
-                if not rtn_internal_itemname:
-                    itemname = self.__data[nickname][3][key]
-                all_logitem_names[int(value)] = itemname
-            return all_logitem_names
+            schema = self.__schemas[nickname]
+            if rtn_internal_itemname:
+                all_logitem_names = [""] * len(schema.itemindex)
+                for (itemname, index) in schema.itemindex.items():
+                    all_logitem_names[index] = itemname
+                return all_logitem_names
+            return list(schema.logitems)
         else:
             errorstr = "getall_sorted_logitem_names();Error;nickname'{0}' not found".format(nickname)
             print(errorstr)
@@ -748,15 +1090,9 @@ class cdata(ht_utils.clog):
         This function returns the sorted tuple-array of items and attached values
          except undefined (out of range) temperaturvalues.
         """
-        nickname = nickname.upper()[0:3]
-        all_logitem_names = self.getall_sorted_logitem_names(nickname)
         rtntuple_array = []
-        defined = True
-        for itemname in all_logitem_names:
+        for (itemname, value) in self.snapshot(nickname).items():
             if not itemname == "hexdump":
-                internal_itemname = itemname.replace("_", "").lower()
-                index = int(self.__data[nickname][0][internal_itemname])
-                value = self.__data[nickname][1][index]
                 if self.Is_Value_defined((itemname, value)):
                     rtntuple_array.append((itemname, value))
         return rtntuple_array
@@ -765,14 +1101,9 @@ class cdata(ht_utils.clog):
         """
         This function returns the sorted tuple-array of items and attached values.
         """
-        nickname = nickname.upper()[0:3]
-        all_logitem_names = self.getall_sorted_logitem_names(nickname)
         rtntuple_array = []
-        for itemname in all_logitem_names:
+        for (itemname, value) in self.snapshot(nickname).items():
             if not itemname == "hexdump":
-                internal_itemname = itemname.replace("_", "").lower()
-                index = int(self.__data[nickname][0][internal_itemname])
-                value = self.__data[nickname][1][index]
                 rtntuple_array.append((itemname, value))
         return rtntuple_array
 
@@ -780,18 +1111,9 @@ class cdata(ht_utils.clog):
         """
         returns sorted list of access-names for the nickname.
         """
-        nickname = nickname.upper()[0:3]
-        all_sorted_access_names = []
-        length = 0
+        nickname = self.__nickname_key(nickname)
         if nickname in self.__nickname:
-            length = len(self.__data[nickname][0])
-            for x in range(0, length):
-                all_sorted_access_names.append("")
-
-            for (key, value) in self.__data[nickname][0].items():
-                accessname = self.__data[nickname][8][key]
-                all_sorted_access_names[int(value)] = accessname
-            return all_sorted_access_names
+            return list(self.__schemas[nickname].accessnames)
         else:
             errorstr = "getall_sorted_accessnames();Error;nickname'{0}' not found".format(nickname)
             print(errorstr)
@@ -810,19 +1132,21 @@ class cdata(ht_utils.clog):
         return self.__nickname
 
     def setall_values2default(self):
-        """ set all default-values for nicknames (without 'DT'). """
+        """ set all default-values for nicknames (without 'DT'), the values are not valid. """
         for nickname in self.__nickname:
             if nickname.upper() in "DT":
                 pass
             else:
-                for (item, value) in self.__data[nickname][0].items():
+                for (item, index) in self.__schemas[nickname].itemindex.items():
                     defaultvalue = self.defaultvalue(nickname, item)
                     self.update(nickname, logitem=item, value=defaultvalue, default=defaultvalue)
+                    self.__stores[nickname].valid[index] = 0
+                    self.__stores[nickname].timestamps[index] = 0.0
 
     def showall_values(self):
         """ printout all values for all nicknames """
         for nickname in self.__nickname:
-            for (item, value) in self.__data[nickname][0].items():
+            for item in self.__schemas[nickname].itemindex:
                 defaultvalue = self.defaultvalue(nickname, item)
                 savedvalue=self.values(nickname, item)
                 print("showall_values(); nickname:{};item:{};value:{};default:{}".format(nickname, item, savedvalue, defaultvalue))
@@ -834,17 +1158,11 @@ class cdata(ht_utils.clog):
          will create it, if not yet available.
          parameter 'logitem' is assigned to 'value' (default:=0)
          data-structur:
-          {nickname:[ {itemname:arrayindex},[value1,value2,...],Update-Flag,{itemname:logitem},
-                                                                        {itemname:displayname},
-                                                                        {itemname:unit},
-                                                                        {itemname:maxvalue},
-                                                                        {itemname:defaultvalue},
-                                                                        {itemname:accessname},
-                                                                        {itemname:minvalue},
-                                                                        hardwaretype]}
+          {nickname: csyspart_schema} static data from configuration
+          {nickname: csyspart_values} values
         """
 
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         itemname = logitem.replace("_", "").lower()
         try:
             if not len(nickname):
@@ -856,46 +1174,46 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
+                schema = self.__schemas[nickname]
+                if itemname in schema.itemindex:
                     # update value, get index first from dir{itemname:index}
-                    index = int(self.__data[nickname][0][itemname])
-                    self.__data[nickname][1][index] = value
-                    # set 'IsSyspartUpdate' true
-                    self.__data[nickname][2] = True
+                    index = schema.itemindex[itemname]
+                    self.set((nickname, index), value)
                     if len(displayname) > 0:
-                        self.__data[nickname][4][itemname] = displayname
+                        schema.displaynames[index] = displayname
                     if len(unit) > 0:
-                        self.__data[nickname][5][itemname] = unit
+                        schema.units[index] = unit
                     if maxvalue != 100.0:
-                        self.__data[nickname][6][itemname] = maxvalue
+                        schema.maxvalues[index] = maxvalue
                     if default != 0.0:
-                        self.__data[nickname][7][itemname] = default
+                        schema.defaults[index] = default
                     if len(accessname) > 0:
-                        self.__data[nickname][8][itemname] = accessname
-                    if minvalue != -1000.0:
-                        self.__data[nickname][9][itemname] = minvalue
-                        
+                        schema.accessnames[index] = accessname
+                    if minvalue != None and minvalue != -1000.0:
+                        schema.minvalues[index] = minvalue
+
                 else:
                     # add new item and value, index is the current array-length
                     # and is set to dir{itemname:index}
-                    index = len(self.__data[nickname][1])
-                    self.__data[nickname][0].update({itemname: index})
-                    self.__data[nickname][1].append(value)
-                    # set internal itemname to external logitem
-                    self.__data[nickname][3].update({itemname: logitem})
+                    self.begin_write()
+                    try:
+                        index = schema.append(itemname, logitem)
+                        self.__stores[nickname].append(value)
+                    finally:
+                        self.end_write()
 
                     if not displayname == None and len(displayname) > 0:
-                        self.__data[nickname][4].update({itemname: displayname})
+                        schema.displaynames[index] = displayname
                     else:
-                        self.__data[nickname][4].update({itemname: ""})
+                        schema.displaynames[index] = ""
 
                     if not unit == None and len(unit) > 0:
-                        self.__data[nickname][5].update({itemname: unit})
+                        schema.units[index] = unit
                     else:
-                        self.__data[nickname][5].update({itemname: ""})
+                        schema.units[index] = ""
 
-                    self.__data[nickname][6].update({itemname: maxvalue})
-                    self.__data[nickname][7].update({itemname: default})
+                    schema.maxvalues[index] = maxvalue
+                    schema.defaults[index] = default
 
                     if len(set_parameter) > 0:
                         cmd_parameter = set_parameter
@@ -911,13 +1229,11 @@ class cdata(ht_utils.clog):
                         accessname = str(nickname).lower() + "_unused_" + str(index)
                         self.__accesscontext.update({accessname: (nickname, logitem, itemname, cmd_parameter)})
 
-                    self.__data[nickname][8].update({itemname: accessname})
-
-                    self.__data[nickname][9].update({itemname: minvalue})
-                       
+                    schema.accessnames[index] = accessname
+                    schema.minvalues[index] = minvalue
 
                 if not hwtype == None and len(hwtype) > 0:
-                    self.__data[nickname][10] = hwtype
+                    schema.hwtype = hwtype
             else:
                 errorstr = "data.update();Error;nickname:'{0}' not found".format(nickname)
                 self._logging.critical(errorstr)
@@ -940,7 +1256,7 @@ class cdata(ht_utils.clog):
         returns all values (array) for 'nickname or value (single one) for
          'nickname' and 'logitem'.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         itemname = logitem.replace("_", "").lower()
         try:
             self.__thread_lock.acquire()
@@ -950,15 +1266,14 @@ class cdata(ht_utils.clog):
                 raise NameError(errorstr)
             if nickname in self.__nickname:
                 if len(itemname):
-                    if itemname in self.__data[nickname][0]:
-                        index = int(self.__data[nickname][0][itemname])
-                        return self.__data[nickname][1][index]
+                    if itemname in self.__schemas[nickname].itemindex:
+                        return self.get((nickname, self.__schemas[nickname].itemindex[itemname]))
                     else:
                         errorstr = "data.values();Error;itemname:'{0}' not found".format(logitem)
                         self._logging.critical(errorstr)
                         raise NameError(errorstr)
                 else:
-                    return self.__data[nickname][1]
+                    return self.__stores[nickname].tolist()
             else:
                 errorstr = "data.values();Error;nickname:'{0}' not found".format(nickname)
                 self._logging.critical(errorstr)
@@ -970,13 +1285,419 @@ class cdata(ht_utils.clog):
         finally:
             self.__thread_lock.release()
 
+    def handle(self, nickname, logitem):
+        """
+        returns the handle of the already created 'logitem' for value-access with
+         set() and get() without resolving nickname and logitem again.
+         handle := (nickname, arrayindex)
+         Undefined 'nickname' or 'logitem' returns: None
+        """
+        nickname = self.__nickname_key(nickname)
+        itemname = logitem.replace("_", "").lower()
+        if nickname in self.__nickname and itemname in self.__schemas[nickname].itemindex:
+            return (nickname, self.__schemas[nickname].itemindex[itemname])
+        return None
+
+    def set(self, handle, value):
+        """
+        sets 'value' of the item with 'handle' (see: handle()), the value is then valid.
+        """
+        if self.__write_depth > 0 and self.__writer_ident == _thread.get_ident():
+            # inside begin_write()/end_write() of this thread, write-lock already owned
+            self.__set(handle, value, self.__write_time)
+        else:
+            with self.__write_lock:
+                self.__writer_ident = _thread.get_ident()
+                self.__sequence += 1
+                self.__set(handle, value, time.time())
+                self.__sequence += 1
+                if self.__subscriptions:
+                    self.__changed.set()
+
+    def __set(self, handle, value, timestamp):
+        (nickname, index) = handle
+        store = self.__stores[nickname]
+        if store.put(index, value):
+            self.__version += 1
+            store.versions[index] = self.__version
+            store.version = self.__version
+        if self.__histories and nickname in self.__histories and type(value) in (int, float):
+            self.__histories[nickname].append(index, timestamp, value)
+        store.valid[index] = 1
+        store.timestamps[index] = timestamp
+        # set 'IsSyspartUpdate' and 'IsAnyUpdate' true
+        store.updated = True
+        self.__newdata_available = True
+
+    def get(self, handle):
+        """
+        returns the value of the item with 'handle' (see: handle()).
+        """
+        (nickname, index) = handle
+        return self.__stores[nickname].get(index)
+
+    def begin_write(self):
+        """
+        starts writing of values belonging together (like all values of one message),
+         snapshots are taken before or after all these values are written.
+         Calls can be nested, each call requires the call of end_write().
+         Other writing threads are waiting until end_write().
+        """
+        self.__write_lock.acquire()
+        if self.__write_depth == 0:
+            self.__writer_ident = _thread.get_ident()
+            self.__sequence += 1
+            self.__write_time = time.time()
+        self.__write_depth += 1
+
+    def end_write(self):
+        """
+        ends writing started with begin_write().
+        """
+        self.__write_depth -= 1
+        if self.__write_depth == 0:
+            self.__sequence += 1
+            if self.__subscriptions:
+                self.__changed.set()
+        self.__write_lock.release()
+
+    def __read_consistent(self, reader):
+        """
+        returns the result of 'reader()' read while no values are written.
+         The reader is repeated if values were written meanwhile, the writer
+         is never blocked. Called from the writing thread it is read immediately.
+        """
+        retries = 0
+        while True:
+            sequence = self.__sequence
+            if sequence & 1 and self.__writer_ident == _thread.get_ident():
+                return reader()
+            if not sequence & 1:
+                result = reader()
+                if self.__sequence == sequence:
+                    return result
+            # let the writer continue, sleep shortly if it is busy
+            retries += 1
+            time.sleep(0 if retries < 4 else 0.0005)
+
+    def snapshot(self, nickname):
+        """
+        returns the consistent copy of all values of systempart 'nickname'
+         as immutable 'csyspart_snapshot'.
+        """
+        nickname = self.__nickname_key(nickname)
+        schema = self.__schemas[nickname]
+        store = self.__stores[nickname]
+        return self.__read_consistent(lambda: csyspart_snapshot(nickname, self.__version, tuple(schema.logitems),
+                                                                tuple(store.tolist()), bytes(store.valid),
+                                                                tuple(store.timestamps)))
+
+    def snapshot_all(self):
+        """
+        returns the consistent copy of all values of all systemparts
+         as dictionary {nickname: csyspart_snapshot}.
+        """
+        def reader():
+            version = self.__version
+            return {nickname: csyspart_snapshot(nickname, version, tuple(self.__schemas[nickname].logitems),
+                                                tuple(store.tolist()), bytes(store.valid), tuple(store.timestamps))
+                    for (nickname, store) in self.__stores.items()}
+        return self.__read_consistent(reader)
+
+    def version(self):
+        """
+        returns the version-number of the last value-change, it is incremented
+         with every changed value.
+        """
+        return self.__version
+
+    def changes_since(self, version, nickname=None):
+        """
+        returns the tuple (version, changes) with all items changed after 'version'
+         (only of systempart 'nickname' or list of systemparts if set):
+          version := current version-number, used as parameter for the next call
+          changes := [(nickname, logitem, value), ...]
+         Items changed while reading are returned again with the next call.
+        """
+        if nickname == None:
+            nicknames = list(self.__stores.keys())
+        elif isinstance(nickname, str):
+            nicknames = [self.__nickname_key(nickname)]
+        else:
+            nicknames = [self.__nickname_key(name) for name in nickname]
+        def reader():
+            currentversion = self.__version
+            changes = []
+            for nickname in nicknames:
+                store = self.__stores[nickname]
+                if store.version > version:
+                    logitems = self.__schemas[nickname].logitems
+                    for (index, itemversion) in enumerate(store.versions):
+                        if itemversion > version:
+                            changes.append((nickname, logitems[index], store.get(index)))
+            return (currentversion, changes)
+        return self.__read_consistent(reader)
+
+    def subscribe(self, callback=None, nicknames=None, logitems=None, interval=0.0):
+        """
+        returns the new subscriber 'csubscription' for values changed from now on.
+          callback  := called with the changes [(nickname, logitem, value), ...],
+                        without callback the changes are read with 'csubscription.get()'
+          nicknames := list of systemparts, None := all
+          logitems  := list of logitems, None := all
+          interval  := changes are collected and delivered at most every 'interval' seconds
+         The changes are delivered by the notify-thread of cdata, callbacks must not block.
+        """
+        if nicknames != None:
+            nicknames = [self.__nickname_key(nickname) for nickname in nicknames]
+        subscription = csubscription(self.__version, callback, nicknames, logitems, interval)
+        self.__subscriptions.append(subscription)
+        if self.__notify_thread == None:
+            self.__notify_thread = threading.Thread(target=self.__notify_subscribers,
+                                                    name="cdata_notify_Thread", daemon=True)
+            self.__notify_thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        removes the 'subscription' created with subscribe().
+        """
+        if subscription in self.__subscriptions:
+            self.__subscriptions.remove(subscription)
+
+    def __notify_subscribers(self):
+        """
+        notify-thread delivering the changed values to the subscribers, waiting for
+         changes or the next delivery-time of collected changes.
+        """
+        while True:
+            self.__changed.clear()
+            timeout = None
+            for subscription in list(self.__subscriptions):
+                if subscription.version >= self.__version:
+                    continue
+                now = time.monotonic()
+                if now < subscription.nexttime:
+                    # collect changes until the next delivery-time
+                    waittime = subscription.nexttime - now
+                    timeout = waittime if timeout == None else min(timeout, waittime)
+                    continue
+                (subscription.version, changes) = self.changes_since(subscription.version, subscription.nicknames)
+                if subscription.itemnames != None:
+                    changes = [change for change in changes
+                               if change[1].replace("_", "").lower() in subscription.itemnames]
+                if len(changes) > 0:
+                    subscription.nexttime = now + subscription.interval
+                    try:
+                        subscription.deliver(changes)
+                    except Exception as e:
+                        errorstr = "data.__notify_subscribers();Error;{0}".format(e)
+                        if self._logging != None:
+                            self._logging.critical(errorstr)
+            self.__changed.wait(timeout)
+
+    def __create_histories(self):
+        """
+        creates the empty history of all systemparts with 'historysamples' > 0.
+        """
+        self.__histories = {}
+        for (nickname, schema) in self.__schemas.items():
+            if schema.historysamples > 0:
+                if numpy == None:
+                    errorstr = "data.__create_histories();Warning;numpy not available, history disabled"
+                    self._logging.warning(errorstr)
+                    break
+                self.__histories[nickname] = csyspart_history(len(schema.logitems), schema.historysamples)
+
+    def history_samples(self, nickname, samples=None):
+        """
+        returns and setup of the number of samples in the history of every item of
+         systempart 'nickname' (0 := history disabled). Setup creates an empty history.
+        """
+        nickname = self.__nickname_key(nickname)
+        schema = self.__schemas[nickname]
+        if samples != None:
+            schema.historysamples = max(0, int(samples))
+            if schema.historysamples > 0 and numpy != None:
+                self.__histories[nickname] = csyspart_history(len(schema.logitems), schema.historysamples)
+            else:
+                self.__histories.pop(nickname, None)
+        return schema.historysamples
+
+    def history(self, nickname, logitem, seconds=None):
+        """
+        returns the tuple (timestamps, values) as numpy-arrays with the samples of
+         'logitem' (oldest first), only of the last 'seconds' if set.
+         Without history of that systempart it returns: None
+        """
+        nickname = self.__nickname_key(nickname)
+        handle = self.handle(nickname, logitem)
+        if handle == None or not nickname in self.__histories:
+            return None
+        history = self.__histories[nickname]
+        since = None if seconds == None else time.time() - seconds
+        return self.__read_consistent(lambda: history.series(handle[1], since))
+
+    def history_statistics(self, nickname, logitem, seconds=None, percentiles=(50,)):
+        """
+        returns the statistics of 'logitem' over the last 'seconds' as dictionary:
+         {"count": n, "min": x, "max": x, "mean": x, "percentiles": {percentile: x}}
+         None if no samples are available.
+        """
+        series = self.history(nickname, logitem, seconds)
+        if series == None or len(series[1]) == 0:
+            return None
+        values = series[1]
+        return {"count": len(values),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "mean": float(values.mean()),
+                "percentiles": dict(zip(percentiles, numpy.percentile(values, percentiles).tolist()))}
+
+    def history_rate(self, nickname, logitem, seconds=None):
+        """
+        returns the rate of change per second of 'logitem' over the last 'seconds'
+         (slope of the least-squares line), None if less than two samples are available.
+        """
+        series = self.history(nickname, logitem, seconds)
+        if series == None or len(series[1]) < 2:
+            return None
+        (timestamps, values) = series
+        timestamps = timestamps - timestamps.mean()
+        divisor = (timestamps * timestamps).sum()
+        if divisor == 0.0:
+            return None
+        return float((timestamps * (values - values.mean())).sum() / divisor)
+
+    def history_time_above(self, nickname, logitem, threshold, seconds=None):
+        """
+        returns the seconds with values of 'logitem' greater than 'threshold' over the
+         last 'seconds', every value is valid until the next sample (the last one until now).
+         None if no samples are available.
+        """
+        series = self.history(nickname, logitem, seconds)
+        if series == None or len(series[1]) == 0:
+            return None
+        (timestamps, values) = series
+        durations = numpy.diff(numpy.append(timestamps, max(time.time(), timestamps[-1])))
+        return float(durations[values > threshold].sum())
+
+    def state_filename(self):
+        """
+        returns the state-file defined in configuration-file ("" := not defined).
+        """
+        return self.__state_filename
+
+    def state_interval(self):
+        """
+        returns the seconds between writing the state-file defined in configuration-file.
+        """
+        return self.__state_interval
+
+    def state_maxage(self):
+        """
+        returns the max. age (seconds) of the values loaded from state-file.
+        """
+        return self.__state_maxage
+
+    def save_state(self, filename):
+        """
+        writes the consistent snapshot of all values with the time of their last update
+         to the binary state-file 'filename' (see: load_state()).
+        """
+        def reader():
+            return dict((nickname, (tuple(self.__schemas[nickname].logitems), store.tolist(),
+                                    bytes(store.valid), store.timestamps.tobytes()))
+                        for (nickname, store) in self.__stores.items())
+        state = (_STATEFILE_VERSION, time.time(), self.__read_consistent(reader))
+        # written to temporary file first, the state-file is always complete
+        with open(filename + ".tmp", "wb") as statefile:
+            pickle.dump(state, statefile, pickle.HIGHEST_PROTOCOL)
+        os.replace(filename + ".tmp", filename)
+
+    def load_state(self, filename, maxage=None):
+        """
+        reads the values and their update-time from state-file 'filename' (see: save_state()).
+         Only values updated since system-boot and not older than 'maxage' seconds
+         (default: state_maxage()) are loaded as valid, all other items keep their default-value.
+         Items are assigned by name, unknown items are ignored.
+         returns the number of valid values, 0 if the file is not available.
+        """
+        if maxage == None:
+            maxage = self.__state_maxage
+        try:
+            with open(filename, "rb") as statefile:
+                (fileversion, savetime, state) = pickle.load(statefile)
+        except (EnvironmentError, EOFError, ValueError, TypeError, pickle.UnpicklingError) as e:
+            errorstr = "data.load_state();Warning;state-file:'{0}' not loaded:{1}".format(filename, e)
+            self._logging.warning(errorstr)
+            return 0
+        if fileversion != _STATEFILE_VERSION:
+            return 0
+        oldest = max(_boottime(), time.time() - maxage)
+        validvalues = 0
+        self.begin_write()
+        try:
+            for (nickname, (logitems, values, valid, timestamps)) in state.items():
+                if not nickname in self.__stores:
+                    continue
+                schema = self.__schemas[nickname]
+                store = self.__stores[nickname]
+                updatetimes = array.array('d')
+                updatetimes.frombytes(timestamps)
+                for (logitem, value, isvalid, updatetime) in zip(logitems, values, valid, updatetimes):
+                    index = schema.itemindex.get(logitem.replace("_", "").lower())
+                    if index == None or not isvalid or updatetime < oldest:
+                        continue
+                    if store.put(index, value):
+                        self.__version += 1
+                        store.versions[index] = self.__version
+                        store.version = self.__version
+                    store.timestamps[index] = updatetime
+                    store.valid[index] = 1
+                    validvalues += 1
+                    store.updated = True
+        finally:
+            self.end_write()
+        if validvalues > 0:
+            self.__newdata_available = True
+        return validvalues
+
+    def start_state_saving(self, filename, interval):
+        """
+        starts the thread writing the state-file 'filename' every 'interval' seconds
+         if values are written, stopped with stop_state_saving().
+        """
+        self.stop_state_saving()
+        stopped = threading.Event()
+        def saving():
+            savedsequence = -1
+            while not stopped.wait(interval):
+                if self.__sequence != savedsequence:
+                    savedsequence = self.__sequence
+                    try:
+                        self.save_state(filename)
+                    except EnvironmentError as e:
+                        errorstr = "data.start_state_saving();Error;state-file:'{0}' not written:{1}".format(filename, e)
+                        self._logging.critical(errorstr)
+        self.__state_saving = stopped
+        threading.Thread(target=saving, name="cdata_state_Thread", daemon=True).start()
+
+    def stop_state_saving(self):
+        """
+        stops the thread started with start_state_saving().
+        """
+        if self.__state_saving != None:
+            self.__state_saving.set()
+            self.__state_saving = None
+
     def displayname(self, nickname, logitem):
         """
         returns the 'name' to be displayed for the logitem.
          Value is set in configuration-file.
          parameters 'nickname' and 'logitem' are required.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         itemname = logitem.replace("_", "").lower()
         try:
             if not len(nickname):
@@ -988,8 +1709,9 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
-                    return str(self.__data[nickname][4][itemname])
+                schema = self.__schemas[nickname]
+                if itemname in schema.itemindex:
+                    return str(schema.displaynames[schema.itemindex[itemname]])
                 else:
                     errorstr = "data.displayname();Error;itemname:'{0}' not found in nicknames:'{1}'".format(logitem, nickname)
                     self._logging.critical(errorstr)
@@ -1009,7 +1731,7 @@ class cdata(ht_utils.clog):
          Value is set in configuration-file.
          parameters 'nickname' and 'logitem' are required.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         itemname = logitem.replace("_", "").lower()
         try:
             if not len(nickname):
@@ -1021,8 +1743,9 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
-                    return self.__data[nickname][5][itemname]
+                schema = self.__schemas[nickname]
+                if itemname in schema.itemindex:
+                    return schema.units[schema.itemindex[itemname]]
                 else:
                     errorstr = "data.displayunit();Error;itemname:'{0}' not found".format(logitem)
                     self._logging.critical(errorstr)
@@ -1042,7 +1765,7 @@ class cdata(ht_utils.clog):
          Value is set in configuration-file.
          parameters 'nickname' and 'logitem' are required.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         itemname = logitem.replace("_", "").lower()
         try:
             if not len(nickname):
@@ -1054,12 +1777,13 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
+                schema = self.__schemas[nickname]
+                if itemname in schema.itemindex:
                     #check for float- or int-value and return the correct type
-                    if "." in (str(self.__data[nickname][9][itemname])):
-                        return float(self.__data[nickname][9][itemname])
+                    if "." in (str(schema.minvalues[schema.itemindex[itemname]])):
+                        return float(schema.minvalues[schema.itemindex[itemname]])
                     else:
-                        return int(self.__data[nickname][9][itemname])
+                        return int(schema.minvalues[schema.itemindex[itemname]])
                 else:
                     errorstr = "data.minvalue();Error;itemname:'{0}' not found".format(logitem)
                     self._logging.critical(errorstr)
@@ -1079,7 +1803,7 @@ class cdata(ht_utils.clog):
          Value is set in configuration-file.
          parameters 'nickname' and 'logitem' are required.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         itemname = logitem.replace("_", "").lower()
         try:
             if not len(nickname):
@@ -1091,12 +1815,13 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
+                schema = self.__schemas[nickname]
+                if itemname in schema.itemindex:
                     #check for float- or int-value and return the correct type
-                    if "." in (str(self.__data[nickname][6][itemname])):
-                        return float(self.__data[nickname][6][itemname])
+                    if "." in (str(schema.maxvalues[schema.itemindex[itemname]])):
+                        return float(schema.maxvalues[schema.itemindex[itemname]])
                     else:
-                        return int(self.__data[nickname][6][itemname])
+                        return int(schema.maxvalues[schema.itemindex[itemname]])
                 else:
                     errorstr = "data.maxvalue();Error;itemname:'{0}' not found".format(logitem)
                     self._logging.critical(errorstr)
@@ -1116,7 +1841,7 @@ class cdata(ht_utils.clog):
          Value is set in configuration-file.
          parameters 'nickname' and 'logitem' are required.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         itemname = logitem.replace("_", "").lower()
         try:
             if not len(nickname):
@@ -1128,8 +1853,9 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
-                    default = self.__data[nickname][7][itemname]
+                schema = self.__schemas[nickname]
+                if itemname in schema.itemindex:
+                    default = schema.defaults[schema.itemindex[itemname]]
                     if not default in ['"','""']:
                         #check for float- or int-value and return the correct type
                         if "." in str(default):
@@ -1157,7 +1883,7 @@ class cdata(ht_utils.clog):
          Value is set in configuration-file.
          parameters 'nickname' and 'logitem' are required.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         itemname = logitem.replace("_", "").lower()
         try:
             if not len(nickname):
@@ -1169,8 +1895,9 @@ class cdata(ht_utils.clog):
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                if itemname in self.__data[nickname][0]:
-                    return self.__data[nickname][8][itemname]
+                schema = self.__schemas[nickname]
+                if itemname in schema.itemindex:
+                    return schema.accessnames[schema.itemindex[itemname]]
                 else:
                     errorstr = "data.accessname();Error;itemname:'{0}' not found".format(logitem)
                     self._logging.critical(errorstr)
@@ -1188,14 +1915,14 @@ class cdata(ht_utils.clog):
         """
         returns the hardwaretype read from configuration-file.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         try:
             if not len(nickname):
                 errorstr = "data.hardwaretype();Error;nickname: '{0}' undefined".format(nickname)
                 self._logging.critical(errorstr)
                 raise NameError(errorstr)
             if nickname in self.__nickname:
-                return str(self.__data[nickname][10])
+                return str(self.__schemas[nickname].hwtype)
             else:
                 errorstr = "data.hardwaretype();Error;nickname:'{0}' not found".format(nickname)
                 self._logging.critical(errorstr)
@@ -1377,6 +2104,42 @@ class cdata(ht_utils.clog):
             self.__dataif_param_proxy_cfg_file = client_cfg_file
         return self.__dataif_param_proxy_cfg_file
 
+    def black_sequences(self, sequence=None):
+        """
+        returns the list of black-sequences defined in configuration-file.
+         'sequence' (list of int) is appended if set.
+        """
+        if sequence != None:
+            self.__black_sequences.append(sequence)
+        return self.__black_sequences
+
+    def deviceaddresses(self, address=None):
+        """
+        returns the list of additional device-addresses defined in configuration-file.
+         'address' (int) is appended if set.
+        """
+        if address != None and not address in self.__deviceaddresses:
+            self.__deviceaddresses.append(address)
+        return self.__deviceaddresses
+
+    def msgid_blacklist(self, address=None, msgids=None):
+        """
+        returns the dictionary {deviceaddress: [msgID, ...]} of not valid msgIDs
+         defined in configuration-file. 'msgids' (list of int) are added for 'address' if set.
+        """
+        if address != None and msgids != None:
+            self.__msgid_blacklist.setdefault(address, []).extend(msgids)
+        return self.__msgid_blacklist
+
+    def msgid_mapping(self, address=None, msgids=None):
+        """
+        returns the dictionary {deviceaddress: [msgID, ...]} of valid msgIDs
+         defined in configuration-file. 'msgids' (list of int) are added for 'address' if set.
+        """
+        if address != None and msgids != None:
+            self.__msgid_mapping.setdefault(address, []).extend(msgids)
+        return self.__msgid_mapping
+
     def IsAnyUpdate(self):
         """
         returns True/False if any update was set.
@@ -1395,30 +2158,30 @@ class cdata(ht_utils.clog):
         """
         returns True/False for parameter 'nickname' if new data is available and resets the flag.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         self.__thread_lock.acquire()
-        Rtn = self.__data[nickname][2]
-        self.__data[nickname][2] = False
+        Rtn = self.__stores[nickname].updated
+        self.__stores[nickname].updated = False
         self.__thread_lock.release()
         return Rtn
 
     def UnmixedFlagHK(self, nickname, unmixed=None):
         """
-        returns True for parameter 'nickname' if heater-circuit (HK1..4) has no mixer else False.
+        returns True for parameter 'nickname' if heater-circuit (HK1..n) has no mixer else False.
          Values are set in configuration-file.
         """
-        nickname = nickname.upper()[0:3]
+        nickname = self.__nickname_key(nickname)
         if unmixed != None:
-            self.__unmixedHK1_HK4.update({nickname: unmixed})
-        return bool(self.__unmixedHK1_HK4.get(nickname))
+            self.__unmixedHK.update({nickname: unmixed})
+        return bool(self.__unmixedHK.get(nickname))
 
     def GetAllMixerFlags(self):
         """
         returns True-values if heater-circuits has a mixer, else False.
-         a list of 4 values will be returned (HK1...4)
+         a list of at least 4 values will be returned (HK1...n)
         """
         mixed_flags = []
-        for HeizkreisNummer in range(1, 5):
+        for HeizkreisNummer in range(1, max(4, len(self.__systemparts.get("HK", []))) + 1):
             nickname = "HK" + str(HeizkreisNummer)
             mixed = 1 if not bool(self.UnmixedFlagHK(nickname)) else 0
             # set result to tuple rtn-values, starting with index:=0
@@ -1532,14 +2295,8 @@ if __name__ == "__main__":
     # testtype:= 1 -> test including xml-configfile-data extract
     #
     # data-structur:
-    #   {nickname:[ {itemname:arrayindex},[value1,value2,...],Update-Flag,{itemname:logitem},
-    #                                                                     {itemname:displayname},
-    #                                                                     {itemname:unit},
-    #                                                                     {itemname:maxvalue},
-    #                                                                     {itemname:default},
-    #                                                                     {itemname:accessname},
-    #                                                                     {itemname:minvalue},
-    #                                                                     hardwaretype]}
+    #   {nickname: csyspart_schema} static data from configuration
+    #   {nickname: csyspart_values} values
     #
     testtype = 1
 
@@ -1736,6 +2493,167 @@ if __name__ == "__main__":
             print("      Failed    -> Nickname:{0}; Logitem:{1}; Itemname:{2}; Set-Parameter:{3}".format(nickname, logitem, itemname, set_parameter))
 
 
+        print(""" -- Get/set value with item-handle        ---""")
+        handle = data.handle("SO", "T_Kollektor")
+        data.set(handle, 45.6)
+        if data.get(handle) == 45.6 and data.values("SO", "T_Kollektor") == 45.6 and \
+           data.handle("SO", "T_unknown") == None:
+            print("      Result OK -> handle:{0}; value:{1}".format(handle, data.get(handle)))
+        else:
+            print("      Failed    -> handle:{0}; value:{1}".format(handle, data.get(handle)))
+
+        print(""" -- Get changes since version           ---""")
+        version = data.version()
+        data.set(handle, 45.6)
+        data.update("SO", "T_Kollektor", 45.6)
+        data.update("HK1", "T_ist_HK", 21.5)
+        data.set(handle, 46.7)
+        (version, changes) = data.changes_since(version)
+        if changes == [("HK1", "T_ist_HK", 21.5), ("SO", "T_Kollektor", 46.7)] and \
+           data.changes_since(version) == (version, []):
+            print("      Result OK -> version:{0}; changes:{1}".format(version, changes))
+        else:
+            print("      Failed    -> version:{0}; changes:{1}".format(version, changes))
+
+        print(""" -- Snapshots while values are written   ---""")
+        import threading
+        handles = (data.handle("HK1", "T_ist_HK"), data.handle("HK1", "T_soll_HK"))
+        def writer():
+            for value in range(20000):
+                data.begin_write()
+                for handle in handles:
+                    data.set(handle, value)
+                data.end_write()
+        def second_writer():
+            # other thread writing single values and messages, serialized by the write-lock
+            so_handle = data.handle("SO", "T_Kollektor")
+            for value in range(5000):
+                data.set(so_handle, value)
+                data.begin_write()
+                for handle in handles:
+                    data.set(handle, -value)
+                data.end_write()
+        writethread = threading.Thread(target=writer)
+        secondthread = threading.Thread(target=second_writer)
+        writethread.start()
+        secondthread.start()
+        (snapshots, torn) = (0, 0)
+        while writethread.is_alive() or secondthread.is_alive():
+            snapshot = data.snapshot_all()["HK1"]
+            snapshots += 1
+            if snapshot.value("T_ist_HK") != snapshot.value("T_soll_HK"):
+                torn += 1
+        writethread.join()
+        secondthread.join()
+        snapshot = data.snapshot("HK1")
+        if torn == 0 and snapshot.value("T_ist_HK") in (19999, -4999) and \
+           snapshot.value("T_soll_HK") == snapshot.value("T_ist_HK"):
+            print("      Result OK -> snapshots:{0}; torn:{1}".format(snapshots, torn))
+        else:
+            print("      Failed    -> snapshots:{0}; torn:{1}".format(snapshots, torn))
+
+        print(""" -- Subscribers of changed values       ---""")
+        so_changes = []
+        subscription_so = data.subscribe(so_changes.extend, nicknames=["SO"])
+        subscription_hk = data.subscribe(logitems=["T_ist_HK"], interval=0.5)
+        data.update("SO", "T_Kollektor", 50.1)
+        data.update("HK1", "T_ist_HK", 22.5)
+        data.update("HK1", "T_soll_HK", 20.0)
+        first = subscription_hk.get(timeout=1.0)
+        data.update("HK1", "T_ist_HK", 22.6)
+        data.update("HK1", "T_ist_HK", 22.7)
+        # changes of the interval are delivered together
+        second = subscription_hk.get(timeout=1.0)
+        data.unsubscribe(subscription_so)
+        data.unsubscribe(subscription_hk)
+        if so_changes == [("SO", "T_Kollektor", 50.1)] and first == [("HK1", "T_ist_HK", 22.5)] and \
+           second == [("HK1", "T_ist_HK", 22.7)]:
+            print("      Result OK -> callback:{0}; queue:{1}, {2}".format(so_changes, first, second))
+        else:
+            print("      Failed    -> callback:{0}; queue:{1}, {2}".format(so_changes, first, second))
+
+        print(""" -- History of values                    ---""")
+        if numpy != None:
+            data.history_samples("HK1", 4)
+            handle = data.handle("HK1", "T_ist_HK")
+            for value in (20.0, 21.0, 22.0, 23.0, 24.0, 25.0):
+                data.set(handle, value)
+            (timestamps, values) = data.history("HK1", "T_ist_HK", seconds=60)
+            statistics = data.history_statistics("HK1", "T_ist_HK", seconds=60, percentiles=(50, 100))
+            if values.tolist() == [22.0, 23.0, 24.0, 25.0] and statistics["mean"] == 23.5 and \
+               statistics["percentiles"][100] == 25.0 and data.history("HG", "T_aussen") == None and \
+               data.history_time_above("HK1", "T_ist_HK", 30.0) == 0.0:
+                print("      Result OK -> values:{0}; statistics:{1}".format(values.tolist(), statistics))
+            else:
+                print("      Failed    -> values:{0}; statistics:{1}".format(values.tolist(), statistics))
+            data.history_samples("HK1", 0)
+        else:
+            print("      numpy not available, history disabled")
+
+        print(""" -- Registered systemparts               ---""")
+        heatingcircuits = data.systempart_nicknames("HK")
+        if heatingcircuits == ["HK1", "HK2", "HK3", "HK4"] and data.systempart_nicknames("so") == ["SO"] and \
+           data.IsSystempart("hk2") and not data.IsSystempart("HK5") and data.getlongname("hk4") == "heizkreis4":
+            print("      Result OK -> heating-circuits:{0}; all:{1}".format(heatingcircuits, data.systempart_nicknames()))
+        else:
+            print("      Failed    -> heating-circuits:{0}; all:{1}".format(heatingcircuits, data.systempart_nicknames()))
+
+        print(""" -- State-file of values                 ---""")
+        statefilename = os.path.join(tempfile.gettempdir(), "cdata_test_state.bin")
+        data.save_state(statefilename)
+        restored = cdata()
+        restored.read_db_config("./../etc/config/4test/create_db_test.xml")
+        validvalues = restored.load_state(statefilename)
+        (saved, loaded) = (data.snapshot("SO"), restored.snapshot("SO"))
+        # values updated before system-boot or older than max. age are not loaded
+        (boottime, _boottime) = (_boottime, lambda: time.time() + 1.0)
+        stale = cdata()
+        stale.read_db_config("./../etc/config/4test/create_db_test.xml")
+        stalevalues = stale.load_state(statefilename)
+        _boottime = boottime
+        aged = cdata()
+        aged.read_db_config("./../etc/config/4test/create_db_test.xml")
+        time.sleep(0.01)
+        agedvalues = aged.load_state(statefilename, maxage=0.001)
+        os.remove(statefilename)
+        if validvalues > 0 and loaded.value("T_Kollektor") == saved.value("T_Kollektor") and \
+           loaded.timestamps == saved.timestamps and loaded.valid == saved.valid and stalevalues == 0 and \
+           agedvalues == 0 and stale.values("SO", "T_Kollektor") != saved.value("T_Kollektor") and \
+           not any(stale.snapshot("SO").valid) and stale.snapshot("SO") == aged.snapshot("SO"):
+            print("      Result OK -> valid values:{0}; stale values:{1}".format(validvalues, stalevalues))
+        else:
+            print("      Failed    -> valid values:{0}; stale values:{1}".format(validvalues, stalevalues))
+
+        print(""" -- Compiled configuration from cache    ---""")
+        parsed = cdata()
+        parsed.read_db_config("./../etc/config/4test/create_db_test.xml", usecache=False)
+        _compiled_configs.clear()
+        cachedir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(cachedir, "var"))
+        _CONFIGCACHE_PATH = os.path.join(cachedir, "var", "cache")
+        stored = cdata()
+        stored.read_db_config("./../etc/config/4test/create_db_test.xml")
+        _compiled_configs.clear()
+        cached = cdata()
+        cached.read_db_config("./../etc/config/4test/create_db_test.xml")
+        cachefiles = os.listdir(_CONFIGCACHE_PATH)
+        for cachefile in cachefiles:
+            os.remove(os.path.join(_CONFIGCACHE_PATH, cachefile))
+        os.rmdir(_CONFIGCACHE_PATH)
+        os.rmdir(os.path.join(cachedir, "var"))
+        os.rmdir(cachedir)
+        cached_handle = cached.handle("HK1", "T_ist_HK")
+        cached.set(cached_handle, 1.5)
+        if len(cachefiles) == 1 and cached.syspartnames() == parsed.syspartnames() and \
+           cached_handle == parsed.handle("HK1", "T_ist_HK") and \
+           [cached.values(nickname) for nickname in ("HG", "WW", "SO", "DT")] == \
+           [parsed.values(nickname) for nickname in ("HG", "WW", "SO", "DT")] and \
+           cached.get(cached_handle) == 1.5 and parsed.get(cached_handle) != 1.5 and \
+           stored.get(cached_handle) != 1.5 and cached.IsSyspartUpdate("SO") == parsed.IsSyspartUpdate("SO"):
+            print("      Result OK -> systemparts:{0}; cache-files:{1}".format(cached.syspartnames(), cachefiles))
+        else:
+            print("      Failed    -> systemparts:{0}".format(cached.syspartnames()))
+
         print(""" -------------------------------------------""")
         print(""" -- Set values to defaults               ---""")
         print("""      before update""")
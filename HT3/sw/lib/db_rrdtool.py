@@ -26,14 +26,15 @@
 # Ver:0.4    / Datum 25.10.2022 create_draw() debug-output modified.
 # Ver:0.4.1  / 2023-06-07 tempfile handling added in __init__()
 # Ver:0.5    / 2023-07-26 db-size smaler: LAST kept now for 2years back.
+# Ver:0.5.1  / 2026-10-18 configuration read with data.config_root(), parsed once per process.
 #################################################################
 #
 
 import os
 import tempfile
-import xml.etree.ElementTree as ET
 import time
 import ht_utils
+import data
 import logging
 import ht_const
 
@@ -76,8 +77,7 @@ class cdb_rrdtool(ht_utils.clog):
                 raise TypeError(errorstr)
 
             #get database-name from configuration
-            tree = ET.parse(configurationfilename)
-            self.__root = tree.getroot()
+            self.__root = data.config_root(configurationfilename)
             self.__dbname = self.__root.find('dbname_rrd').text
             if not len(self.__dbname):
                 errorstr = "cdb_rrdtool();NameError;'dbname_rrd' not found in configuration"
@@ -23,6 +23,8 @@
 # Ver:0.1.10 / Datum 25.08.2016 minor formatting changes
 # Ver:0.2    / Datum 29.08.2016 Fkt.doc added.
 # Ver:0.3    / 2023-06-07       tempfile handling added in __init__()
+# Ver:0.3.1  / 2026-10-18       configuration read with data.config_root(), parsed once per process.
+# Ver:0.3.2  / 2026-10-18       createdb_sqlite() with optional table-prefix.
 #################################################################
 #
 
@@ -30,8 +32,8 @@ import sqlite3
 import time
 import os
 import tempfile
-import xml.etree.ElementTree as ET
 import ht_utils
+import data
 import logging
 
 
@@ -63,8 +65,7 @@ class cdb_sqlite(ht_utils.clog):
 
             self.__cfgfilename = configurationfilename
             #get database-name from configuration
-            tree = ET.parse(configurationfilename)
-            self.__root = tree.getroot()
+            self.__root = data.config_root(configurationfilename)
             self.__dbname = self.__root.find('dbname_sqlite').text
             if not len(self.__dbname):
                 errorstr = "cdb_sqlite;Error;'dbname_sqlite' not found in configuration"
@@ -373,11 +374,12 @@ class cdb_sqlite(ht_utils.clog):
                     print(errorstr)
 
     #---------------------
-    def createdb_sqlite(self):
+    def createdb_sqlite(self, tableprefix=""):
         """
             creating database 'sqlite'
              The db-structur is taken from xml-configurefile
              mandatory: to be connected to database
+             optional : tableprefix (set before all table- and index-names)
         """
         if self.__sql_enable == True:
             if self.__connection == None:
@@ -389,11 +391,11 @@ class cdb_sqlite(ht_utils.clog):
                     self.setpragma("auto_vacuum", "= full")
 
                     for syspart in self.__root.findall('systempart'):
-                        syspartname = syspart.attrib["name"]
+                        syspartname = tableprefix + syspart.attrib["name"]
                         # create table
                         self.createtable(syspartname)
                         # set index for first column 'data_time'
-                        self.createindex(syspartname, "idate_time", "Local_date_time")
+                        self.createindex(syspartname, tableprefix + "idate_time", "Local_date_time")
 
                         for logitem in syspart.findall('logitem'):
                             name = logitem.attrib["name"]
@@ -82,6 +82,8 @@
 #                          __MakeDisplaycodeString() replaced with utils.IntegerToString()
 # Ver:0.6.2  / 2023-10-22  Mixerposition solar-optionG added using spare-value:sol_V_spare_1
 #                            ID:868_15_0
+# Ver:0.6.3  / 2026-10-18  display-thread waits for changed values with a subscription of
+#                           'cdata' (max. one update per second) instead of polling IsAnyUpdate().
 #################################################################
 #
 
@@ -273,12 +275,15 @@ class gui_cworker(ht_utils.cht_utils, ht_utils.clog):
             main threat for GUI-display.
         """
         self.__cleardata()
+        # changed values are collected and delivered max. once per second
+        subscription = self.__gdata.subscribe(interval=1.0)
         while self.__threadrun:
-            self.__anzeigesteuerung()
-            if self.__threadrun:
-                time.sleep(1)
-            else:
+            changes = subscription.get(timeout=1.0)
+            if not self.__threadrun:
                 break
+            if changes != None:
+                self.__anzeigesteuerung()
+        self.__gdata.unsubscribe(subscription)
 
     def __ende(self):
         """
@@ -1456,35 +1461,33 @@ class gui_cworker(ht_utils.cht_utils, ht_utils.clog):
         """
             GUI display-controller.
         """
-        # if newdata available, display them
-        if self.__gdata.IsAnyUpdate():
-            self.__clear()
-            if self.__current_display == "system":
-                self.__System()
-            elif self.__current_display == str(self.__gdata.getlongname("HG")):  # "heizgeraet"
-                self.__systempart_text("HG")
-                self.__Info()
-                self.__Heizgeraet()
-            elif self.__current_display == str(self.__gdata.getlongname("HK1")):  # "heizkreise"
-                self.__systempart_text("HK1")
-                self.__Info()
-                self.__Heizkreis()
-            elif self.__current_display == str(self.__gdata.getlongname("WW")):  # "warmwasser"
-                self.__systempart_text("WW")
-                self.__Info()
-                self.__Warmwasser()
-            elif self.__current_display == str(self.__gdata.getlongname("SO")):  # "solar"
-                self.__systempart_text("SO")
-                self.__Info()
-                self.__Solar()
-            else:
-                self.__System()
+        # called with newdata available, display them
+        self.__clear()
+        if self.__current_display == "system":
+            self.__System()
+        elif self.__current_display == str(self.__gdata.getlongname("HG")):  # "heizgeraet"
+            self.__systempart_text("HG")
+            self.__Info()
+            self.__Heizgeraet()
+        elif self.__current_display == str(self.__gdata.getlongname("HK1")):  # "heizkreise"
+            self.__systempart_text("HK1")
+            self.__Info()
+            self.__Heizkreis()
+        elif self.__current_display == str(self.__gdata.getlongname("WW")):  # "warmwasser"
+            self.__systempart_text("WW")
+            self.__Info()
+            self.__Warmwasser()
+        elif self.__current_display == str(self.__gdata.getlongname("SO")):  # "solar"
+            self.__systempart_text("SO")
+            self.__Info()
+            self.__Solar()
+        else:
+            self.__System()
 
-            if self.__hexdump_window:
-                self.__g_i_hexheader_counter += 1
-                if not self.__g_i_hexheader_counter % 40:
-                    self.__Hextext_bytecomment()
-            self.__gdata.UpdateRead()
+        if self.__hexdump_window:
+            self.__g_i_hexheader_counter += 1
+            if not self.__g_i_hexheader_counter % 40:
+                self.__Hextext_bytecomment()
 
 #--- class gui_cworker end ---#
 
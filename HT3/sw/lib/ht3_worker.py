@@ -38,6 +38,8 @@
 # Ver:0.3.2  / Datum 03.12.2019 Issue:'Deprecated property InterCharTimeout #7'
 #                                port.setInterCharTimeout() removed
 # Ver:0.4    / Datum 24.10.2022 logging header-startline and release-output added.
+# Ver:0.4.1  / 2026-10-18       input-file opened with 'ht_binlog.cht_binlogreader' for binlog-files v2,
+#                                decoding stopped at end of that file.
 #################################################################
 
 import sys
@@ -47,6 +49,7 @@ import _thread
 import sqlite3
 import data
 import ht_discode
+import ht_binlog
 import gui_worker
 import db_sqlite
 from ht_proxy_if import cht_socket_client as ht_proxy_client
@@ -147,7 +150,10 @@ class ht3_cworker(object):
         if ((self.__inputfile != None) and (len(self.__inputfile) > 0)):
             # open input-file in readonly-binary mode for analysing binary HT3-data
             try:
-                self.__filehandle = open(self.__inputfile, "rb")
+                if ht_binlog.IsBinlogV2(self.__inputfile):
+                    self.__filehandle = ht_binlog.cht_binlogreader(self.__inputfile)
+                else:
+                    self.__filehandle = open(self.__inputfile, "rb")
                 self.__gui_titel_input = "FILE"
             except:
                 errorstr = 'cworker();Error; could not open file:{0}'.format(self.__inputfile)
@@ -314,7 +320,12 @@ class ht3_cworker(object):
 
         while self.__threadrun:
             # get the decoded values and store them to db if enabled.
-            (nickname, value) = rawdata.discoder()
+            try:
+                (nickname, value) = rawdata.discoder()
+            except EOFError:
+                # end of binlog-file v2 reached
+                self._logging.info("cworker.run(); end of inputfile:{0}".format(self.__inputfile))
+                break
             if value != None:
                 if database.is_sql_db_enabled():
                     database.insert(str(ht3_cworker._gdata.getlongname(nickname)), value)
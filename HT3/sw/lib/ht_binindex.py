@@ -0,0 +1,392 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+#                               sidecar frame-index for binlog-files and
+#                                indexed decoding of single frames using 'mmap'.
+# Ver:0.2    / 2026-10-18       binlog-files v2 with receive-time supported.
+# Ver:0.3    / 2026-10-18       frame-offsets from 'cht_discode.last_message_position()', so bytes
+#                                removed as black-sequence are counted.
+#################################################################
+
+import os
+import mmap
+import array
+import struct
+import logging
+import tempfile
+import data
+import ht_discode
+import ht_binlog
+
+try:
+    import numpy
+except ImportError:
+    # numpy is optional, used only to speed up 'find()'
+    numpy = None
+
+__author__ = "agent"
+__status__ = "draft"
+
+
+def _nulllogger():
+    """
+    returns logger without output, used if no logger is given.
+    """
+    logger = logging.getLogger("binindex")
+    if len(logger.handlers) == 0:
+        logger.addHandler(logging.NullHandler())
+        logger.setLevel(logging.WARNING)
+    return logger
+
+
+class cht_mmapsource(object):
+    """
+    Class: cht_mmapsource.
+     Read-only binlog-file mapped with 'mmap' used as 'filehandle' for 'cht_discode'.
+     The stream can be repositioned with 'seek()' (call 'cht_discode.resync()' then).
+     At end of file some 0x00 bytes are appended once, then 'EOFError' is raised.
+     'position' is the stream-position of the next byte returned (padding included).
+    """
+    _EOF_PADDING = 64
+
+    def __init__(self, filepath):
+        self._file = open(filepath, "rb")
+        self._size = os.path.getsize(filepath)
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size > 0 else b""
+        self._offset = 0
+        self._padded = False
+        self.position = 0
+
+    def __len__(self):
+        return self._size
+
+    def seek(self, position):
+        """
+        sets the stream-position to 'position' (limited to file-size).
+        """
+        self._offset = min(max(0, position), self._size)
+        self._padded = False
+        self.position = self._offset
+
+    def read(self, size=-1):
+        if self._padded:
+            raise EOFError("cht_mmapsource.read();end of file")
+        end = self._size if size < 0 else min(self._size, self._offset + size)
+        block = self._mmap[self._offset:end]
+        self._offset = end
+        if size < 0 or len(block) < size:
+            block += bytes(cht_mmapsource._EOF_PADDING)
+            self._padded = True
+        self.position += len(block)
+        return block
+
+    def time(self, position):
+        """
+        returns the receive-time of byte at 'position', 0.0 := not available.
+         Plain binlog-files don't have timestamps.
+        """
+        return 0.0
+
+    def close(self):
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+#--- class cht_mmapsource end ---#
+################################################
+
+
+def open_source(filepath):
+    """
+    returns the seekable 'filehandle' for 'cht_discode' matching the binlog-format:
+     'ht_binlog.cht_binlogreader' for binlog-files v2, else 'cht_mmapsource'.
+    """
+    if ht_binlog.IsBinlogV2(filepath):
+        return ht_binlog.cht_binlogreader(filepath)
+    return cht_mmapsource(filepath)
+
+
+class cht_binindex(object):
+    """
+    Class: cht_binindex.
+     Sidecar frame-index of a binlog-file ('<binlogfile>.idx') with one record
+     for each valid frame. The columns are stored as packed arrays after the header:
+      offset    (Q): stream-position of frame-start
+      time      (d): receive-time of frame, 0.0 := not available
+      msgid     (H): message-ID
+      msgoffset (B): message-offset
+      source    (B): source-byte
+      target    (B): target-byte
+      framesize (B): number of bytes of frame in stream
+     The index-file is mapped with 'mmap', columns are accessed as memoryviews.
+    """
+    MAGIC = b"HTIX"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHQ")
+    COLUMNS = (("offset", "Q"), ("time", "d"), ("msgid", "H"), ("msgoffset", "B"),
+               ("source", "B"), ("target", "B"), ("framesize", "B"))
+    _FLUSHSIZE = 65536
+
+    def __init__(self, indexfile):
+        """
+        opens the index-file read-only.
+        """
+        self._file = open(indexfile, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, reserved, count) = cht_binindex.HEADER.unpack_from(self._mmap, 0)
+        if magic != cht_binindex.MAGIC or version != cht_binindex.VERSION:
+            self.close()
+            errorstr = "cht_binindex();Error;{0} is no index-file version:{1}".format(indexfile, cht_binindex.VERSION)
+            raise ValueError(errorstr)
+        self._count = count
+        self._columns = {}
+        self._positions = {}
+        position = cht_binindex.HEADER.size
+        view = memoryview(self._mmap)
+        for (name, code) in cht_binindex.COLUMNS:
+            size = struct.calcsize(code) * count
+            self._columns[name] = view[position:position + size].cast(code)
+            self._positions[name] = (position, code)
+            position += size
+        view.release()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, number):
+        """
+        returns the record 'number' as tuple (offset, time, msgid, msgoffset, source, target, framesize).
+        """
+        return tuple(self._columns[name][number] for (name, code) in cht_binindex.COLUMNS)
+
+    def column(self, name):
+        """
+        returns the column 'name' as memoryview.
+        """
+        return self._columns[name]
+
+    def find(self, msgid=None, source=None, target=None, starttime=None, endtime=None):
+        """
+        returns the record-numbers of all frames matching the given filters.
+         'source' and 'target' are compared without MSB, time-filters
+         exclude frames without receive-time.
+        """
+        if numpy != None and self._count > 0:
+            mask = numpy.ones(self._count, dtype=bool)
+            columns = {}
+            for (name, (position, code)) in self._positions.items():
+                columns[name] = numpy.frombuffer(self._mmap, dtype="<" + code, count=self._count, offset=position)
+            if msgid != None:
+                mask &= columns["msgid"] == msgid
+            if source != None:
+                mask &= (columns["source"] & 0x7f) == (source & 0x7f)
+            if target != None:
+                mask &= (columns["target"] & 0x7f) == (target & 0x7f)
+            if starttime != None:
+                mask &= (columns["time"] > 0.0) & (columns["time"] >= starttime)
+            if endtime != None:
+                mask &= (columns["time"] > 0.0) & (columns["time"] < endtime)
+            return [int(number) for number in numpy.flatnonzero(mask)]
+
+        numbers = range(self._count)
+        if msgid != None:
+            msgids = self._columns["msgid"]
+            numbers = [number for number in numbers if msgids[number] == msgid]
+        if source != None:
+            sources = self._columns["source"]
+            numbers = [number for number in numbers if (sources[number] & 0x7f) == (source & 0x7f)]
+        if target != None:
+            targets = self._columns["target"]
+            numbers = [number for number in numbers if (targets[number] & 0x7f) == (target & 0x7f)]
+        if starttime != None or endtime != None:
+            times = self._columns["time"]
+            numbers = [number for number in numbers if times[number] > 0.0 and
+                       (starttime == None or times[number] >= starttime) and
+                       (endtime == None or times[number] < endtime)]
+        return list(numbers)
+
+    def close(self):
+        for column in getattr(self, "_columns", {}).values():
+            column.release()
+        self._columns = {}
+        self._mmap.close()
+        self._file.close()
+
+    @staticmethod
+    def create(binlogfile, configfile, indexfile=None, logger=None):
+        """
+        scans the binlog-file once and writes the frame-index to 'indexfile'
+         (default: '<binlogfile>.idx').
+         returns the number of indexed frames.
+        """
+        if indexfile == None:
+            indexfile = binlogfile + ".idx"
+        if logger == None:
+            logger = _nulllogger()
+        gdata = data.cdata()
+        gdata.read_db_config(configfile, logger=logger)
+        source = open_source(binlogfile)
+        decoder = ht_discode.cht_discode(None, gdata, filehandle=source, logger=logger)
+
+        # columns are collected in part-files and joined at the end
+        partpath = tempfile.mkdtemp(prefix="ht_binindex_", dir=os.path.dirname(os.path.abspath(indexfile)))
+        partfiles = [open(os.path.join(partpath, name), "wb") for (name, code) in cht_binindex.COLUMNS]
+        columns = [array.array(code) for (name, code) in cht_binindex.COLUMNS]
+        count = 0
+        last_message = None
+        try:
+            while True:
+                decoder.discoder()
+                message = decoder.last_message()
+                if message is last_message or message == None:
+                    continue
+                last_message = message
+                (msgid, msgoffset, sourcebyte, targetbyte, framesize) = message
+                offset = decoder.last_message_position()
+                for (column, value) in zip(columns, (offset, source.time(offset), msgid & 0xffff,
+                                                     msgoffset & 0xff, sourcebyte, targetbyte, framesize & 0xff)):
+                    column.append(value)
+                count += 1
+                if len(columns[0]) >= cht_binindex._FLUSHSIZE:
+                    for (column, partfile) in zip(columns, partfiles):
+                        column.tofile(partfile)
+                        del column[:]
+        except EOFError:
+            pass
+        finally:
+            source.close()
+            for (column, partfile) in zip(columns, partfiles):
+                column.tofile(partfile)
+                partfile.close()
+
+        with open(indexfile, "wb") as outfile:
+            outfile.write(cht_binindex.HEADER.pack(cht_binindex.MAGIC, cht_binindex.VERSION, 0, count))
+            for (name, code) in cht_binindex.COLUMNS:
+                with open(os.path.join(partpath, name), "rb") as partfile:
+                    while True:
+                        block = partfile.read(1 << 20)
+                        if len(block) == 0:
+                            break
+                        outfile.write(block)
+                os.remove(os.path.join(partpath, name))
+        os.rmdir(partpath)
+        logger.info("cht_binindex.create();{0};frames:{1}".format(indexfile, count))
+        return count
+
+#--- class cht_binindex end ---#
+################################################
+
+
+class cht_binlogseeker(object):
+    """
+    Class: cht_binlogseeker.
+     Decoding of single frames from a binlog-file using its frame-index.
+     The binlog is mapped with 'mmap' (v2: decompressed blocks), decoding starts at the indexed frame
+     some frames before, so the decoder is synchronised.
+     Remark: only the values of the decoded frame itself are valid, the other
+             values of that syspart are from frames decoded before.
+    """
+    _SYNC_FRAMES = 8
+
+    def __init__(self, binlogfile, configfile, index=None, logger=None):
+        if logger == None:
+            logger = _nulllogger()
+        self._index = index if index != None else cht_binindex(binlogfile + ".idx")
+        self._gdata = data.cdata()
+        self._gdata.read_db_config(configfile, logger=logger)
+        self._source = open_source(binlogfile)
+        self._decoder = ht_discode.cht_discode(None, self._gdata, filehandle=self._source, logger=logger)
+
+    def index(self):
+        return self._index
+
+    def decode_frame(self, number):
+        """
+        decodes the frame with record-number 'number'.
+         returns (nickname, values) or None if not found.
+        """
+        (offset, frametime, msgid, msgoffset, sourcebyte, targetbyte, framesize) = self._index[number]
+        syncoffset = self._index[max(0, number - cht_binlogseeker._SYNC_FRAMES)][0]
+        self._source.seek(syncoffset)
+        self._decoder.resync(syncoffset)
+        try:
+            while True:
+                (nickname, values) = self._decoder.discoder()
+                message = self._decoder.last_message()
+                position = self._decoder.last_message_position() if message != None else syncoffset
+                if message != None and position == offset and message[0:2] == (msgid, msgoffset):
+                    return (nickname, None if values == None else list(values))
+                if position > offset or self._decoder.stream_position() > offset + framesize:
+                    break
+        except EOFError:
+            pass
+        return None
+
+    def frames(self, msgid=None, source=None, target=None, starttime=None, endtime=None):
+        """
+        generator decoding all frames matching the filters (see: cht_binindex.find()).
+         yields (record, nickname, values)
+        """
+        for number in self._index.find(msgid, source, target, starttime, endtime):
+            decoded = self.decode_frame(number)
+            (nickname, values) = decoded if decoded != None else ("", None)
+            yield (self._index[number], nickname, values)
+
+    def close(self):
+        self._source.close()
+
+#--- class cht_binlogseeker end ---#
+################################################
+
+if __name__ == "__main__":
+    import sys
+    print("-------------------- do some binindex-checks -------------------------")
+    if len(sys.argv) < 2:
+        print("usage: ht_binindex.py <binlogfile> [configfile]")
+        sys.exit(1)
+    configfile = sys.argv[2] if len(sys.argv) > 2 else "./../etc/config/HT3_db_cfg.xml"
+    indexfile = os.path.join(tempfile.gettempdir(), "ht_binindex_test.idx")
+    count = cht_binindex.create(sys.argv[1], configfile, indexfile)
+    index = cht_binindex(indexfile)
+    print("indexed frames:{0}".format(count))
+    print("+-> OK") if len(index) == count else print("+-> Error")
+    seeker = cht_binlogseeker(sys.argv[1], configfile, index)
+    found = 0
+    for number in range(0, len(index), max(1, len(index) // 100)):
+        if seeker.decode_frame(number) != None:
+            found += 1
+    print("decoded frames found:{0} of {1}".format(found, len(range(0, len(index), max(1, len(index) // 100)))))
+    # read back the stream-bytes of every frame, source and target must be found at indexed offset
+    source = open_source(sys.argv[1])
+    wrong = 0
+    for number in range(len(index)):
+        (offset, frametime, msgid, msgoffset, sourcebyte, targetbyte, framesize) = index[number]
+        source.seek(offset)
+        frame = source.read(framesize)
+        if frame[0:3] == b"#HR":
+            frame = frame[5:]
+        if frame[0] != sourcebyte or frame[1] != targetbyte:
+            wrong += 1
+    source.close()
+    print("frames with wrong offset:{0}".format(wrong))
+    print("+-> OK") if wrong == 0 else print("+-> Error")
+    seeker.close()
+    index.close()
+    os.remove(indexfile)
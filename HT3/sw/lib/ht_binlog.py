@@ -0,0 +1,407 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+#                               binlog-format v2: timestamped frames in compressed blocks,
+#                                writer with file-rotation and reader used as 'filehandle'
+#                                for 'cht_discode'.
+# Ver:0.1.1  / 2026-10-18       writer flushes by timer-thread after 'flushinterval' seconds,
+#                                also if no more data are written (quiet bus).
+#################################################################
+#
+# binlog v2 file-layout (all values little-endian):
+#  file-header : magic 'HTBL', version (H), compression (B), reserved (B), created (d)
+#  block       : compressed-size (I), raw-size (I), frame-count (I), first-time (d), last-time (d)
+#                followed by compressed-size bytes of frames
+#  frame       : time (d), length (H), followed by length bytes of bus-data
+#  time        : wall-clock seconds (epoch), derived from monotonic clock while recording
+#
+import os
+import time
+import zlib
+import lzma
+import bisect
+import struct
+import threading
+
+__author__ = "agent"
+__status__ = "draft"
+
+MAGIC = b"HTBL"
+VERSION = 2
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZMA = 2
+
+FILE_HEADER  = struct.Struct("<4sHBBd")
+BLOCK_HEADER = struct.Struct("<IIIdd")
+FRAME_HEADER = struct.Struct("<dH")
+
+_COMPRESSIONS = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "lzma": COMPRESSION_LZMA}
+
+
+def compression_id(name):
+    """
+    returns the compression-id for name: 'none', 'zlib' or 'lzma'.
+    """
+    try:
+        return _COMPRESSIONS[name.lower()]
+    except KeyError:
+        raise ValueError("ht_binlog.compression_id();Error;unknown compression:{0}".format(name))
+
+
+def _compress(compression, rawdata):
+    if compression == COMPRESSION_ZLIB:
+        return zlib.compress(rawdata, 6)
+    elif compression == COMPRESSION_LZMA:
+        return lzma.compress(rawdata)
+    return rawdata
+
+
+def _decompress(compression, blockdata):
+    if compression == COMPRESSION_ZLIB:
+        return zlib.decompress(blockdata)
+    elif compression == COMPRESSION_LZMA:
+        return lzma.decompress(blockdata)
+    return blockdata
+
+
+def IsBinlogV2(filepath):
+    """
+    returns True if 'filepath' is a binlog-file v2, else False (plain binlog).
+    """
+    try:
+        with open(filepath, "rb") as binfile:
+            return binfile.read(len(MAGIC)) == MAGIC
+    except (IOError, OSError):
+        return False
+
+
+class cht_binlogwriter(object):
+    """
+    Class: cht_binlogwriter.
+     Writes bus-data as timestamped frames to binlog-files v2.
+     Frames are collected and written as one compressed block if 'blocksize'
+     bytes are available or 'flushinterval' seconds are elapsed, checked on
+     'write()' and by a timer-thread (0 := no timer).
+     The file is rotated if 'maxfilesize' bytes or 'maxfileage' seconds are
+     reached (0 := no rotation), rotated files are named: <name>_<YYYYmmdd_HHMMSS><ext>.
+    """
+    def __init__(self, filepath, compression=COMPRESSION_ZLIB, blocksize=65536, flushinterval=60.0,
+                 maxfilesize=0, maxfileage=0.0):
+        self._basepath = filepath
+        self._compression = compression
+        self._blocksize = blocksize
+        self._flushinterval = flushinterval
+        self._maxfilesize = maxfilesize
+        self._maxfileage = maxfileage
+        # wall-clock reference for monotonic timestamps
+        self._wallclock0 = time.time()
+        self._monotonic0 = time.monotonic()
+        self._frames = []
+        self._rawsize = 0
+        self._blocktime = 0.0
+        self._file = None
+        self._filepath = ""
+        self._filesize = 0
+        self._filetime = 0.0
+        # monotonic time of the first frame in block, used by the flush-timer
+        self._blockstart = 0.0
+        self._lock = threading.RLock()
+        self._closed = threading.Event()
+        self.__open()
+        if self._flushinterval > 0:
+            threading.Thread(target=self.__flush_timer, name="binlog_flush_Thread", daemon=True).start()
+
+    def timestamp(self):
+        """
+        returns the current wall-clock time derived from monotonic clock.
+        """
+        return self._wallclock0 + (time.monotonic() - self._monotonic0)
+
+    def filepath(self):
+        """
+        returns the path of the current binlog-file.
+        """
+        return self._filepath
+
+    def __open(self):
+        """
+        opens a new binlog-file and writes the file-header.
+        """
+        now = self.timestamp()
+        if self._maxfilesize > 0 or self._maxfileage > 0:
+            (root, ext) = os.path.splitext(self._basepath)
+            filepath = "{0}_{1}{2}".format(root, time.strftime("%Y%m%d_%H%M%S", time.localtime(now)), ext)
+            count = 1
+            while os.path.exists(filepath):
+                filepath = "{0}_{1}_{2}{3}".format(root, time.strftime("%Y%m%d_%H%M%S", time.localtime(now)), count, ext)
+                count += 1
+        else:
+            filepath = self._basepath
+        self._file = open(filepath, "wb")
+        self._file.write(FILE_HEADER.pack(MAGIC, VERSION, self._compression, 0, now))
+        self._filepath = filepath
+        self._filesize = FILE_HEADER.size
+        self._filetime = now
+
+    def write(self, data, timestamp=None):
+        """
+        appends 'data' (bytes) as frame with 'timestamp' (default: now).
+        """
+        if timestamp == None:
+            timestamp = self.timestamp()
+        with self._lock:
+            if len(self._frames) == 0:
+                self._blocktime = timestamp
+                self._blockstart = time.monotonic()
+            for index in range(0, len(data), 0xffff):
+                part = bytes(data[index:index + 0xffff])
+                self._frames.append((timestamp, part))
+                self._rawsize += FRAME_HEADER.size + len(part)
+            if self._rawsize >= self._blocksize or timestamp - self._blocktime >= self._flushinterval:
+                self.flush()
+
+    def __flush_timer(self):
+        """
+        timer-thread writing the collected frames after 'flushinterval' seconds.
+        """
+        while not self._closed.wait(min(1.0, self._flushinterval)):
+            with self._lock:
+                if len(self._frames) > 0 and time.monotonic() - self._blockstart >= self._flushinterval:
+                    self.flush()
+
+    def flush(self):
+        """
+        writes all collected frames as one block, rotates file if required.
+        """
+        with self._lock:
+            self.__flush()
+
+    def __flush(self):
+        if len(self._frames) == 0 or self._file.closed:
+            return
+        rawdata = b"".join(FRAME_HEADER.pack(frametime, len(part)) + part for (frametime, part) in self._frames)
+        blockdata = _compress(self._compression, rawdata)
+        self._file.write(BLOCK_HEADER.pack(len(blockdata), len(rawdata), len(self._frames),
+                                           self._frames[0][0], self._frames[-1][0]) + blockdata)
+        self._file.flush()
+        self._filesize += BLOCK_HEADER.size + len(blockdata)
+        lasttime = self._frames[-1][0]
+        self._frames = []
+        self._rawsize = 0
+        if (self._maxfilesize > 0 and self._filesize >= self._maxfilesize) or \
+                (self._maxfileage > 0 and lasttime - self._filetime >= self._maxfileage):
+            self._file.close()
+            self.__open()
+
+    def close(self):
+        """
+        writes the collected frames, stops the flush-timer and closes the file.
+        """
+        with self._lock:
+            self._closed.set()
+            self.__flush()
+            self._file.close()
+
+#--- class cht_binlogwriter end ---#
+################################################
+
+
+class cht_binlogreader(object):
+    """
+    Class: cht_binlogreader.
+     Reads the bus-data of a binlog-file v2 as continuous stream, used as
+     'filehandle' for 'cht_discode' like 'ht_bulkdecode.cht_filesource'
+     ('size' bytes of stream from 'start', -1 := up to the end).
+     At end of data some 0x00 bytes are appended once, then 'EOFError' is raised.
+     'position' is the stream-position of the next byte returned (padding included),
+     'time(position)' returns the receive-time of the byte at that stream-position.
+    """
+    _EOF_PADDING = 64
+
+    def __init__(self, filepath, start=0, size=-1):
+        self._file = open(filepath, "rb")
+        header = self._file.read(FILE_HEADER.size)
+        if len(header) < FILE_HEADER.size:
+            self._file.close()
+            raise ValueError("cht_binlogreader();Error;{0} is no binlog-file v2".format(filepath))
+        (magic, version, self._compression, reserved, self.created) = FILE_HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            self._file.close()
+            raise ValueError("cht_binlogreader();Error;{0} is no binlog-file v2".format(filepath))
+
+        # block-table: stream-positions, file-offsets and sizes of all blocks
+        self._blockpositions = []
+        self._blocks = []
+        streamposition = 0
+        fileoffset = FILE_HEADER.size
+        while True:
+            blockheader = self._file.read(BLOCK_HEADER.size)
+            if len(blockheader) < BLOCK_HEADER.size:
+                break
+            (compressed_size, raw_size, framecount, firsttime, lasttime) = BLOCK_HEADER.unpack(blockheader)
+            fileoffset += BLOCK_HEADER.size
+            if fileoffset + compressed_size > os.fstat(self._file.fileno()).st_size:
+                # incomplete block at end of file (recording interrupted)
+                break
+            datasize = raw_size - framecount * FRAME_HEADER.size
+            self._blockpositions.append(streamposition)
+            self._blocks.append((fileoffset, compressed_size, datasize, firsttime, lasttime))
+            streamposition += datasize
+            fileoffset += compressed_size
+            self._file.seek(fileoffset)
+        self._streamsize = streamposition
+        # decoded blocks: {blocknumber: (data, framepositions, frametimes)}
+        self._cache = {}
+        self.bytecount = 0
+        self.seek(start, size)
+
+    def __len__(self):
+        """
+        returns the stream-size (bus-data bytes of all blocks).
+        """
+        return self._streamsize
+
+    def __block(self, number):
+        """
+        returns the decoded block as (data, framepositions, frametimes).
+        """
+        block = self._cache.get(number)
+        if block == None:
+            (fileoffset, compressed_size, datasize, firsttime, lasttime) = self._blocks[number]
+            self._file.seek(fileoffset)
+            rawdata = _decompress(self._compression, self._file.read(compressed_size))
+            parts = []
+            framepositions = []
+            frametimes = []
+            position = self._blockpositions[number]
+            index = 0
+            while index < len(rawdata):
+                (frametime, length) = FRAME_HEADER.unpack_from(rawdata, index)
+                index += FRAME_HEADER.size
+                parts.append(rawdata[index:index + length])
+                framepositions.append(position)
+                frametimes.append(frametime)
+                position += length
+                index += length
+            block = (b"".join(parts), framepositions, frametimes)
+            # keep only the last used blocks
+            if len(self._cache) >= 2:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[number] = block
+        return block
+
+    def seek(self, position, size=-1):
+        """
+        sets the stream-position, 'size' bytes are then readable (-1 := up to the end).
+        """
+        self.position = min(max(0, position), self._streamsize)
+        self._remaining = size
+        self._padded = False
+
+    def read(self, size=-1):
+        if self._padded:
+            raise EOFError("cht_binlogreader.read();end of file")
+        readsize = self._streamsize - self.position if size < 0 else size
+        if self._remaining >= 0:
+            readsize = min(readsize, self._remaining)
+        parts = []
+        position = self.position
+        while readsize > 0 and position < self._streamsize:
+            number = bisect.bisect_right(self._blockpositions, position) - 1
+            (blockdata, framepositions, frametimes) = self.__block(number)
+            index = position - self._blockpositions[number]
+            part = blockdata[index:index + readsize]
+            parts.append(part)
+            position += len(part)
+            readsize -= len(part)
+        block = b"".join(parts)
+        self.bytecount += len(block)
+        if self._remaining >= 0:
+            self._remaining -= len(block)
+        if size < 0 or len(block) < size:
+            block += bytes(cht_binlogreader._EOF_PADDING)
+            self._padded = True
+        self.position += len(block)
+        return block
+
+    def time(self, position):
+        """
+        returns the receive-time of the byte at stream-position, 0.0 := not available.
+        """
+        if position < 0 or position >= self._streamsize:
+            return 0.0
+        number = bisect.bisect_right(self._blockpositions, position) - 1
+        (blockdata, framepositions, frametimes) = self.__block(number)
+        return frametimes[bisect.bisect_right(framepositions, position) - 1]
+
+    def frames(self):
+        """
+        generator for all frames, yields (time, data).
+        """
+        for number in range(len(self._blocks)):
+            (blockdata, framepositions, frametimes) = self.__block(number)
+            start = self._blockpositions[number]
+            for (index, frametime) in enumerate(frametimes):
+                end = framepositions[index + 1] if index + 1 < len(framepositions) else start + len(blockdata)
+                yield (frametime, blockdata[framepositions[index] - start:end - start])
+
+    def close(self):
+        self._file.close()
+
+#--- class cht_binlogreader end ---#
+################################################
+
+if __name__ == "__main__":
+    import tempfile
+    print("-------------------- do some binlog-checks -------------------------")
+    testpath = os.path.join(tempfile.gettempdir(), "ht_binlog_test.htb")
+    payload = bytes(range(256)) * 40
+    for compression in (COMPRESSION_NONE, COMPRESSION_ZLIB, COMPRESSION_LZMA):
+        writer = cht_binlogwriter(testpath, compression=compression, blocksize=1000)
+        for index in range(0, len(payload), 37):
+            writer.write(payload[index:index + 37], timestamp=1000.0 + index)
+        writer.close()
+        reader = cht_binlogreader(testpath)
+        data = b""
+        try:
+            while True:
+                data += reader.read(100)
+        except EOFError:
+            pass
+        ok = data[:len(payload)] == payload and len(reader) == len(payload)
+        ok = ok and reader.time(0) == 1000.0 and reader.time(37 * 10 + 5) == 1000.0 + 37 * 10
+        reader.seek(5000, 10)
+        ok = ok and reader.read(10) == payload[5000:5010]
+        print("compression:{0} size:{1} ".format(compression, os.path.getsize(testpath)), end="")
+        print("+-> OK") if ok else print("+-> Error")
+        reader.close()
+    # flush-timer writes the block without further write()
+    writer = cht_binlogwriter(testpath, flushinterval=0.2)
+    writer.write(payload[0:100])
+    time.sleep(1.5)
+    reader = cht_binlogreader(testpath)
+    print("flush-timer: bytes:{0} ".format(len(reader)), end="")
+    print("+-> OK") if len(reader) == 100 else print("+-> Error")
+    reader.close()
+    writer.close()
+    print("IsBinlogV2:", IsBinlogV2(testpath))
+    os.remove(testpath)
@@ -0,0 +1,530 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+#                               headless bulk-decoding of binlog-files to columnar
+#                                output per syspart (CSV and optional NumPy '.npy').
+# Ver:0.2    / 2026-10-18       decode_parallel() added, binlog sharded at chunk-boundaries
+#                                and decoded with 'ProcessPoolExecutor'.
+#                               cht_filesource with 'start' and 'size', padding on short read.
+# Ver:0.3    / 2026-10-18       binlog-files v2 (see: ht_binlog.py) supported.
+# Ver:0.4    / 2026-10-18       decode_parallel(): message-type detected once and preset in shards,
+#                                sequential decoding if a shard is not synchronized.
+# Ver:0.4.1  / 2026-10-18       crecording_data: value-changes with set() recorded.
+#################################################################
+
+import os
+import csv
+import time
+import logging
+import concurrent.futures
+import data
+import ht_utils
+import ht_discode
+import ht_binlog
+
+try:
+    import numpy
+    import numpy.lib.format
+except ImportError:
+    # numpy is optional, only CSV-output is available without it
+    numpy = None
+
+__author__ = "agent"
+__status__ = "draft"
+
+
+class cht_filesource(object):
+    """
+    Class: cht_filesource.
+     Read-only binlog-file (or 'size' bytes of it from 'start') used as
+     'filehandle' for 'cht_discode'.
+     At end of data some 0x00 bytes are appended once, so the last messages
+     in raw-buffer are decoded as well. Then 'EOFError' is raised.
+     'position' is the stream-position of the next byte returned (padding included).
+    """
+    _EOF_PADDING = 64
+
+    def __init__(self, filepath, start=0, size=-1, buffersize=1 << 20):
+        self._file = open(filepath, "rb", buffering=buffersize)
+        self._file.seek(start)
+        self._remaining = size
+        self._padded = False
+        self.bytecount = 0
+        self.position = start
+
+    def read(self, size=-1):
+        if self._padded:
+            raise EOFError("cht_filesource.read();end of file")
+        readsize = size
+        if self._remaining >= 0:
+            readsize = self._remaining if size < 0 else min(size, self._remaining)
+        block = self._file.read(readsize)
+        self.bytecount += len(block)
+        if self._remaining >= 0:
+            self._remaining -= len(block)
+        if size < 0 or len(block) < size:
+            block += bytes(cht_filesource._EOF_PADDING)
+            self._padded = True
+        self.position += len(block)
+        return block
+
+    def close(self):
+        self._file.close()
+
+#--- class cht_filesource end ---#
+################################################
+
+
+def open_source(filepath, start=0, size=-1):
+    """
+    returns the 'filehandle' for 'cht_discode' matching the binlog-format:
+     'ht_binlog.cht_binlogreader' for binlog-files v2, else 'cht_filesource'.
+    """
+    if ht_binlog.IsBinlogV2(filepath):
+        return ht_binlog.cht_binlogreader(filepath, start, size)
+    return cht_filesource(filepath, start, size)
+
+
+class crecording_data(data.cdata):
+    """
+    Class: crecording_data.
+     'cdata' recording all value-changing calls done by the decoder, so they can
+     be replayed in the same order to another 'cdata' (see: cht_bulkdecode.decode_parallel()).
+     The hexdump-values are not recorded.
+    """
+    def __init__(self):
+        data.cdata.__init__(self)
+        self._recorded = None
+
+    def start_recording(self):
+        """
+        starts recording, the calls are then available with 'recorded()'.
+        """
+        self._recorded = []
+
+    def recorded(self):
+        """
+        returns the calls recorded since last call as list of (methodname, args).
+        """
+        calls = self._recorded
+        self._recorded = []
+        return calls
+
+    def update(self, nickname, logitem, value=0.0, *args, **kwargs):
+        if self._recorded != None and logitem != "hexdump":
+            self._recorded.append(("update", (nickname, logitem, value)))
+        return data.cdata.update(self, nickname, logitem, value, *args, **kwargs)
+
+    def set(self, handle, value):
+        if self._recorded != None:
+            self._recorded.append(("set", (handle, value)))
+        return data.cdata.set(self, handle, value)
+
+    def heatercircuits_amount(self, hc_counts=0):
+        if self._recorded != None and hc_counts > 0:
+            self._recorded.append(("heatercircuits_amount", (hc_counts,)))
+        return data.cdata.heatercircuits_amount(self, hc_counts)
+
+    def HeaterBusType(self, bustype=None):
+        if self._recorded != None and bustype != None:
+            self._recorded.append(("HeaterBusType", (bustype,)))
+        return data.cdata.HeaterBusType(self, bustype)
+
+    def controller_type(self, c_type=""):
+        if self._recorded != None and len(c_type) > 0:
+            self._recorded.append(("controller_type", (c_type,)))
+        return data.cdata.controller_type(self, c_type)
+
+    def controller_type_nr(self, i_type=-1):
+        if self._recorded != None and i_type != -1:
+            self._recorded.append(("controller_type_nr", (i_type,)))
+        return data.cdata.controller_type_nr(self, i_type)
+
+    def bus_type(self, b_type=""):
+        if self._recorded != None and len(b_type) > 0:
+            self._recorded.append(("bus_type", (b_type,)))
+        return data.cdata.bus_type(self, b_type)
+
+    def busmodulAdr(self, b_modulAdr=""):
+        if self._recorded != None and len(b_modulAdr) > 0:
+            self._recorded.append(("busmodulAdr", (b_modulAdr,)))
+        return data.cdata.busmodulAdr(self, b_modulAdr)
+
+#--- class crecording_data end ---#
+################################################
+
+
+def _shard_logger():
+    logger = logging.getLogger("bulkdecode_shard")
+    if len(logger.handlers) == 0:
+        logger.addHandler(logging.NullHandler())
+        logger.setLevel(logging.WARNING)
+    return logger
+
+
+def detect_transceiver_mode(configfile, binlogfile):
+    """
+    returns True if the binlog-file contains ht_transceiver-messages, else False.
+     The message-type detection of 'cht_discode' is done once at start of file.
+    """
+    logger = _shard_logger()
+    gdata = crecording_data()
+    gdata.read_db_config(configfile, logger=logger)
+    source = open_source(binlogfile)
+    decoder = ht_discode.cht_discode(None, gdata, filehandle=source, logger=logger)
+    try:
+        decoder.discoder()
+    except EOFError:
+        pass
+    finally:
+        source.close()
+    return decoder.transceiver_mode()
+
+
+def _decode_shard(shard):
+    """
+    decodes one shard of a binlog-file in a worker-process.
+     shard := (configfile, binlogfile, start, end, margin, transceiver), end := None for last shard.
+     The message-type 'transceiver' is detected once for the whole file and preset
+     in the decoder, so no detection is done at the arbitrary shard-start.
+     Decoding starts 'margin' bytes before 'start' (warm-up for synchronisation) and
+     stops 'margin' bytes after 'end', so messages crossing the shard-boundaries are complete.
+     Owned are all messages ending at stream-position: start < position <= end.
+     returns (frames, overlap, bytecount) with:
+      frames  := [(position, nickname, recorded calls), ...] for owned messages
+      overlap := positions of decoded messages after 'end' (used for boundary-check)
+    """
+    (configfile, binlogfile, start, end, margin, transceiver) = shard
+    base = max(0, start - margin)
+    size = -1 if end == None else end + margin - base
+    logger = _shard_logger()
+    gdata = crecording_data()
+    gdata.read_db_config(configfile, logger=logger)
+    source = open_source(binlogfile, base, size)
+    decoder = ht_discode.cht_discode(None, gdata, filehandle=source, logger=logger)
+    decoder.transceiver_mode(transceiver)
+    gdata.start_recording()
+    frames = []
+    overlap = []
+    try:
+        while True:
+            (nickname, values) = decoder.discoder()
+            calls = gdata.recorded()
+            if values == None:
+                nickname = ""
+            if len(calls) == 0 and len(nickname) == 0:
+                continue
+            position = source.position - decoder.buffered_bytes()
+            if position <= start:
+                # warm-up, owned by previous shard
+                continue
+            if end != None and position > end:
+                if len(nickname) > 0:
+                    overlap.append(position)
+                continue
+            frames.append((position, nickname, calls))
+    except EOFError:
+        pass
+    finally:
+        source.close()
+    return (frames, overlap, source.bytecount)
+
+
+class cht_columnwriter(object):
+    """
+    Class: cht_columnwriter.
+     Buffered columnar output of one syspart to '<nickname>.csv' and,
+     if numpy is available, to '<nickname>.npy' (structured array).
+     Rows are collected and written with 'flushsize' rows at once.
+    """
+    _STRING_SIZE = 64
+
+    def __init__(self, outputpath, nickname, columns, flushsize=8192, numpy_output=True):
+        self._nickname = nickname
+        self._columns = ["frame"] + list(columns)
+        self._flushsize = flushsize
+        self._rows = []
+        self.rowcount = 0
+        self._csvfile = open(os.path.join(outputpath, nickname + ".csv"), "w", newline="", buffering=1 << 20)
+        self._csvwriter = csv.writer(self._csvfile, delimiter=';')
+        self._csvwriter.writerow(self._columns)
+        self._npypath = None
+        self._partfile = None
+        self._dtype = None
+        if numpy_output and numpy != None:
+            self._npypath = os.path.join(outputpath, nickname + ".npy")
+            self._partfile = open(self._npypath + ".part", "wb", buffering=1 << 20)
+
+    def append(self, frame, values):
+        """
+        appends one row with frame-number and the column-values.
+        """
+        self._rows.append([frame] + values)
+        if len(self._rows) >= self._flushsize:
+            self.flush()
+
+    def __create_dtype(self, row):
+        """
+        returns the structured dtype with column-types taken from 'row'.
+         numbers are written as float64 (None := NaN), all others as strings.
+        """
+        fields = [("frame", "i8")]
+        for (name, value) in zip(self._columns[1:], row[1:]):
+            if value == None or isinstance(value, (int, float)):
+                fields.append((name, "f8"))
+            else:
+                fields.append((name, "U{0}".format(cht_columnwriter._STRING_SIZE)))
+        return numpy.dtype(fields)
+
+    def __convert(self, row):
+        """
+        returns the row as tuple with values matching the dtype.
+        """
+        values = [row[0]]
+        for (index, value) in enumerate(row[1:], 1):
+            if self._dtype[index].kind == 'f':
+                values.append(float(value) if isinstance(value, (int, float)) else float("nan"))
+            else:
+                values.append("" if value == None else str(value))
+        return tuple(values)
+
+    def flush(self):
+        """
+        writes all collected rows.
+        """
+        if len(self._rows) == 0:
+            return
+        self._csvwriter.writerows(self._rows)
+        if self._partfile != None:
+            if self._dtype == None:
+                self._dtype = self.__create_dtype(self._rows[0])
+            array = numpy.array([self.__convert(row) for row in self._rows], dtype=self._dtype)
+            array.tofile(self._partfile)
+        self.rowcount += len(self._rows)
+        self._rows = []
+
+    def close(self):
+        """
+        writes all remaining rows and closes the files.
+         The '.npy'-file is created from the collected part-file.
+        """
+        self.flush()
+        self._csvfile.close()
+        if self._partfile != None:
+            self._partfile.close()
+            partpath = self._npypath + ".part"
+            if self._dtype != None:
+                array = numpy.lib.format.open_memmap(self._npypath, mode="w+", dtype=self._dtype, shape=(self.rowcount,))
+                with open(partpath, "rb") as partfile:
+                    index = 0
+                    while index < self.rowcount:
+                        chunk = numpy.fromfile(partfile, dtype=self._dtype, count=self._flushsize)
+                        array[index:index + len(chunk)] = chunk
+                        index += len(chunk)
+                array.flush()
+                del array
+            os.remove(partpath)
+            self._partfile = None
+
+#--- class cht_columnwriter end ---#
+################################################
+
+
+class cht_bulkdecode(object):
+    """
+    Class: cht_bulkdecode.
+     Headless decoding of binlog-files using 'cht_discode' without GUI and databases.
+     The decoded values are written for each syspart as columns to 'outputpath'.
+    """
+    def __init__(self, configfile, outputpath, numpy_output=True, flushsize=8192, logger=None):
+        """
+        Initialisation with configuration-file (for logitems) and output-directory.
+        """
+        if not os.path.exists(outputpath):
+            os.makedirs(outputpath)
+        try:
+            if logger == None:
+                self._logging = ht_utils.clog().create_logfile(os.path.join(outputpath, "ht_bulkdecode.log"),
+                                                              loglevel=logging.INFO, loggertag="bulkdecode")
+            else:
+                self._logging = logger
+        except:
+            errorstr = "cht_bulkdecode();Error;could not create logfile"
+            print(errorstr)
+            raise EnvironmentError(errorstr)
+
+        self._configfile = configfile
+        self._outputpath = outputpath
+        self._numpy_output = numpy_output and numpy != None
+        if numpy_output and numpy == None:
+            self._logging.warning("cht_bulkdecode();numpy not available, only CSV-output")
+        self._flushsize = flushsize
+        self._gdata = data.cdata()
+        self._gdata.read_db_config(configfile, logger=self._logging)
+        self._writers = {}
+        self._columns = {}
+        self._framecount = 0
+
+    def __writer(self, nickname):
+        """
+        returns the column-writer for syspart, created on first use.
+        """
+        writer = self._writers.get(nickname)
+        if writer == None:
+            columns = self._gdata.getall_sorted_logitem_names(nickname)
+            # hexdump is not written as column
+            self._columns[nickname] = [index for (index, name) in enumerate(columns) if name != "hexdump"]
+            writer = cht_columnwriter(self._outputpath, nickname,
+                                      [columns[index] for index in self._columns[nickname]],
+                                      self._flushsize, self._numpy_output)
+            self._writers[nickname] = writer
+        return writer
+
+    def __emit(self, nickname, values):
+        """
+        writes the values of one decoded message to syspart-writer.
+        """
+        writer = self.__writer(nickname)
+        writer.append(self._framecount, [values[index] for index in self._columns[nickname]])
+        self._framecount += 1
+
+    def decode(self, binlogfile, maxframes=0):
+        """
+        decodes the binlog-file and writes the values of all decoded messages.
+         'maxframes' > 0 stops after that amount of decoded messages.
+         returns statistic: {'frames', 'bytes', 'seconds', 'frames_per_sec'}
+        """
+        source = open_source(binlogfile)
+        decoder = ht_discode.cht_discode(None, self._gdata, filehandle=source, logger=self._logging)
+        frames = 0
+        starttime = time.time()
+        try:
+            while maxframes <= 0 or frames < maxframes:
+                (nickname, values) = decoder.discoder()
+                if values == None or len(nickname) == 0:
+                    continue
+                self.__emit(nickname, values)
+                frames += 1
+        except EOFError:
+            pass
+        finally:
+            source.close()
+        seconds = time.time() - starttime
+        statistic = {"frames": frames,
+                     "bytes": source.bytecount,
+                     "seconds": seconds,
+                     "frames_per_sec": frames / seconds if seconds > 0 else 0.0}
+        self._logging.info("cht_bulkdecode.decode();{0};frames:{1};bytes:{2};seconds:{3:.2f};frames/sec:{4:.0f}".format(
+            binlogfile, frames, source.bytecount, seconds, statistic["frames_per_sec"]))
+        return statistic
+
+    def decode_parallel(self, binlogfile, workers=None, chunksize=4 << 20, margin=64 << 10):
+        """
+        decodes the binlog-file in shards of 'chunksize' bytes with 'workers' processes
+         (default: number of CPUs) and writes the values like 'decode()'.
+         Each shard is decoded with its own 'cdata' and 'cht_discode' starting 'margin' bytes
+         earlier, all value-changes are recorded and replayed here in stream-order,
+         so the output is the same as with sequential decoding.
+         If a shard is not synchronized with the previous one, the binlog-file
+         is decoded sequentially with 'decode()' instead.
+         returns statistic: {'frames', 'bytes', 'seconds', 'frames_per_sec', 'shards'}
+        """
+        source = open_source(binlogfile)
+        filesize = len(source) if isinstance(source, ht_binlog.cht_binlogreader) else os.path.getsize(binlogfile)
+        source.close()
+        transceiver = detect_transceiver_mode(self._configfile, binlogfile)
+        shards = []
+        start = 0
+        while True:
+            end = start + chunksize
+            if end + margin >= filesize:
+                shards.append((self._configfile, binlogfile, start, None, margin, transceiver))
+                break
+            shards.append((self._configfile, binlogfile, start, end, margin, transceiver))
+            start = end
+
+        starttime = time.time()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_decode_shard, shards))
+        # all shards are checked before writing, so a fallback is possible
+        previous_overlap = frozenset()
+        for (index, (shardframes, overlap, shardbytes)) in enumerate(results):
+            if len(previous_overlap) > 0:
+                # first decoded message must be decoded by previous shard as well
+                first = next((position for (position, nickname, calls) in shardframes if len(nickname)), None)
+                if first != None and first <= max(previous_overlap) and not first in previous_overlap:
+                    self._logging.error("cht_bulkdecode.decode_parallel();shard:{0} not synchronized at:{1};decoding sequentially".format(
+                        index, first))
+                    results = None
+                    statistic = self.decode(binlogfile)
+                    statistic["shards"] = 1
+                    return statistic
+            previous_overlap = frozenset(overlap)
+
+        # same preset as done by 'cht_discode' for sequential decoding
+        self._gdata.setall_values2default()
+        frames = 0
+        for (shardframes, overlap, shardbytes) in results:
+            for (position, nickname, calls) in shardframes:
+                # replay value-changes, then write current values like sequential decoding
+                for (methodname, args) in calls:
+                    getattr(self._gdata, methodname)(*args)
+                if len(nickname) > 0:
+                    self.__emit(nickname, self._gdata.values(nickname))
+                    frames += 1
+        seconds = time.time() - starttime
+        statistic = {"frames": frames,
+                     "bytes": filesize,
+                     "seconds": seconds,
+                     "frames_per_sec": frames / seconds if seconds > 0 else 0.0,
+                     "shards": len(shards)}
+        self._logging.info("cht_bulkdecode.decode_parallel();{0};shards:{1};frames:{2};seconds:{3:.2f};frames/sec:{4:.0f};transceiver:{5}".format(
+            binlogfile, len(shards), frames, seconds, statistic["frames_per_sec"], transceiver))
+        return statistic
+
+    def close(self):
+        """
+        writes all remaining values and closes the output-files.
+         returns dictionary {nickname: rowcount}
+        """
+        rowcounts = {}
+        for (nickname, writer) in self._writers.items():
+            writer.close()
+            rowcounts[nickname] = writer.rowcount
+        self._writers = {}
+        return rowcounts
+
+#--- class cht_bulkdecode end ---#
+################################################
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    print("-------------------- do some bulkdecode-checks -------------------------")
+    if len(sys.argv) < 2:
+        print("usage: ht_bulkdecode.py <binlogfile> [configfile]")
+        sys.exit(1)
+    configfile = sys.argv[2] if len(sys.argv) > 2 else "./../etc/config/HT3_db_cfg.xml"
+    outputpath = tempfile.mkdtemp(prefix="ht_bulkdecode_")
+    bulkdecode = cht_bulkdecode(configfile, outputpath)
+    statistic = bulkdecode.decode(sys.argv[1])
+    print(statistic)
+    print(bulkdecode.close())
+    print("output written to:{0}".format(outputpath))
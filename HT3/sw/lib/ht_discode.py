@@ -113,14 +113,61 @@
 #                               __Setheatercircuits_amount() added.
 #                               GetMessageID() modified.
 # Ver:0.6.1  / 2023-10-21       issue:#28 modified MsgID:866 (TS4->TS8)
-
+# Ver:0.6.2  / 2026-10-18       raw-data buffer replaced with 'cht_ringbuffer',
+#                                decoders get zero-copy views of the buffer.
+# Ver:0.6.3  / 2026-10-18       bytewise '__read()' replaced with block-reads
+#                                '__read_block()' (file, serial and socket).
+#                               CRC-search in raw-data handling with 'crc_framesearch()'.
+# Ver:0.6.4  / 2026-10-18       black-sequences compiled to one regex and removed in one pass,
+#                                'add_black_sequence()' added, sequences from configuration.
+# Ver:0.6.5  / 2026-10-18       declarative field-layouts 'msgid_layouts' compiled with
+#                                'ht_msgschema' used for msgID:24,25,677-680,727-734,737-744,
+#                                866 and 868.
+# Ver:0.6.6  / 2026-10-18       dispatch with array-indexed '_dispatch_table' of bound decoders,
+#                                unknown-handler slot and error-counter per msgID.
+# Ver:0.6.7  / 2026-10-18       address- and msgID-filters compiled to 128-entry lookup-tables
+#                                and frozensets, additional entries from configuration.
+# Ver:0.6.8  / 2026-10-18       decode-trace gated with 'isEnabledFor(DEBUG)' and switchable per msgID
+#                                ('trace_msgids()'), deferred logger-formatting,
+#                                '__CreateHexdump()' using 'bytes.hex()'.
+# Ver:0.6.9  / 2026-10-18       buffered_bytes() added.
+# Ver:0.6.10 / 2026-10-18       last_message() and resync() added (used for indexed binlog-access).
+# Ver:0.6.11 / 2026-10-18       decode-statistics per msgID and source-address with cumulated
+#                                decode-time, 'decode_stats()' and 'reset_decode_stats()' added.
+# Ver:0.6.12 / 2026-10-18       transceiver-mode: decoders get the same buffer-view as with the
+#                                former bytewise reading (also bytes behind the message).
+# Ver:0.6.13 / 2026-10-18       '_remove_black_sequences()' removes the same sequences as before
+#                                (order of 'black_sequence', not ending at last byte).
+# Ver:0.6.14 / 2026-10-18       transceiver_mode() added, message-type can be preset.
+# Ver:0.6.15 / 2026-10-18       stream_position() and last_message_position() added, bytes removed
+#                                as black-sequence are counted.
+# Ver:0.6.16 / 2026-10-18       raw-data: CRC-errors counted only for candidate-frames with valid
+#                                source and known msgID, not for every byte while searching.
+# Ver:0.6.17 / 2026-10-18       msgID_52_DomesticHotWater() 'Cbetriebs_zeit' stored only if valid
+#                                (raised UnboundLocalError with byte 14 := 0x89).
+# Ver:0.6.18 / 2026-10-18       fields of 'msgid_layouts' stored with item-handles of 'cdata',
+#                                resolved once in cht_decode()__init__().
+# Ver:0.6.19 / 2026-10-18       values of one message written between cdata.begin_write() and
+#                                end_write(), so cdata-snapshots have all or none of them.
+# Ver:0.6.20 / 2026-10-18       heating-circuit nickname of msgID-ranges from the configured systemparts
+#                                ('__HeatingCircuitNickname()'), msgID:701-704 -> HK5-HK8 if configured,
+#                                messages of not configured heating-circuits are ignored.
+# Ver:0.6.21 / 2026-10-18       raw-data: CRC-error counted once per resync-run, the following discarded
+#                                bytes are not checked again for a candidate-frame.
+
+import os
+import time
+import logging
 import tempfile
+import re
 import serial
 import data
 import db_sqlite
 import ht_utils
 import ht_const
 import ht_proxy_if
+import ht_msgschema
+from ht_msgschema import CHECK_MAXVALUE, SENSOR, BITFLAG, NEG_FF, IN_RANGE, VALID_TEMP
 
 __author__ = "junky-zs"
 __status__ = "draft"
@@ -131,6 +178,98 @@ class cht_decode(ht_utils.cht_utils):
         class cht_decode for decoding heatronic heater-messages.
     """
     oldcrc_8800bc = 0
+
+    ####################################
+    # # field-layouts of messages, compiled by 'ht_msgschema.cht_msgschema'
+      #  key   := layout-key (first msgID of a message-group)
+      #  value := (first_payload_index, [field, ...])
+      #   field := (raw_index, width, logitem, divisor, bitmask, options, debugtag)
+      #   details see: 'ht_msgschema.cht_msgschema'
+      #  converted are the decoders doing only field-extraction with fixed byte-positions:
+      #   24, 25 (heater-device), 677-680, 727-734, 737-744 (heating-circuits), 866, 868 (solar).
+      #  All other decoders are kept, because they have decisions the field-options can't express:
+      #   storing depending on source-/target-address (e.g. 51), on other fields or former messages
+      #   (e.g. 52 sensor-failure detection), mapping to strings and tables (e.g. 2, 190),
+      #   error-code handling (16-19, 191-194, 296) and setup of controller-/bus-type.
+    msgid_layouts = {
+        # heater-device
+        24: (4, [
+            (4,  1, "Tvorlauf_soll",   0,  0,    CHECK_MAXVALUE, ""),
+            (5,  2, "Tvorlauf_ist",    10, 0,    CHECK_MAXVALUE, ""),
+            (8,  1, "Vleistung",       0,  0,    0, ""),
+            (9,  1, "Vmodus",          0,  0x03, 0, ""),
+            (9,  1, "Vbrenner_flamme", 0,  0x08, BITFLAG, ""),
+            (10, 1, None,              0,  0,    0, "Byte10"),
+            (11, 1, "Vbrenner_motor",  0,  0x01, BITFLAG, ""),
+            (11, 1, "Vheizungs_pumpe", 0,  0x20, BITFLAG, ""),
+            (11, 1, "Vspeicher_pumpe", 0,  0x40, BITFLAG, ""),
+            (11, 1, "Vzirkula_pumpe",  0,  0x80, BITFLAG, ""),
+            (13, 2, "Tmischer",        10, 0,    CHECK_MAXVALUE, ""),
+            (15, 2, None,              10, 0,    SENSOR, "WW-buffer temp2"),
+            (17, 2, "Truecklauf",      10, 0,    SENSOR | CHECK_MAXVALUE, ""),
+            (19, 2, None,              10, 0,    SENSOR, "I-current"),
+            (21, 1, "V_pressure",      10, 0,    SENSOR, "pressure"),
+            (22, 2, None,              0,  0,    0, "displaycode"),
+            (24, 2, None,              0,  0,    0, "causecode"),
+            (26, 1, None,              0,  0,    0, "WW-flow"),
+            (27, 1, None,              0,  0,    0, "Byte27"),
+            (28, 1, None,              0,  0,    0, "Byte28"),
+            (29, 2, None,              10, 0,    0, "TAbgass"),
+        ]),
+        25: (4, [
+            (4,  2, "Taussen",          10, 0, NEG_FF | CHECK_MAXVALUE, ""),
+            (13, 1, "Vch_pump_power",   0,  0, 0, ""),
+            (14, 3, "Cbrenner_gesamt",  0,  0, 0, ""),
+            (17, 3, "Cbetrieb_gesamt",  60, 0, 0, ""),
+            (20, 3, None,               0,  0, 0, "betriebszeit_2.Stufe"),
+            (23, 3, "Cbetrieb_heizung", 60, 0, 0, ""),
+            (26, 3, "Cbrenner_heizung", 0,  0, 0, ""),
+            (29, 2, "T_hyd_switch",     10, 0, SENSOR | CHECK_MAXVALUE, "T-Hydr.Weiche"),
+        ]),
+        # heating-circuits
+        677: (6, [
+            (6,  2, "Tist_HK",           10, 0, CHECK_MAXVALUE, ""),
+            (12, 1, "Tsoll_HK",          2,  0, 0, ""),
+            (17, 1, "Vtempera_niveau",   0,  0, 0, ""),
+            (27, 1, "Voperation_status", 0,  0, 0, ""),
+        ]),
+        727: (6, [
+            (6,  1, "V_hk_pumpe",       0,  0, 0, ""),
+            (8,  1, "VMischerstellung", 0,  0, 0, ""),
+            (9,  2, "Tvorlaufmisch_HK", 10, 0, IN_RANGE | CHECK_MAXVALUE, ""),
+            (11, 1, "T_flow_desired",   0,  0, CHECK_MAXVALUE, ""),
+        ]),
+        737: (6, [
+            (6,  1, None, 0, 0, 0, "season"),
+            (7,  1, None, 0, 0, 0, "supply_T"),
+            (8,  1, None, 0, 0, 0, "power"),
+            (9,  1, None, 0, 0, 0, "fast_mode"),
+            (10, 1, None, 0, 0, 0, "Prio"),
+        ]),
+        # solar
+        866: (6, [
+            (6,  2, "Tkollektor",       10, 0, NEG_FF | CHECK_MAXVALUE, ""),
+            (8,  2, "Tspeicher_unten",  10, 0, CHECK_MAXVALUE, ""),
+            (10, 2, "Tspeicher_mid",    10, 0, VALID_TEMP | CHECK_MAXVALUE, "TS3 B10/11"),
+            (14, 2, "Tspeicher_mid",    10, 0, VALID_TEMP | CHECK_MAXVALUE, "TS3 B14/15"),
+            (16, 2, "Tmix_TS4",         10, 0, VALID_TEMP | CHECK_MAXVALUE, "TS4 B16/17"),
+            (20, 2, "Tspeicher_mid",    10, 0, VALID_TEMP | CHECK_MAXVALUE, "TS3 B20/21"),
+            (24, 2, "Tspeicher_mid",    10, 0, VALID_TEMP | CHECK_MAXVALUE, "TS3 B24/25"),
+            (26, 2, "Twtauscher_TS6",   10, 0, VALID_TEMP | CHECK_MAXVALUE, "T-Waermetauscher TS6"),
+            (28, 2, "Theat_return_TS8", 10, 0, VALID_TEMP | CHECK_MAXVALUE, "TS8 B28/29"),
+        ]),
+        868: (6, [
+            (9,  1, "Vkollektor_aus",   0, 0x02, BITFLAG, "collector_deactive"),
+            (9,  1, "Vspeicher_voll",   0, 0x01, BITFLAG, "storage_full"),
+            (15, 1, "V_sol_pump_power", 0, 0,    0, "solarpump power"),
+            (16, 1, "V_ch_optimize",    0, 0,    0, "Optima CH"),
+            (17, 1, "V_dhw_optimize",   0, 0,    0, "Optima DHW"),
+            (18, 1, None,               0, 0,    0, "Reduced DHW temp"),
+            (19, 1, None,               0, 0,    0, "Requ.Actuator power"),
+            (20, 1, "Vsol_pump2_power", 0, 0,    0, "Requ.Reload Pump Power"),
+            (21, 1, "sol_V_spare_1",    0, 0,    0, "MixerPosition VS3"),
+        ]),
+    }
     def __init__(self, gdata, logger=None):
         ht_utils.cht_utils.__init__(self)
         try:
@@ -156,13 +295,38 @@ class cht_decode(ht_utils.cht_utils):
         self.__info_zeit = "--:--:--"
         # save data-object
         self.__gdata = gdata
+        # decode-trace: None := all msgIDs, else frozenset of traced msgIDs
+        self.__trace_msgids = None
         # setup data to already available logging-object
         self.__gdata.setlogger(self._logging)
 
         self.__currentHK_nickname = "HK1"
+        # compiled field-layouts
+        self.__msgschema = ht_msgschema.cht_msgschema(cht_decode.msgid_layouts)
         
         # set default-values read from configuration
         self.__gdata.setall_values2default()
+        # configured heating-circuits {circuit_nr: nickname}
+        self.__heatingcircuits = dict((int(nickname[2:]), nickname)
+                                      for nickname in self.__gdata.systempart_nicknames("HK")
+                                      if nickname[2:].isdigit())
+        # item-handles for all fields of 'msgid_layouts', with max- and default-value
+        #  if the field is checked for maxvalue
+        #  {(nickname, logitem): (handle, maxvalue, defaultvalue)}
+        self.__layout_handles = {}
+        for (first_payload_index, fields) in cht_decode.msgid_layouts.values():
+            for field in fields:
+                logitem = field[2]
+                if logitem == None:
+                    continue
+                for nickname in self.__gdata.getall_nicknames():
+                    handle = self.__gdata.handle(nickname, logitem)
+                    if handle != None and field[5] & CHECK_MAXVALUE:
+                        self.__layout_handles[(nickname, logitem)] = (handle,
+                                                                      self.__gdata.maxvalue(nickname, logitem),
+                                                                      self.__gdata.defaultvalue(nickname, logitem))
+                    elif handle != None and not (nickname, logitem) in self.__layout_handles:
+                        self.__layout_handles[(nickname, logitem)] = (handle, None, None)
 
     def __IsInRange(self, nickname, item, value):
         """
@@ -189,6 +353,37 @@ class cht_decode(ht_utils.cht_utils):
         else:
             return value
 
+    def __DecodeLayout(self, layoutkey, msgtuple, nickname, buffer, length):
+        """
+            decodes and updates all fields defined in 'msgid_layouts[layoutkey]'.
+             returns the debugstring of that fields.
+        """
+        (msgid, offset) = msgtuple
+        (updates, debugstr) = self.__msgschema.decode(layoutkey, offset, buffer, length, self.IsTracing(msgtuple))
+        for (logitem, value, check_maxvalue) in updates:
+            layout_handle = self.__layout_handles.get((nickname, logitem))
+            if layout_handle == None:
+                # item not in configuration, created with update()
+                if check_maxvalue:
+                    value = self.__Check4MaxValue(nickname, logitem, value)
+                self.__gdata.update(nickname, logitem, value)
+            else:
+                (handle, maxvalue, defaultvalue) = layout_handle
+                if check_maxvalue and maxvalue != None and value > maxvalue:
+                    value = defaultvalue
+                self.__gdata.set(handle, value)
+        return debugstr
+
+    def __LayoutIndex(self, first_payload_index, msgtuple, length, raw_index, width=1):
+        """
+            returns the buffer-index of byte 'raw_index' if available in message, else -1.
+        """
+        (msgid, offset) = msgtuple
+        buffer_index = raw_index - offset
+        if first_payload_index <= buffer_index < length - 2 and (length - first_payload_index - 2) >= width:
+            return buffer_index
+        return -1
+
     def __DeviceIsModem(self, device_address):
         """
             returns True if the device-address in defined for 'modems', else False.
@@ -204,31 +399,50 @@ class cht_decode(ht_utils.cht_utils):
         """
         (msgid, offset) = msgtuple
         rtnvalue = ""
-        if isinstance(message, list) and len(message) >= length:
-            hexstr = ""
-            for x in range(0, length):
-                hexstr += format(message[x], "02x") + " "
+        if isinstance(message, (list, bytes, bytearray, memoryview)) and len(message) >= length:
+            hexstr = bytes(message[0:length]).hex(' ') + " " if length > 0 else ""
             rtnvalue = "{0:4}_{1:<2};{2:3}:{3}".format(msgid, offset, nickname, hexstr)
         return rtnvalue
 
+    def trace_msgids(self, msgids=None):
+        """
+            sets the msgIDs (list of int) written to decode-trace in debug-mode.
+             None := all msgIDs (default), [] := none.
+        """
+        self.__trace_msgids = None if msgids == None else frozenset(msgids)
+
+    def IsTracing(self, msgtuple):
+        """
+            returns True if decode-trace is active for msgID, else False.
+        """
+        return self._logging.isEnabledFor(logging.DEBUG) and \
+            (self.__trace_msgids == None or msgtuple[0] in self.__trace_msgids)
+
     def __Debuglog(self, msgtuple, nickname, debugstring, message=None):
         """
             writes the debugstring to the logger.
         """
+        if len(debugstring) == 0 or not self.IsTracing(msgtuple):
+            return
         (msgid, offset) = msgtuple
-        if len(debugstring) > 0:
-            tempstring = ""
-            # search for ';' in debugstring on first position, if not add one
-            if debugstring.find(';') != 0:
-                debugstring = ';' + debugstring
-            if message != None and isinstance(message, list):
-                source = (message[0] & 0x7F)
-                target = (message[1] & 0x7F)
-                tempstring = "{0:4}_{1:<2};{2};S{3:02x};T{4:02x}{5}".format(msgid, offset, nickname, source, target, debugstring)
-            else:
-                tempstring = "{0:4}_{1:<2};{2};S{3:02x};T{4:02x}{5}".format(msgid, offset, nickname, 0, 0, debugstring)
-            # write to logger in debug-mode
-            self._logging.debug(tempstring)
+        # search for ';' in debugstring on first position, if not add one
+        if debugstring.find(';') != 0:
+            debugstring = ';' + debugstring
+        if message != None and isinstance(message, (list, bytes, bytearray, memoryview)):
+            source = (message[0] & 0x7F)
+            target = (message[1] & 0x7F)
+        else:
+            (source, target) = (0, 0)
+        # write to logger in debug-mode, formatting is done by logger
+        self._logging.debug("%4d_%-2d;%s;S%02x;T%02x%s", msgid, offset, nickname, source, target, debugstring)
+
+    def __HeatingCircuitNickname(self, circuit_nr, sourcetarget_tuple):
+        """ returns the nickname of heating-circuit 'circuit_nr' (1...n) and sets the amount
+             of heatercircuits, None if that heating-circuit is not configured """
+        nickname = self.__heatingcircuits.get(circuit_nr)
+        if nickname != None and circuit_nr > 1:
+            self.__Setheatercircuits_amount(sourcetarget_tuple, circuit_nr)
+        return nickname
 
     def __Setheatercircuits_amount(self, sourcetarget_tuple, circuit_nr):
         """ set the amount of heatercircuits if message is broadcasted """
@@ -303,6 +517,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:2 -> Businformation.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "DT"
         (msgid, offset) = msgtuple
         if self._IsRequestCall(buffer):
@@ -489,40 +704,49 @@ class cht_decode(ht_utils.cht_utils):
                     if (sourcedevice == 0x08 or sourcedevice == 0x09) and i_busteilnehmer == 95:
                         self.__gdata.bus_type(str_busteilnehmer)
 
-                    debugstr += ";Bus-Response Source:{0:02x}(h) to Target:{1:02x}(h)".format(sourcedevice, targetdevice)
-                    debugstr += " ;1.Busteilnehmer:{0};Typ:{1}".format(i_busteilnehmer, str_busteilnehmer)
+                    if tracing:
+                        debugstr += ";Bus-Response Source:{0:02x}(h) to Target:{1:02x}(h)".format(sourcedevice, targetdevice)
+                        debugstr += " ;1.Busteilnehmer:{0};Typ:{1}".format(i_busteilnehmer, str_busteilnehmer)
 
                     if raw_index == 5 and msg_bytecount >= 1:
                         i_softwarefamilie = buffer[buffer_index]
-                        debugstr += ";Softwarefamilie:{0}".format(i_softwarefamilie)
+                        if tracing:
+                            debugstr += ";Softwarefamilie:{0}".format(i_softwarefamilie)
 
                     if raw_index == 6 and msg_bytecount >= 1:
                         i_softwareversion = buffer[buffer_index]
-                        debugstr += ";Softwareversion:{0}\n".format(i_softwareversion)
+                        if tracing:
+                            debugstr += ";Softwareversion:{0}\n".format(i_softwareversion)
 
                     if raw_index == 7 and msg_bytecount >= 1:
                         i_busteilnehmer = buffer[buffer_index]
-                        debugstr += " ;2.Busteilnehmer:{0}".format(i_busteilnehmer)
+                        if tracing:
+                            debugstr += " ;2.Busteilnehmer:{0}".format(i_busteilnehmer)
 
                     if raw_index == 8 and msg_bytecount >= 1:
                         i_major = buffer[buffer_index]
-                        debugstr += ";2.Major Version:{0}".format(i_major)
+                        if tracing:
+                            debugstr += ";2.Major Version:{0}".format(i_major)
 
                     if raw_index == 9 and msg_bytecount >= 1:
                         i_minor = buffer[buffer_index]
-                        debugstr += ";2.Minor Version:{0}\n".format(i_minor)
+                        if tracing:
+                            debugstr += ";2.Minor Version:{0}\n".format(i_minor)
 
                     if raw_index == 10 and msg_bytecount >= 1:
                         i_busteilnehmer = buffer[buffer_index]
-                        debugstr += " ;3.Busteilnehmer:{0}".format(i_busteilnehmer)
+                        if tracing:
+                            debugstr += " ;3.Busteilnehmer:{0}".format(i_busteilnehmer)
 
                     if raw_index == 11 and msg_bytecount >= 1:
                         i_major = buffer[buffer_index]
-                        debugstr += ";3.Major Version:{0}".format(i_major)
+                        if tracing:
+                            debugstr += ";3.Major Version:{0}".format(i_major)
 
                     if raw_index == 12 and msg_bytecount >= 1:
                         i_minor = buffer[buffer_index]
-                        debugstr += ";3.Minor Version:{0}\n".format(i_minor)
+                        if tracing:
+                            debugstr += ";3.Minor Version:{0}\n".format(i_minor)
 
                     if raw_index == 13 and msg_bytecount >= 1:
                         i_marke = buffer[buffer_index]
@@ -536,7 +760,8 @@ class cht_decode(ht_utils.cht_utils):
                             strmarke = "Buderus"
                         else:
                             strmarke = str(i_marke)
-                        debugstr += " ;Markenzeichen:{0}".format(strmarke)
+                        if tracing:
+                            debugstr += " ;Markenzeichen:{0}".format(strmarke)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, "bus", buffer, length)
@@ -645,6 +870,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:22 -> Heaterdevice message.
         """
+        tracing = self.IsTracing(msgtuple)
         (msgid, offset) = msgtuple
         Sourcedevice = buffer[0]
         Targetdevice = buffer[1]
@@ -671,47 +897,58 @@ class cht_decode(ht_utils.cht_utils):
                     heater_enable_str="Off"
                     if (heater_enable == 255):
                         heater_enable_str="On"
-                    debugstr += ";heat_enable:{0};TargetDevice(dez.):{1}".format(heater_enable_str, Targetdevice)
+                    if tracing:
+                        debugstr += ";heat_enable:{0};TargetDevice(dez.):{1}".format(heater_enable_str, Targetdevice)
 
                 if raw_index == 5 and msg_bytecount >= 1:
                     i_heater_maxtempvorlauf = int(buffer[buffer_index])
-                    debugstr += ";MaxT_Vorlauf:{0}".format(i_heater_maxtempvorlauf)
+                    if tracing:
+                        debugstr += ";MaxT_Vorlauf:{0}".format(i_heater_maxtempvorlauf)
 
                 if raw_index == 6 and msg_bytecount >= 1:
                     i_heater_maxpower = int(buffer[buffer_index])
-                    debugstr += ";heatmaxp:{0}".format(i_heater_maxpower)
+                    if tracing:
+                        debugstr += ";heatmaxp:{0}".format(i_heater_maxpower)
 
                 if raw_index == 7 and msg_bytecount >= 1:
                     i_heat_limit = int(buffer[buffer_index])
-                    debugstr += ";heatlimit_enable:{0}".format(i_heat_limit)
+                    if tracing:
+                        debugstr += ";heatlimit_enable:{0}".format(i_heat_limit)
 
                 if raw_index == 8 and msg_bytecount >= 1:
                     i_heater_offhysterese = int(buffer[buffer_index])
-                    debugstr += ";offhys:{0}".format(i_heater_offhysterese)
+                    if tracing:
+                        debugstr += ";offhys:{0}".format(i_heater_offhysterese)
 
                 if raw_index == 9 and msg_bytecount >= 1:
                     i_heater_onhysterese = int(buffer[buffer_index])  - 255
-                    debugstr += ";offhys:{0}".format(i_heater_onhysterese)
+                    if tracing:
+                        debugstr += ";offhys:{0}".format(i_heater_onhysterese)
 
                 if raw_index == 10 and msg_bytecount >= 1:
                     i_heater_taktsperre_time = int(buffer[buffer_index])
-                    debugstr += ";Time_taktsperre:{0}".format(i_heater_taktsperre_time)
+                    if tracing:
+                        debugstr += ";Time_taktsperre:{0}".format(i_heater_taktsperre_time)
 
                 if raw_index == 11 and msg_bytecount >= 1:
                     i_heater_pumpmodus = int(buffer[buffer_index])
-                    debugstr += ";pumpmodus:{0}".format(i_heater_pumpmodus)
+                    if tracing:
+                        debugstr += ";pumpmodus:{0}".format(i_heater_pumpmodus)
 
                 if raw_index == 12 and msg_bytecount >= 1:
                     i_nachlaufzeit_pumpe = int(buffer[buffer_index])
-                    debugstr += ";pump_nachlaufzeit:{0}".format(i_nachlaufzeit_pumpe)
+                    if tracing:
+                        debugstr += ";pump_nachlaufzeit:{0}".format(i_nachlaufzeit_pumpe)
 
                 if raw_index == 13 and msg_bytecount >= 1:
                     i_heater_maxpumppower = int(buffer[buffer_index])
-                    debugstr += ";pumpmaxpow:{0}".format(i_heater_maxpumppower)
+                    if tracing:
+                        debugstr += ";pumpmaxpow:{0}".format(i_heater_maxpumppower)
 
                 if raw_index == 14 and msg_bytecount >= 1:
                     i_heater_minpumppower = int(buffer[buffer_index])
-                    debugstr += ";pumpminpow:{0}".format(i_heater_minpumppower)
+                    if tracing:
+                        debugstr += ";pumpminpow:{0}".format(i_heater_minpumppower)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -727,179 +964,57 @@ class cht_decode(ht_utils.cht_utils):
             decoding of msgID:24 -> Heaterdevice message.
         """
         nickname = "HG"
-        (msgid, offset) = msgtuple
-        debugstr = ""
         first_payload_index = 4
 
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-            i_tvorlauf_soll = 0
-            f_tvorlauf_ist = 0.0
-            i_leistung = 0
-            i_betriebsmodus = 0
-            f_ionisationstrom = 0
-            f_tverbrennungsluft = 0
-
-            for buffer_index in range(first_payload_index, length - 2):
-                if raw_index == 4 and msg_bytecount >= 1:
-                    i_tvorlauf_soll = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Tvorlauf_soll", self.__Check4MaxValue(nickname, "Tvorlauf_soll", i_tvorlauf_soll))
-
-                if raw_index == 5 and msg_bytecount >= 2:
-                    f_tvorlauf_ist = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    self.__gdata.update(nickname, "Tvorlauf_ist", self.__Check4MaxValue(nickname, "Tvorlauf_ist", f_tvorlauf_ist))
-
-                if raw_index == 8 and msg_bytecount >= 1:
-                    i_leistung = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Vleistung", i_leistung)
-
-                if raw_index == 9 and msg_bytecount >= 1:
-                    i_betriebsmodus = int(buffer[buffer_index] & 0x03)
-                    self.__gdata.update(nickname, "Vmodus", i_betriebsmodus)
-
-                    # Extract Bitfeld von RAW-Byte 9
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #
-                    #   Bit8: Status Wartungsanforderung    := 0/1
-                    #   Bit7: Status blockierender Fehler   := 0/1
-                    #   Bit6: Status verriegelnder Fehler   := 0/1
-                    #   Bit5: Status Aufheizphase d. HG     := 0/1
-                    #   Bit4: Brennerflamme an              := 0/1
-                    #   Bit3: Status Servicebetrieb         := 0/1
-                    #   Bit2: Warmwasser-Mode deaktiv/aktiv := 0/1
-                    #   Bit1: Heizungs  -Mode deaktiv/aktiv := 0/1
-                    b_brennerflamme = 1 if bool((buffer[buffer_index] & 0x08)) else 0
-                    self.__gdata.update(nickname, "Vbrenner_flamme", b_brennerflamme)
-
-                if raw_index == 10 and msg_bytecount >= 1:
-                    # Extract Bitfeld von Byte 10
-                    #
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #   Bit8: Status Waermeanforderung im Test-modus
-                    #   Bit7: Status Waermeanforderung
-                    #   Bit6: Status WWErkennung
-                    #   Bit5: Status interne Waermeanforderung bei WW
-                    #   Bit4: Status Waermeanforderung fuer WW bei BArt:=Frost
-                    #   Bit3: Status Waermeanforderung bei BArt:=Frost
-                    #   Bit2: Status Waermeanforderung am Schalter
-                    #   Bit1: Status Waermeanforderung im Heizbetrieb
-                    i_statusByte10 = int(buffer[buffer_index])
-                    debugstr += ";Byte10:{0}".format(i_statusByte10)
+            # RAW-Byte 9 Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
+            #   Bit8: Status Wartungsanforderung    := 0/1
+            #   Bit7: Status blockierender Fehler   := 0/1
+            #   Bit6: Status verriegelnder Fehler   := 0/1
+            #   Bit5: Status Aufheizphase d. HG     := 0/1
+            #   Bit4: Brennerflamme an              := 0/1
+            #   Bit3: Status Servicebetrieb         := 0/1
+            #   Bit2: Warmwasser-Mode deaktiv/aktiv := 0/1
+            #   Bit1: Heizungs  -Mode deaktiv/aktiv := 0/1
+            # RAW-Byte 10 Bitfeld:
+            #   Bit8: Status Waermeanforderung im Test-modus
+            #   Bit7: Status Waermeanforderung
+            #   Bit6: Status WWErkennung
+            #   Bit5: Status interne Waermeanforderung bei WW
+            #   Bit4: Status Waermeanforderung fuer WW bei BArt:=Frost
+            #   Bit3: Status Waermeanforderung bei BArt:=Frost
+            #   Bit2: Status Waermeanforderung am Schalter
+            #   Bit1: Status Waermeanforderung im Heizbetrieb
+            # RAW-Byte 11 Bitfeld:
+            #   Bit8: Status Zirkulationspumpe Warmwasser
+            #   Bit7: Status des 3-Wege Ventils 1 := Warmwasser
+            #   Bit6: Status Heizungspumpe
+            #   Bit5: Status des Oelvorwaermer (Gas := 0)
+            #   Bit4: Zuendung des Brenners
+            #   Bit3: Status des Luefter;
+            #   Bit2: 2. Brennstufe
+            #   Bit1: 1. Brennstufe; waehrend Verbrennung 1 mit kurzem Vor- und Nachlauf
+            # RAW-Byte 27 Bitfeld:
+            #   Bit8: Status --
+            #   Bit7: Status --
+            #   Bit6: Status Brenner Relais
+            #   Bit5: Status Zirkulationspumpe
+            #   Bit4: Status Relais im UM
+            #   Bit3: Status Waermepumpe
+            #   Bit2: Status Magnetventil
+            #   Bit1: Status Speicherladepumpe
+            # RAW-Byte 28 Bitfeld:
+            #   Bit8: Status Tastensprerre
+            #   Bit7: test active
+            #   Bit6: Status heater blocked
+            #   Bit5: Status burner start
+            #   Bit4: Status burner enable
+            #   Bit3: Status burner blocking
+            #   Bit2: Status Schaltmodul UM
+            #   Bit1: Status Fuellfunktion
+            debugstr = self.__DecodeLayout(24, msgtuple, nickname, buffer, length)
 
-                if raw_index == 11 and msg_bytecount >= 1:
-                    # Extract Bitfeld von Byte 11
-                    #
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #   Bit8: Status Zirkulationspumpe Warmwasser
-                    #   Bit7: Status des 3-Wege Ventils 1 := Warmwasser
-                    #   Bit6: Status Heizungspumpe
-                    #   Bit5: Status des Oelvorwaermer (Gas := 0)
-                    #   Bit4: Zuendung des Brenners
-                    #   Bit3: Status des Luefter;
-                    #   Bit2: 2. Brennstufe
-                    #   Bit1: 1. Brennstufe; waehrend Verbrennung 1 mit kurzem Vor- und Nachlauf
-                    b_brenner = 1 if(buffer[buffer_index] & 0x01) else 0
-                    b_heizungspumpe = 1 if(buffer[buffer_index] & 0x20) else 0
-                    b_3WegeVentil = 1 if(buffer[buffer_index] & 0x40) else 0
-                    b_zirkulationspumpe = 1 if(buffer[buffer_index] & 0x80) else 0
-                    self.__gdata.update(nickname, "Vbrenner_motor", b_brenner)
-                    self.__gdata.update(nickname, "Vheizungs_pumpe", b_heizungspumpe)
-                    self.__gdata.update(nickname, "Vspeicher_pumpe", b_3WegeVentil)
-                    self.__gdata.update(nickname, "Vzirkula_pumpe", b_zirkulationspumpe)
-
-                if raw_index == 13 and msg_bytecount >= 2:
-                    # current temperatur on storage-cell temp-sensor1
-                    f_tmischer = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    self.__gdata.update(nickname, "Tmischer", self.__Check4MaxValue(nickname, "Tmischer", f_tmischer))
-
-                if raw_index == 15 and msg_bytecount >= 2:
-                    # current temperatur on storage-cell temp-sensor2
-                    i_t2_storagecell = buffer[buffer_index] * 256 + buffer[buffer_index + 1]
-                    debugstr += ";WW-buffer temp2:"
-                    if self.IsSensorAvailable(i_t2_storagecell):
-                        debugstr += "{0}".format(float(i_t2_storagecell / 10))
-                    else:
-                        debugstr += "->NA"
-
-                if raw_index == 17 and msg_bytecount >= 2:
-                    i_truecklauf = buffer[buffer_index] * 256 + buffer[buffer_index + 1]
-                    if self.IsSensorAvailable(i_truecklauf):
-                        f_truecklauf = float(i_truecklauf) / 10
-                        self.__gdata.update(nickname, "Truecklauf", self.__Check4MaxValue(nickname, "Truecklauf", f_truecklauf))
-
-                if raw_index == 19 and msg_bytecount >= 2:
-                    debugstr += ";I-current:"
-                    i_ionisationstrom = buffer[19] * 256 + buffer[20]
-                    if self.IsSensorAvailable(i_ionisationstrom):
-                        debugstr += "{0}".format(float(i_ionisationstrom / 10))
-                    else:
-                        debugstr += "->NA"
-                    
-                if raw_index == 21 and msg_bytecount >= 1:
-                    i_systempressure = buffer[buffer_index]
-                    f_systempressure = float(i_systempressure) / 10
-
-                    debugstr += ";pressure:"
-                    if self.IsSensorAvailable(i_systempressure):
-                        self.__gdata.update(nickname, "V_pressure", f_systempressure)
-                        if self.__IsInRange(nickname, "V_pressure", f_systempressure):
-                            debugstr += "{0} bar".format(f_systempressure)
-                        else:
-                            debugstr += "->!out of range!"
-
-                    else:
-                        debugstr += "->NA"
-
-                if raw_index == 22 and msg_bytecount >= 2:
-                    displaycode = buffer[buffer_index] * 256 + buffer[buffer_index + 1]
-                    debugstr += ";displaycode:{}".format(displaycode)
-
-                if raw_index == 24 and msg_bytecount >= 2:
-                    causecode = int((buffer[buffer_index] * 256) + buffer[buffer_index + 1])
-                    debugstr += ";causecode:{}".format(causecode)
-
-                if raw_index == 26 and msg_bytecount >= 1:
-                    i_WWflow = int(buffer[buffer_index])
-                    debugstr += ";WW-flow:{0}".format(i_WWflow)
-
-                if raw_index == 27 and msg_bytecount >= 1:
-                    # Extract Bitfeld von Byte 10
-                    #
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #   Bit8: Status --
-                    #   Bit7: Status --
-                    #   Bit6: Status Brenner Relais
-                    #   Bit5: Status Zirkulationspumpe
-                    #   Bit4: Status Relais im UM
-                    #   Bit3: Status Waermepumpe
-                    #   Bit2: Status Magnetventil
-                    #   Bit1: Status Speicherladepumpe
-                    i_statusByte27 = int(buffer[buffer_index])
-                    debugstr += ";Byte27:{0}".format(i_statusByte27)
-
-                if raw_index == 28 and msg_bytecount >= 1:
-                    # Extract Bitfeld von Byte 10
-                    #
-                    #   Bitfeld: (Bits von rechts LSB gezaehlt - beginnt mit 1)
-                    #   Bit8: Status Tastensprerre
-                    #   Bit7: test active
-                    #   Bit6: Status heater blocked
-                    #   Bit5: Status burner start
-                    #   Bit4: Status burner enable
-                    #   Bit3: Status burner blocking
-                    #   Bit2: Status Schaltmodul UM
-                    #   Bit1: Status Fuellfunktion
-                    i_statusByte28 = int(buffer[buffer_index])
-                    debugstr += ";Byte28:{0}".format(i_statusByte28)
-
-                if raw_index == 29 and msg_bytecount >= 2:
-                    f_tverbrennungsluft = float(buffer[29] * 256 + buffer[30]) / 10
-                    debugstr += ";TAbgass:{0}".format(f_tverbrennungsluft)
-
-                raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             self.__gdata.update(nickname, "hexdump", hexstr)
             self.__Debuglog(msgtuple, nickname, debugstr, buffer)
@@ -916,71 +1031,22 @@ class cht_decode(ht_utils.cht_utils):
         """
 
         nickname = "HG"
-        (msgid, offset) = msgtuple
-        debugstr = ""
         first_payload_index = 4
 
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-            i_betriebtotal_minuten = 0
-            i_betriebheizung_minuten = 0
-            i_brenner_gesamt_ein = 0
-            i_brenner_heizung_ein = 0
-
-            for buffer_index in range(first_payload_index, length - 2):
-                # read values from buffer and assign them
-                if raw_index == 4 and msg_bytecount >= 2:
-                    if buffer[buffer_index] != 255:
-                        f_tAussen = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    else:
-                        f_tAussen = float(255-buffer[buffer_index + 1]) / (-10)
-                    self.__gdata.update(nickname, "Taussen", self.__Check4MaxValue(nickname, "Taussen", f_tAussen))
-
-                # Rev.: 0.1.7 https://www.mikrocontroller.net/topic/324673#3970615
-                if raw_index == 13 and msg_bytecount >= 1:
-                    i_pumpenleistung = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Vch_pump_power", i_pumpenleistung)
-
-                if raw_index == 14 and msg_bytecount >= 3:
-                    i_brenner_gesamt_ein = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    self.__gdata.update(nickname, "Cbrenner_gesamt", i_brenner_gesamt_ein)
-
-                if raw_index == 17 and msg_bytecount >= 3:
-                    i_betriebtotal_minuten = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    f_betriebtotal_stunden = float(i_betriebtotal_minuten / 60)
-                    self.__gdata.update(nickname, "Cbetrieb_gesamt", f_betriebtotal_stunden)
-
-                if raw_index == 20 and msg_bytecount >= 3:
-                    i_betriebszeit_2stufe = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    # not yet written to database, only for debug-purposes
-                    debugstr += ";betriebszeit_2.Stufe:{}".format(i_betriebszeit_2stufe)
+            # Rev.: 0.1.7 https://www.mikrocontroller.net/topic/324673#3970615
+            #  'Vch_pump_power' on RAW-Byte 13
+            # 'betriebszeit_2.Stufe' not yet written to database, only for debug-purposes
+            debugstr = self.__DecodeLayout(25, msgtuple, nickname, buffer, length)
+
+            # TIst an der hydraulischen Weiche
+            buffer_index = self.__LayoutIndex(first_payload_index, msgtuple, length, 29, 2)
+            if buffer_index >= 0:
+                i_THydrWeiche = buffer[buffer_index] * 256 + buffer[buffer_index + 1]
+                # setup flag for Hydraulic Switch available, used in GUI
+                self.__gdata.IsTempSensor_Hydrlic_Switch(self.IsSensorAvailable(i_THydrWeiche))
 
-                if raw_index == 23 and msg_bytecount >= 3:
-                    i_betriebheizung_minuten = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    f_betriebheizung_stunden = float(i_betriebheizung_minuten / 60)
-                    self.__gdata.update(nickname, "Cbetrieb_heizung", f_betriebheizung_stunden)
-
-                if raw_index == 26 and msg_bytecount >= 3:
-                    i_brenner_heizung_ein = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
-                    self.__gdata.update(nickname, "Cbrenner_heizung", i_brenner_heizung_ein)
-
-                if raw_index == 29 and msg_bytecount >= 2:
-                    # TIst an der hydraulischen Weiche
-                    i_THydrWeiche = buffer[buffer_index] * 256 + buffer[buffer_index + 1]
-                    f_THydrWeiche = float(i_THydrWeiche) / 10
-                    debugstr += ";T-Hydr.Weiche:{}".format(f_THydrWeiche)
-                    if self.IsSensorAvailable(i_THydrWeiche):
-                        self.__gdata.update(nickname, "T_hyd_switch", self.__Check4MaxValue(nickname, "T_hyd_switch", f_THydrWeiche))
-                        # setup flag for Hydraulic Switch available, used in GUI
-                        self.__gdata.IsTempSensor_Hydrlic_Switch(True)
-                    else:
-                        # Hydr.Weiche not available
-                        self.__gdata.IsTempSensor_Hydrlic_Switch(False)
-                
-                raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             self.__gdata.update(nickname, "hexdump", hexstr)
             self.__Debuglog(msgtuple, nickname, debugstr, buffer)
@@ -1007,6 +1073,7 @@ class cht_decode(ht_utils.cht_utils):
              This values are send by IPM/MM Powermoduls to heater-controller,
              the assignment is to systempart "HG".
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HG"
         (msgid, offset) = msgtuple
         self.__currentHK_nickname = nickname
@@ -1028,7 +1095,8 @@ class cht_decode(ht_utils.cht_utils):
                         self.__gdata.update(nickname, "T_hyd_switch", self.__Check4MaxValue(nickname, "T_hyd_switch", f_THydrWeiche))
                         # setup flag for Hydraulic Switch available, used in GUI
                         self.__gdata.IsTempSensor_Hydrlic_Switch(True)
-                    debugstr += ";T_HydraulicDevice:{0}".format(f_THydrWeiche)
+                    if tracing:
+                        debugstr += ";T_HydraulicDevice:{0}".format(f_THydrWeiche)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -1043,6 +1111,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:35 -> Hydraulic device message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HK1"
         (msgid, offset) = msgtuple
 
@@ -1073,24 +1142,29 @@ class cht_decode(ht_utils.cht_utils):
                 if raw_index == 4 and msg_bytecount >= 1:
                     # TSoll hinter der hydraulischen Weiche
                     i_tsoll = buffer[buffer_index]
-                    debugstr += ";TSoll hinter Hydr.Weiche:{0}".format(i_tsoll)
+                    if tracing:
+                        debugstr += ";TSoll hinter Hydr.Weiche:{0}".format(i_tsoll)
                 # if msg-bytes [5] or [6] are > 0 then hc_pump is running
                 if raw_index == 5 and msg_bytecount >= 1:
                     i_leistung_soll = int(buffer[buffer_index])
                     if i_leistung_soll > 0:
                         pump_running_flag += 1
-                    debugstr += ";Leistung:{0}".format(i_leistung_soll)
+                    if tracing:
+                        debugstr += ";Leistung:{0}".format(i_leistung_soll)
                 if raw_index == 6 and msg_bytecount >= 1:
                     i_drehzahl_pumpe_soll = int(buffer[buffer_index])
                     if i_drehzahl_pumpe_soll > 0:
                         pump_running_flag += 1
-                    debugstr += ";Drehzahl:{0}".format(i_drehzahl_pumpe_soll)
+                    if tracing:
+                        debugstr += ";Drehzahl:{0}".format(i_drehzahl_pumpe_soll)
                 if raw_index == 8 and msg_bytecount >= 1:
                     i_betriebsart_heizung = int(buffer[buffer_index])
-                    debugstr += ";Betriebsart:{0}".format(i_betriebsart_heizung)
+                    if tracing:
+                        debugstr += ";Betriebsart:{0}".format(i_betriebsart_heizung)
                 if raw_index == 9 and msg_bytecount >= 2:
                     i_erweiterter_tsoll = int(buffer[buffer_index] + buffer[buffer_index + 1])
-                    debugstr += ";TSoll_erweitert:{0}".format(i_erweiterter_tsoll)
+                    if tracing:
+                        debugstr += ";TSoll_erweitert:{0}".format(i_erweiterter_tsoll)
 
                 raw_index += 1
 
@@ -1137,6 +1211,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:162 -> Display-code message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HG"
         (msgid, offset) = msgtuple
         debugstr = ""
@@ -1164,7 +1239,8 @@ class cht_decode(ht_utils.cht_utils):
             self.__gdata.update(nickname, "hexdump", hexstr)
 
             values = self.__gdata.values(nickname)
-            debugstr += ";displaycode:{};causecode:{}".format(displaycode, causecode)
+            if tracing:
+                debugstr += ";displaycode:{};causecode:{}".format(displaycode, causecode)
             self.__Debuglog(msgtuple, nickname, debugstr, buffer)
             self.__Debuglog(msgtuple, nickname, hexstr, buffer)
             
@@ -1176,6 +1252,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:190 -> Display- and Cause-code message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HG"
         (msgid, offset) = msgtuple
         (source, target) = (buffer[0], buffer[1])
@@ -1235,7 +1312,8 @@ class cht_decode(ht_utils.cht_utils):
                         self.__gdata.update(nickname, "V_causecode", causecode)
                     raw_index += 1
 
-                debugstr += ";displaycode:{};causecode:{}".format(displaycode, causecode)
+                if tracing:
+                    debugstr += ";displaycode:{};causecode:{}".format(displaycode, causecode)
                 self.__Debuglog(msgtuple, nickname, debugstr, buffer)
 
         if (b_nicknameKnown) :
@@ -1266,6 +1344,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:296 -> Error message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HG"
         (msgid, offset) = msgtuple
         debugstr = ""
@@ -1286,11 +1365,13 @@ class cht_decode(ht_utils.cht_utils):
                     # Auswertung display-code
                     displaycode = buffer[buffer_index]*256 + buffer[buffer_index + 1]
                     self.__gdata.update(nickname, "V_displaycode", displaycode)
-                    debugstr += ";displaycode:{}".format(displaycode)
+                    if tracing:
+                        debugstr += ";displaycode:{}".format(displaycode)
                 if raw_index == 8 and msg_bytecount >= 2:
                     causecode = buffer[buffer_index] * 256 + buffer[buffer_index + 1]
                     self.__gdata.update(nickname, "V_causecode", causecode)
-                    debugstr += ";causecode:{}".format(causecode)
+                    if tracing:
+                        debugstr += ";causecode:{}".format(causecode)
                 raw_index += 1
             self.__Debuglog(msgtuple, nickname, debugstr, buffer)
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -1383,6 +1464,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:268 -> heating circuit (1...4) message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HK1"
         (msgid, offset) = msgtuple
         (source, target) = (buffer[0], buffer[1])
@@ -1436,19 +1518,23 @@ class cht_decode(ht_utils.cht_utils):
                         #  bit2 := status relay for mixermotor
                         #  bit3 := mixervalve closed
                         i_IPM_Byte7 = int(buffer[buffer_index])
-                        debugstr += ";status_hcircuit:{0}".format(i_IPM_Byte7)
+                        if tracing:
+                            debugstr += ";status_hcircuit:{0}".format(i_IPM_Byte7)
                     if raw_index == 8 and msg_bytecount >= 1:
                         i_IPM_Mischerstellung = int(buffer[buffer_index])
                         self.__gdata.update(nickname, "VMischerstellung", i_IPM_Mischerstellung)
-                        debugstr += ";mixerposition:{0}%".format(i_IPM_Mischerstellung)
+                        if tracing:
+                            debugstr += ";mixerposition:{0}%".format(i_IPM_Mischerstellung)
                     if raw_index == 9 and msg_bytecount >= 2:
                         f_IPM_VorlaufTemp = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                         if self.IsTempInRange(f_IPM_VorlaufTemp):
                             self.__gdata.update(nickname, "Tvorlaufmisch_HK", self.__Check4MaxValue(nickname, "Tvorlaufmisch_HK", f_IPM_VorlaufTemp))
-                            debugstr += ";IPM T-Ist:{0}".format(f_IPM_VorlaufTemp)
+                            if tracing:
+                                debugstr += ";IPM T-Ist:{0}".format(f_IPM_VorlaufTemp)
                     if raw_index == 11 and msg_bytecount >= 1:
                         i_IPM_SollVorlaufTemp = int(buffer[buffer_index])
-                        debugstr += ";IPM T-Soll Vorlauf:{0}".format(i_IPM_SollVorlaufTemp)
+                        if tracing:
+                            debugstr += ";IPM T-Soll Vorlauf:{0}".format(i_IPM_SollVorlaufTemp)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -1471,17 +1557,9 @@ class cht_decode(ht_utils.cht_utils):
         if length <= 8:
             return ("", None)
 
-        if msgid == 357:
-            nickname = "HK1"
-        if msgid == 358:
-            nickname = "HK2"
-            self.__Setheatercircuits_amount((source,target), 2)
-        if msgid == 359:
-            nickname = "HK3"
-            self.__Setheatercircuits_amount((source,target), 3)
-        if msgid == 360:
-            nickname = "HK4"
-            self.__Setheatercircuits_amount((source,target), 4)
+        nickname = self.__HeatingCircuitNickname(msgid - 356, (source, target))
+        if nickname == None:
+            return ("", None)
         self.__currentHK_nickname = nickname
         first_payload_index = 6
 
@@ -1513,6 +1591,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:367 until 370 -> heating circuit (1...4) message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HK1"
         (msgid, offset) = msgtuple
         (source, target) = (buffer[0], buffer[1])
@@ -1521,17 +1600,9 @@ class cht_decode(ht_utils.cht_utils):
         if length <= 8:
             return ("", None)
 
-        if msgid == 367:
-            nickname = "HK1"
-        if msgid == 368:
-            nickname = "HK2"
-            self.__Setheatercircuits_amount((source,target), 2)
-        if msgid == 369:
-            nickname = "HK3"
-            self.__Setheatercircuits_amount((source,target), 3)
-        if msgid == 370:
-            nickname = "HK4"
-            self.__Setheatercircuits_amount((source,target), 4)
+        nickname = self.__HeatingCircuitNickname(msgid - 366, (source, target))
+        if nickname == None:
+            return ("", None)
         self.__currentHK_nickname = nickname
         debugstr = ""
         first_payload_index = 6
@@ -1545,34 +1616,40 @@ class cht_decode(ht_utils.cht_utils):
                 if raw_index == 6 and msg_bytecount >= 1:
                     i_tempniveau = int(buffer[buffer_index])
                     self.__gdata.update(nickname, "Vtempera_niveau", i_tempniveau)
-                    debugstr += ";temperaturniveau:{0}".format(i_tempniveau)
+                    if tracing:
+                        debugstr += ";temperaturniveau:{0}".format(i_tempniveau)
 
                 if raw_index == 7 and msg_bytecount >= 1:
                     i_operationstatus = int(buffer[buffer_index])
                     self.__gdata.update(nickname, "Voperation_status", i_operationstatus)
-                    debugstr += ";operation_status:{0}".format(i_operationstatus)
+                    if tracing:
+                        debugstr += ";operation_status:{0}".format(i_operationstatus)
 
                 if raw_index == 8 and msg_bytecount >= 2:
                     f_Soll_HK = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                     if self.IsTempInRange(f_Soll_HK):
                         self.__gdata.update(nickname, "Tsoll_HK", f_Soll_HK)
-                    debugstr += ";TSoll_HK:{0}".format(f_Soll_HK)
+                    if tracing:
+                        debugstr += ";TSoll_HK:{0}".format(f_Soll_HK)
 
                 if raw_index == 10 and msg_bytecount >= 2:
                     f_Ist_HK = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                     if self.IsTempInRange(f_Ist_HK):
                         self.__gdata.update(nickname, "Tist_HK", self.__Check4MaxValue(nickname, "Tist_HK", f_Ist_HK))
-                    debugstr += ";TIst_HK:{0}".format(f_Ist_HK)
+                    if tracing:
+                        debugstr += ";TIst_HK:{0}".format(f_Ist_HK)
 
                 if raw_index == 12 and msg_bytecount >= 2:
                     # not stored to database
                     f_Taussen_HK = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";T???_HK:{0}".format(f_Taussen_HK)
+                    if tracing:
+                        debugstr += ";T???_HK:{0}".format(f_Taussen_HK)
 
                 if raw_index == 14 and msg_bytecount >= 1:
                     #2021-02-19 not saved anymore to database
                     i_TsolarSupport = int(buffer[buffer_index])
-                    debugstr += ";TSolarSupport:{0}".format(i_TsolarSupport)
+                    if tracing:
+                        debugstr += ";TSolarSupport:{0}".format(i_TsolarSupport)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -1600,6 +1677,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:596 -> heating circuit message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HK1"
         (msgid, offset) = msgtuple
         self.__currentHK_nickname = nickname
@@ -1625,7 +1703,8 @@ class cht_decode(ht_utils.cht_utils):
                         f_Ist_HK = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                         self.__gdata.update(nickname, "Tist_HK", self.__Check4MaxValue(nickname, "Tist_HK", f_Ist_HK))
 
-                        debugstr += ";Tist:{0}".format(f_Ist_HK)
+                        if tracing:
+                            debugstr += ";Tist:{0}".format(f_Ist_HK)
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             self.__gdata.update(nickname, "hexdump", hexstr)
@@ -1642,6 +1721,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:597 -> heating circuit message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HK1"
         (msgid, offset) = msgtuple
         Sourcedevice = buffer[0]
@@ -1667,7 +1747,8 @@ class cht_decode(ht_utils.cht_utils):
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 1:
                     i_value = int(buffer[buffer_index])
-                    debugstr += ";value:{0}".format(i_value)
+                    if tracing:
+                        debugstr += ";value:{0}".format(i_value)
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             self.__gdata.update(nickname, "hexdump", hexstr)
@@ -1706,46 +1787,16 @@ class cht_decode(ht_utils.cht_utils):
 
         if not self.__DeviceIsModem(buffer[0]):
             self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
-        if msgid == 677:
-            nickname = "HK1"
-        if msgid == 678:
-            nickname = "HK2"
-            self.__Setheatercircuits_amount((source,target), 2)
-        if msgid == 679:
-            nickname = "HK3"
-            self.__Setheatercircuits_amount((source,target), 3)
-        if msgid == 680:
-            nickname = "HK4"
-            self.__Setheatercircuits_amount((source,target), 4)
+        nickname = self.__HeatingCircuitNickname(msgid - 676, (source, target))
+        if nickname == None:
+            return ("", None)
 
         self.__currentHK_nickname = nickname
         first_payload_index = 6
 
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-
-            for buffer_index in range(first_payload_index, length - 2):
-                # read values from buffer and assign them
-                if raw_index == 6 and msg_bytecount >= 2:
-                    f_Ist_HK = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    self.__gdata.update(nickname, "Tist_HK", self.__Check4MaxValue(nickname, "Tist_HK", f_Ist_HK))
-
-                if raw_index == 12 and msg_bytecount >= 1:
-                    f_Soll_HK = float(buffer[buffer_index] / 2)
-                    self.__gdata.update(nickname, "Tsoll_HK", f_Soll_HK)
-
-                if raw_index == 17 and msg_bytecount >= 1:
-                    i_tempniveau = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Vtempera_niveau", i_tempniveau)
-
-                if raw_index == 27 and msg_bytecount >= 1:
-                    i_operationstatus = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "Voperation_status", i_operationstatus)
-
-                raw_index += 1
+            self.__DecodeLayout(677, msgtuple, nickname, buffer, length)
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             self.__gdata.update(nickname, "hexdump", hexstr)
 
@@ -1756,7 +1807,7 @@ class cht_decode(ht_utils.cht_utils):
 
     def msgID_697_704_HeatingCircuit(self, msgtuple, buffer, length):
         """
-            decoding of msgID:697 until 704 -> heating circuit (1...4) message.
+            decoding of msgID:697 until 704 -> heating circuit (1...8) message.
         """
         nickname = "HK1"
         (msgid, offset) = msgtuple
@@ -1769,17 +1820,9 @@ class cht_decode(ht_utils.cht_utils):
         Targetdevice = buffer[1]
         if not self.__DeviceIsModem(buffer[0]):
             self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
-        if msgid == 697:
-            nickname = "HK1"
-        if msgid == 698:
-            nickname = "HK2"
-            self.__Setheatercircuits_amount((source,target), 2)
-        if msgid == 699:
-            nickname = "HK3"
-            self.__Setheatercircuits_amount((source,target), 3)
-        if msgid == 700:
-            nickname = "HK4"
-            self.__Setheatercircuits_amount((source,target), 4)
+        nickname = self.__HeatingCircuitNickname(msgid - 696, (source, target))
+        if nickname == None:
+            return ("", None)
         self.__currentHK_nickname = nickname
         first_payload_index = 6
 
@@ -1823,46 +1866,21 @@ class cht_decode(ht_utils.cht_utils):
 
         if not self.__DeviceIsModem(buffer[0]):
             self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
-        if msgid == 727:
-            nickname = "HK1"
-        if msgid == 728:
-            nickname = "HK2"
-            self.__Setheatercircuits_amount((source,target), 2)
-        if msgid == 729:
-            nickname = "HK3"
-            self.__Setheatercircuits_amount((source,target), 3)
-        if msgid == 730:
-            nickname = "HK4"
-            self.__Setheatercircuits_amount((source,target), 4)
+        nickname = self.__HeatingCircuitNickname(msgid - 726, (source, target))
+        if nickname == None:
+            return ("", None)
         self.__currentHK_nickname = nickname
         first_payload_index = 6
 
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
+            self.__DecodeLayout(727, msgtuple, nickname, buffer, length)
+
+            # mixer-request
+            buffer_index = self.__LayoutIndex(first_payload_index, msgtuple, length, 7)
+            if buffer_index >= 0 and buffer[buffer_index] > 0:
+                self.__gdata.UnmixedFlagHK(nickname, False)
 
-            for buffer_index in range(first_payload_index, length - 2):
-                # read values from buffer and assign them
-                if raw_index == 6 and msg_bytecount >= 1:
-                    i_HK_FlowPump = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "V_hk_pumpe", i_HK_FlowPump)
-                if raw_index == 7 and msg_bytecount >= 1:
-                    i_HK_MixerRequest = int(buffer[buffer_index])
-                    if (i_HK_MixerRequest > 0):
-                        self.__gdata.UnmixedFlagHK(nickname, False)
-                if raw_index == 8 and msg_bytecount >= 1:
-                    i_IPM_Mischerstellung = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "VMischerstellung", i_IPM_Mischerstellung)
-                if raw_index == 9 and msg_bytecount >= 2:
-                    f_IPM_VorlaufTemp = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    if self.IsTempInRange(f_IPM_VorlaufTemp):
-                        self.__gdata.update(nickname, "Tvorlaufmisch_HK", self.__Check4MaxValue(nickname, "Tvorlaufmisch_HK", f_IPM_VorlaufTemp))
-                if raw_index == 11 and msg_bytecount >= 1:
-                    i_tvorlauf_soll = int(buffer[buffer_index])
-                    self.__gdata.update(nickname, "T_flow_desired", self.__Check4MaxValue(nickname, "T_flow_desired", i_tvorlauf_soll))
-                raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             self.__gdata.update(nickname, "hexdump", hexstr)
             values = self.__gdata.values(nickname)
@@ -1885,45 +1903,16 @@ class cht_decode(ht_utils.cht_utils):
 
         if not self.__DeviceIsModem(buffer[0]):
             self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
-        if msgid == 737:
-            nickname = "HK1"
-        if msgid == 738:
-            nickname = "HK2"
-            self.__Setheatercircuits_amount((source,target), 2)
-        if msgid == 739:
-            nickname = "HK3"
-            self.__Setheatercircuits_amount((source,target), 3)
-        if msgid == 740:
-            nickname = "HK4"
-            self.__Setheatercircuits_amount((source,target), 4)
+        nickname = self.__HeatingCircuitNickname(msgid - 736, (source, target))
+        if nickname == None:
+            return ("", None)
         self.__currentHK_nickname = nickname
         debugstr = ""
         first_payload_index = 6
 
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-            msg_bytecount = length - first_payload_index - 2
-
-            for buffer_index in range(first_payload_index, length - 2):
-                # read values from buffer and assign them
-                if raw_index == 6 and msg_bytecount >= 1:
-                    i_req_season = int(buffer[buffer_index])
-                    debugstr += ";season:{0}".format(i_req_season)
-                if raw_index == 7 and msg_bytecount >= 1:
-                    i_supply_temp = int(buffer[buffer_index])
-                    debugstr += ";supply_T:{0}".format(i_supply_temp)
-                if raw_index == 8 and msg_bytecount >= 1:
-                    i_req_power = int(buffer[buffer_index])
-                    debugstr += ";power:{0}".format(i_req_power)
-                if raw_index == 9 and msg_bytecount >= 1:
-                    i_fast_mode = int(buffer[buffer_index])
-                    debugstr += ";fast_mode:{0}".format(i_fast_mode)
-                if raw_index == 10 and msg_bytecount >= 1:
-                    i_prio = int(buffer[buffer_index])
-                    debugstr += ";Prio:{0}".format(i_prio)
-                raw_index += 1
+            debugstr = self.__DecodeLayout(737, msgtuple, nickname, buffer, length)
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             self.__gdata.update(nickname, "hexdump", hexstr)
             self.__Debuglog(msgtuple, nickname, debugstr, buffer)
@@ -1948,17 +1937,9 @@ class cht_decode(ht_utils.cht_utils):
 
         if not self.__DeviceIsModem(buffer[0]):
             self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
-        if msgid == 747:
-            nickname = "HK1"
-        if msgid == 748:
-            nickname = "HK2"
-            self.__Setheatercircuits_amount((source,target), 2)
-        if msgid == 749:
-            nickname = "HK3"
-            self.__Setheatercircuits_amount((source,target), 3)
-        if msgid == 750:
-            nickname = "HK4"
-            self.__Setheatercircuits_amount((source,target), 4)
+        nickname = self.__HeatingCircuitNickname(msgid - 746, (source, target))
+        if nickname == None:
+            return ("", None)
         self.__currentHK_nickname = nickname
         first_payload_index = 6
 
@@ -2055,6 +2036,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:377 until 380 -> heating circuit (1...4) message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HK1"
         (msgid, offset) = msgtuple
         (source, target) = (buffer[0], buffer[1])
@@ -2063,17 +2045,9 @@ class cht_decode(ht_utils.cht_utils):
         if length <= 8:
             return ("", None)
 
-        if msgid == 377:
-            nickname = "HK1"
-        if msgid == 378:
-            nickname = "HK2"
-            self.__Setheatercircuits_amount((source,target), 2)
-        if msgid == 379:
-            nickname = "HK3"
-            self.__Setheatercircuits_amount((source,target), 3)
-        if msgid == 380:
-            nickname = "HK4"
-            self.__Setheatercircuits_amount((source,target), 4)
+        nickname = self.__HeatingCircuitNickname(msgid - 376, (source, target))
+        if nickname == None:
+            return ("", None)
         self.__currentHK_nickname = nickname
         systempart_tag = nickname
         device_address = buffer[0] & 0x7f
@@ -2092,31 +2066,38 @@ class cht_decode(ht_utils.cht_utils):
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 1:
                     i_bauart_HK = buffer[buffer_index]
-                    debugstr += ";bauart_HK:{0}".format(i_bauart_HK)
+                    if tracing:
+                        debugstr += ";bauart_HK:{0}".format(i_bauart_HK)
 
                 if raw_index == 10 and msg_bytecount >= 1:
                     i_betriebsart_HK = buffer[buffer_index]
-                    debugstr += ";betriebsart_HK:{0}".format(i_betriebsart_HK)
+                    if tracing:
+                        debugstr += ";betriebsart_HK:{0}".format(i_betriebsart_HK)
 
                 if raw_index == 11 and msg_bytecount >= 1:
                     i_tempniveau_frost = buffer[buffer_index]
-                    debugstr += ";Tniveau_frost:{0}".format(i_tempniveau_frost)
+                    if tracing:
+                        debugstr += ";Tniveau_frost:{0}".format(i_tempniveau_frost)
 
                 if raw_index == 12 and msg_bytecount >= 1:
                     i_tempniveau_sparen = buffer[buffer_index]
-                    debugstr += ";Tniveau_sparen:{0}".format(i_tempniveau_sparen)
+                    if tracing:
+                        debugstr += ";Tniveau_sparen:{0}".format(i_tempniveau_sparen)
 
                 if raw_index == 13 and msg_bytecount >= 1:
                     i_tempniveau_normal = buffer[buffer_index]
-                    debugstr += ";Tniveau_normal:{0}".format(i_tempniveau_normal)
+                    if tracing:
+                        debugstr += ";Tniveau_normal:{0}".format(i_tempniveau_normal)
 
                 if raw_index == 14 and msg_bytecount >= 1:
                     i_urlaubsprogramm_HK = buffer[buffer_index]
-                    debugstr += ";Urlaubsprogr:{0}".format(i_urlaubsprogramm_HK)
+                    if tracing:
+                        debugstr += ";Urlaubsprogr:{0}".format(i_urlaubsprogramm_HK)
 
                 if raw_index == 15 and msg_bytecount >= 1:
                     i_status_optimierung = buffer[buffer_index]
-                    debugstr += ";Statusoptimier:{0}".format(i_status_optimierung)
+                    if tracing:
+                        debugstr += ";Statusoptimier:{0}".format(i_status_optimierung)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, systempart_tag, buffer, length)
@@ -2145,6 +2126,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:188 -> hybrid message for mixed heater-systems.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "HG"
         (msgid, offset) = msgtuple
         debugstr = ""
@@ -2159,27 +2141,33 @@ class cht_decode(ht_utils.cht_utils):
             for buffer_index in range(first_payload_index, length - 2):
                 if raw_index == 4 and msg_bytecount >= 2:
                     Toben_pufferspeicher = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";Toben_puffer:{0}".format(Toben_pufferspeicher)
+                    if tracing:
+                        debugstr += ";Toben_puffer:{0}".format(Toben_pufferspeicher)
 
                 if raw_index == 6 and msg_bytecount >= 2:
                     Tunten_pufferspeicher = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";Tunten_puffer:{0}".format(Tunten_pufferspeicher)
+                    if tracing:
+                        debugstr += ";Tunten_puffer:{0}".format(Tunten_pufferspeicher)
 
                 if raw_index == 8 and msg_bytecount >= 2:
                     Tvorlauf_verfluessiger = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";Tvorlauf_verfluessiger:{0}".format(Tvorlauf_verfluessiger)
+                    if tracing:
+                        debugstr += ";Tvorlauf_verfluessiger:{0}".format(Tvorlauf_verfluessiger)
 
                 if raw_index == 10 and msg_bytecount >= 2:
                     Truecklauf_verfluessiger = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";Truecklauf_verfluessiger:{0}".format(Truecklauf_verfluessiger)
+                    if tracing:
+                        debugstr += ";Truecklauf_verfluessiger:{0}".format(Truecklauf_verfluessiger)
 
                 if raw_index == 12 and msg_bytecount >= 1:
                     i_betriebsstatus_wpumpe = int(buffer[buffer_index] & 0x01)
-                    debugstr += ";Betriebsstatus Waermepumpe:{0}".format(i_betriebsstatus_wpumpe)
+                    if tracing:
+                        debugstr += ";Betriebsstatus Waermepumpe:{0}".format(i_betriebsstatus_wpumpe)
 
                 if raw_index == 13 and msg_bytecount >= 1:
                     i_betriebsstatus_verdichter = int(buffer[buffer_index] & 0x02)
-                    debugstr += ";Betriebsstatus Verdichter:{0}".format(i_betriebsstatus_verdichter)
+                    if tracing:
+                        debugstr += ";Betriebsstatus Verdichter:{0}".format(i_betriebsstatus_verdichter)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -2323,7 +2311,7 @@ class cht_decode(ht_utils.cht_utils):
                         if buffer[14] != 0x89:
                             i_betriebszeit = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
                             f_betriebszeit_stunden = float(i_betriebszeit / 60)
-                        self.__gdata.update(nickname, "Cbetriebs_zeit", f_betriebszeit_stunden)
+                            self.__gdata.update(nickname, "Cbetriebs_zeit", f_betriebszeit_stunden)
                     if raw_index == 17 and msg_bytecount >= 3:
                         # checking of wrong values, store only if valid
                         if buffer[17] != 0x89:
@@ -2423,6 +2411,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:457 until 458 -> Domestic Hot Water(DHW) system 1 and 2 message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "WW"
         (msgid, offset) = msgtuple
         debugstr = ""
@@ -2443,7 +2432,8 @@ class cht_decode(ht_utils.cht_utils):
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 1:
                     WWart = buffer[buffer_index]
-                    debugstr += ";WW{};Art WW-Bereitung:{}".format(wwsystemnr, WWart)
+                    if tracing:
+                        debugstr += ";WW{};Art WW-Bereitung:{}".format(wwsystemnr, WWart)
                     self.__Debuglog(msgtuple, nickname, debugstr, buffer)
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -2459,6 +2449,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:467 until 468 -> Domestic Hot Water(DHW) system 1 and 2 message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "WW"
         (msgid, offset) = msgtuple
         debugstr = ""
@@ -2480,7 +2471,8 @@ class cht_decode(ht_utils.cht_utils):
                 # read values from buffer and assign them
                 if raw_index == 6 and msg_bytecount >= 1:
                     betriebsart = buffer[buffer_index]
-                    debugstr += ";WW{};Betriebsart:{}".format(wwsystemnr, betriebsart)
+                    if tracing:
+                        debugstr += ";WW{};Betriebsart:{}".format(wwsystemnr, betriebsart)
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             self.__gdata.update(nickname, "hexdump", hexstr)
@@ -2622,6 +2614,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:857 -> solar message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "SO"
         (msgid, offset) = msgtuple
         self.__gdata.IsSolarAvailable(True)
@@ -2636,22 +2629,28 @@ class cht_decode(ht_utils.cht_utils):
             for buffer_index in range(first_payload_index, length - 2):
                 if raw_index == 6:
                     value_str = 'Yes' if buffer[buffer_index] > 0 else 'No'
-                    debugstr += ";Daily heatup enabled:{}".format(value_str)
+                    if tracing:
+                        debugstr += ";Daily heatup enabled:{}".format(value_str)
                 if raw_index == 7:
                     value_str = 'Yes' if buffer[buffer_index] > 0 else 'No'
-                    debugstr += ";OptionE evaluate T2:{}".format(value_str)
+                    if tracing:
+                        debugstr += ";OptionE evaluate T2:{}".format(value_str)
                 if raw_index == 8:
                     value_str = 'Yes' if buffer[buffer_index] > 0 else 'No'
-                    debugstr += ";OptionE evaluate T6:{}".format(value_str)
+                    if tracing:
+                        debugstr += ";OptionE evaluate T6:{}".format(value_str)
                 if raw_index == 9:
                     value_str = 'Yes' if buffer[buffer_index] > 0 else 'No'
-                    debugstr += ";OptionE evaluate TB:{}".format(value_str)
+                    if tracing:
+                        debugstr += ";OptionE evaluate TB:{}".format(value_str)
                 if raw_index == 10:
                     value_str = 'Yes' if buffer[buffer_index] > 0 else 'No'
-                    debugstr += ";OptionE evaluate TC:{}".format(value_str)
+                    if tracing:
+                        debugstr += ";OptionE evaluate TC:{}".format(value_str)
                 if raw_index == 11:
                     value_str = 'Yes' if buffer[buffer_index] > 0 else 'No'
-                    debugstr += ";OptionE termal desinfect enabled:{}".format(value_str)
+                    if tracing:
+                        debugstr += ";OptionE termal desinfect enabled:{}".format(value_str)
 
                 raw_index += 1
             
@@ -2662,6 +2661,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:858 -> solar message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "SO"
         (msgid, offset) = msgtuple
         self.__gdata.IsSolarAvailable(True)
@@ -2676,13 +2676,16 @@ class cht_decode(ht_utils.cht_utils):
             for buffer_index in range(first_payload_index, length - 2):
                 if raw_index == 6:
                     f_tempvalue = float(buffer[buffer_index] / 10)
-                    debugstr += ";Kollektor max temperatur:{}".format(f_tempvalue)
+                    if tracing:
+                        debugstr += ";Kollektor max temperatur:{}".format(f_tempvalue)
                 if raw_index == 13:
                     f_tempvalue = float(buffer[buffer_index] / 10)
-                    debugstr += ";Kollektor1 switchoff tempdiff:{}".format(f_tempvalue)
+                    if tracing:
+                        debugstr += ";Kollektor1 switchoff tempdiff:{}".format(f_tempvalue)
                 if raw_index == 14:
                     f_tempvalue = float(buffer[buffer_index] / 10)
-                    debugstr += ";Kollektor1 switchon tempdiff:{}".format(f_tempvalue)
+                    if tracing:
+                        debugstr += ";Kollektor1 switchon tempdiff:{}".format(f_tempvalue)
                 raw_index += 1
             
             self.__Debuglog(msgtuple, nickname, debugstr, buffer)
@@ -2692,6 +2695,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:862, 864 and 865 -> solar message Options.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "SO"
         (msgid, offset) = msgtuple
         if not self.__DeviceIsModem(buffer[0]):
@@ -2716,26 +2720,33 @@ class cht_decode(ht_utils.cht_utils):
                 # read values from buffer and assign them
                 if raw_index == 6:
                     if msgid == 862:
-                        debugstr += ";MaxCylBTemp:{}".format(buffer[buffer_index])
+                        if tracing:
+                            debugstr += ";MaxCylBTemp:{}".format(buffer[buffer_index])
                     if msgid == 864:
-                        debugstr += ";FrostProtectTemp:{}".format(buffer[buffer_index])
+                        if tracing:
+                            debugstr += ";FrostProtectTemp:{}".format(buffer[buffer_index])
                     if msgid == 865:
-                        debugstr += ";MaxSinkTemp:{}".format(buffer[buffer_index])
+                        if tracing:
+                            debugstr += ";MaxSinkTemp:{}".format(buffer[buffer_index])
 
                 # SwitchOffTemDiff.
                 if raw_index == 7:
                     if msgid == 865:
-                        debugstr += ";MaxSrcTemp:{}".format(float(buffer[buffer_index]/10))
+                        if tracing:
+                            debugstr += ";MaxSrcTemp:{}".format(float(buffer[buffer_index]/10))
                     else:
-                        debugstr += ";SwitchOffTempDiff:{}".format(float(buffer[buffer_index]/10))
+                        if tracing:
+                            debugstr += ";SwitchOffTempDiff:{}".format(float(buffer[buffer_index]/10))
                     
 
                 # SwitchOnTemDiff.
                 if raw_index == 8:
                     if msgid == 865:
-                        debugstr += ";MinSrcTemp:{}".format(float(buffer[buffer_index]/10))
+                        if tracing:
+                            debugstr += ";MinSrcTemp:{}".format(float(buffer[buffer_index]/10))
                     else:
-                        debugstr += ";SwitchOnTempDiff:{}".format(float(buffer[buffer_index]/10))
+                        if tracing:
+                            debugstr += ";SwitchOnTempDiff:{}".format(float(buffer[buffer_index]/10))
 
                 raw_index += 1
 
@@ -2751,155 +2762,62 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:866 -> solar message.
         """
+        tracing = self.IsTracing(msgtuple)
         nickname = "SO"
-        (msgid, offset) = msgtuple
         if not self.__DeviceIsModem(buffer[0]):
           self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
 
-        debugstr = ""
         first_payload_index = 6
         msg_bytecount = length - first_payload_index - 2
 
         # length > first index + crc-byte + break-byte
         if (length > first_payload_index + 2) and (msg_bytecount >= 2):
-            # init values
-            raw_index = offset + first_payload_index
-            f_kollektor = 0.0
-            f_speicherunten = 0.0
-            # following sensor-values preset to: 
-            #  sensor not available := 0x8000
-            f_speichermitte = float(0x8000)
-            f_second_kollektor = float(0x8000)
-            f_speichermix = float(0x8000)
-            f_speicher2_unten = float(0x8000)
-            f_wtauscher = float(0x8000)
-            f_heat_return = float(0x8000)
-
-            for buffer_index in range(first_payload_index, length - 2):
-                # read values from buffer and assign them
-                # sensor TS1
-                if raw_index == 6:
-                    if buffer[buffer_index] != 255:
-                        f_kollektor = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    else:
-                        f_kollektor = float(255 - buffer[buffer_index + 1]) / (-10)
-                    self.__gdata.update(nickname, "Tkollektor", self.__Check4MaxValue(nickname, "Tkollektor", f_kollektor))
-
-                # sensor TS2
-                if raw_index == 8:
-                    f_speicherunten = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    self.__gdata.update(nickname, "Tspeicher_unten", self.__Check4MaxValue(nickname, "Tspeicher_unten", f_speicherunten))
-
-                # sensor TS3 as Solar-Option on bytes: 10/11 or 14/15 or 20/21 or 24/25
-                if raw_index == 10:
-                    f_speichermitte = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";TS3 B10/11:"
-                    if self.IsTemperaturInValidRange(f_speichermitte):
-                        debugstr += "{0}".format(f_speichermitte)
-                        self.__gdata.update(nickname, "Tspeicher_mid", self.__Check4MaxValue(nickname, "Tspeicher_mid", f_speichermitte))
-                    else:
-                        debugstr += "->NA"
-
-                if raw_index == 14:
-                    f_speichermitte = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";TS3 B14/15:"
-                    if self.IsTemperaturInValidRange(f_speichermitte):
-                        debugstr += "{0}".format(f_speichermitte)
-                        self.__gdata.update(nickname, "Tspeicher_mid", self.__Check4MaxValue(nickname, "Tspeicher_mid", f_speichermitte))
-                    else:
-                        debugstr += "->NA"
-
-                if raw_index == 20:
-                    f_speichermitte = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";TS3 B20/21:"
-                    if self.IsTemperaturInValidRange(f_speichermitte):
-                        debugstr += "{0}".format(f_speichermitte)
-                        self.__gdata.update(nickname, "Tspeicher_mid", self.__Check4MaxValue(nickname, "Tspeicher_mid", f_speichermitte))
-                    else:
-                        debugstr += "->NA"
-
-                if raw_index == 24:
-                    f_speichermitte = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";TS3 B24/25:"
-                    if self.IsTemperaturInValidRange(f_speichermitte):
-                        debugstr += "{0}".format(f_speichermitte)
-                        self.__gdata.update(nickname, "Tspeicher_mid", self.__Check4MaxValue(nickname, "Tspeicher_mid", f_speichermitte))
-                    else:
-                        debugstr += "->NA"
-
-                # sensor TS7 secondary collector-field temperatur
-                if raw_index == 12:
-                    i_second_kollektor = int(buffer[buffer_index] * 256 + buffer[buffer_index + 1])
-                    f_second_kollektor = float(i_second_kollektor) / 10
-                    debugstr += ";T-Kollektor2 TS7:"
-                    if self.IsTemperaturInValidRange(i_second_kollektor):
+            # sensor TS1, TS2 and
+            #  TS3 as Solar-Option on bytes: 10/11 or 14/15 or 20/21 or 24/25
+            #  TS4 as Solar-Option on bytes: 16/17, TS8 on bytes: 28/29
+            #  TS6 (TS9) as Solar-Option on bytes: 26/27
+            debugstr = self.__DecodeLayout(866, msgtuple, nickname, buffer, length)
+
+            # sensor TS7 secondary collector-field temperatur
+            buffer_index = self.__LayoutIndex(first_payload_index, msgtuple, length, 12, 2)
+            if buffer_index >= 0:
+                i_second_kollektor = int(buffer[buffer_index] * 256 + buffer[buffer_index + 1])
+                f_second_kollektor = float(i_second_kollektor) / 10
+                debugstr += ";T-Kollektor2 TS7:"
+                if self.IsTemperaturInValidRange(i_second_kollektor):
+                    if tracing:
                         debugstr += "{0}".format(f_second_kollektor)
-                        self.__gdata.update(nickname, "T_kollektor2", self.__Check4MaxValue(nickname, "T_kollektor2", f_second_kollektor))
-                    else:
-                        debugstr += "->NA"
-
-                # sensor TS4 as Solar-Option on bytes: 16/17 or 28/29
-                if raw_index == 16:
-                    f_speichermix = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";TS4 B16/17:"
-                    if self.IsTemperaturInValidRange(f_speichermix):
-                        debugstr += "{0}".format(f_speichermix)
-                        self.__gdata.update(nickname, "Tmix_TS4", self.__Check4MaxValue(nickname, "Tmix_TS4", f_speichermix))
-                    else:
-                        debugstr += "->NA"
-
-                if raw_index == 28:
-                    f_speichermix = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";TS8 B28/29:"
-                    if self.IsTemperaturInValidRange(f_speichermix):
-                        debugstr += "{0}".format(f_speichermix)
-                        self.__gdata.update(nickname, "Theat_return_TS8", self.__Check4MaxValue(nickname, "Theat_return_TS8", f_speichermix))
-                    else:
-                        debugstr += "->NA"
-
-                # sensor TS5 as Solar-Option on bytes: 18/19 or 22/23
-                if raw_index == 18:
-                    f_speicher2_unten = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";TS5 B18/19"
-                    if self.IsTemperaturInValidRange(f_speicher2_unten):
-                        debugstr += "{0}".format(f_speicher2_unten)
-                        self.__gdata.update(nickname, "Tspeicher2_unten", self.__Check4MaxValue(nickname, "Tspeicher2_unten", f_speicher2_unten))
-                        self.__gdata.IsSecondBuffer_SO(True)
-                    else:
-                        debugstr += "->NA"
+                    self.__gdata.update(nickname, "T_kollektor2", self.__Check4MaxValue(nickname, "T_kollektor2", f_second_kollektor))
+                else:
+                    debugstr += "->NA"
 
-                if raw_index == 22:
+            # sensor TS5 as Solar-Option on bytes: 18/19 or 22/23
+            for raw_index in (18, 22):
+                buffer_index = self.__LayoutIndex(first_payload_index, msgtuple, length, raw_index, 2)
+                if buffer_index >= 0:
                     f_speicher2_unten = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";TS5 B22/23:"
+                    if tracing:
+                        debugstr += ";TS5 B{0}/{1}:".format(raw_index, raw_index + 1)
                     if self.IsTemperaturInValidRange(f_speicher2_unten):
-                        debugstr += "{0}".format(f_speicher2_unten)
+                        if tracing:
+                            debugstr += "{0}".format(f_speicher2_unten)
                         self.__gdata.update(nickname, "Tspeicher2_unten", self.__Check4MaxValue(nickname, "Tspeicher2_unten", f_speicher2_unten))
                         self.__gdata.IsSecondBuffer_SO(True)
                     else:
                         debugstr += "->NA"
 
-                # sensor TS6 (TS9) as Solar-Option
-                if raw_index == 26:
-                    f_wtauscher = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";T-Waermetauscher TS6:"
-                    if self.IsTemperaturInValidRange(f_wtauscher):
-                        debugstr += "{0}".format(f_wtauscher)
-                        self.__gdata.update(nickname, "Twtauscher_TS6", self.__Check4MaxValue(nickname, "Twtauscher_TS6", f_wtauscher))
-                    else:
-                        debugstr += "->NA"
-
-                # sensor TS8/TS11 as Solar-Option
-                if raw_index == 30:
-                    f_heat_return = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";T-Heiz Ret/SP3 TS8/11:"
-                    if self.IsTemperaturInValidRange(f_heat_return):
+            # sensor TS8/TS11 as Solar-Option
+            buffer_index = self.__LayoutIndex(first_payload_index, msgtuple, length, 30, 2)
+            if buffer_index >= 0:
+                f_heat_return = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
+                debugstr += ";T-Heiz Ret/SP3 TS8/11:"
+                if self.IsTemperaturInValidRange(f_heat_return):
+                    if tracing:
                         debugstr += "{0}".format(f_heat_return)
-                        self.__gdata.update(nickname, "Theat_return_TS8", self.__Check4MaxValue(nickname, "Theat_return_TS8", f_heat_return))
-                        self.__gdata.IsReloadbuffer_Option_IJ_SO(True)
-                    else:
-                        debugstr += "->NA"
-
-                raw_index += 1
+                    self.__gdata.update(nickname, "Theat_return_TS8", self.__Check4MaxValue(nickname, "Theat_return_TS8", f_heat_return))
+                    self.__gdata.IsReloadbuffer_Option_IJ_SO(True)
+                else:
+                    debugstr += "->NA"
 
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             
@@ -2917,6 +2835,7 @@ class cht_decode(ht_utils.cht_utils):
             decoding of msgID:867 -> solar message.
             e.g. 867_0 ;SO :b0 00 ff 00 02 63 80 00 80 00 00 00 80 00 80 00 03 44 00 80 00 b0 00
         """
+        tracing = self.IsTracing(msgtuple)
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
@@ -2940,7 +2859,8 @@ class cht_decode(ht_utils.cht_utils):
                         f_TS12 = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                         debugstr += ";TS12:"
                         if self.IsTemperaturInValidRange(f_TS12):
-                            debugstr += "{0}".format(f_TS12)
+                            if tracing:
+                                debugstr += "{0}".format(f_TS12)
                             self.__gdata.update(nickname, "T_HCountflow_TS12", self.__Check4MaxValue(nickname, "T_HCountflow_TS12", f_TS12))
                         else:
                             debugstr += "->NA"
@@ -2949,7 +2869,8 @@ class cht_decode(ht_utils.cht_utils):
                         f_TS13 = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                         debugstr += ";TS13:"
                         if self.IsTemperaturInValidRange(f_TS13):
-                            debugstr += "{0}".format(f_TS13)
+                            if tracing:
+                                debugstr += "{0}".format(f_TS13)
                             self.__gdata.update(nickname, "T_HCountret_TS13", self.__Check4MaxValue(nickname, "T_HCountret_TS13", f_TS13))
                         else:
                             debugstr += "->NA"
@@ -2958,7 +2879,8 @@ class cht_decode(ht_utils.cht_utils):
                         i_WM1 = int(buffer[buffer_index] * 256 + buffer[buffer_index + 1])
                         debugstr += ";WM1:"
                         if self.IsSensorAvailable(i_WM1):
-                            debugstr += "{0}".format(i_WM1)
+                            if tracing:
+                                debugstr += "{0}".format(i_WM1)
                             self.__gdata.update(nickname, "C_HCount_WM1", i_WM1)
                         else:
                             debugstr += "->NA"
@@ -2967,7 +2889,8 @@ class cht_decode(ht_utils.cht_utils):
                         f_TS15 = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                         debugstr += ";TS15:"
                         if self.IsTemperaturInValidRange(f_TS15):
-                            debugstr += "{0}".format(f_TS15)
+                            if tracing:
+                                debugstr += "{0}".format(f_TS15)
                             self.__gdata.update(nickname, "T_OptF_sink_TS15", self.__Check4MaxValue(nickname, "T_OptF_sink_TS15", f_TS15))
                         else:
                             debugstr += "->NA"
@@ -2976,7 +2899,8 @@ class cht_decode(ht_utils.cht_utils):
                         f_TS14 = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                         debugstr += ";TS14:"
                         if self.IsTemperaturInValidRange(f_TS14):
-                            debugstr += "{0}".format(f_TS14)
+                            if tracing:
+                                debugstr += "{0}".format(f_TS14)
                             self.__gdata.update(nickname, "T_OptF_source_TS14", self.__Check4MaxValue(nickname, "T_OptF_source_TS14", f_TS14))
                         else:
                             debugstr += "->NA"
@@ -2985,7 +2909,8 @@ class cht_decode(ht_utils.cht_utils):
                         f_speicher = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                         debugstr += ";TS10:"
                         if self.IsTemperaturInValidRange(f_speicher):
-                            debugstr += "{0}".format(f_speicher)
+                            if tracing:
+                                debugstr += "{0}".format(f_speicher)
                             self.__gdata.update(nickname, "Tsp1_3_TS10", self.__Check4MaxValue(nickname, "Tsp1_3_TS10", f_speicher))
                             self.__gdata.IsReloadbuffer_Option_IJ_SO(True)
                         else:
@@ -2997,7 +2922,8 @@ class cht_decode(ht_utils.cht_utils):
                                         buffer[buffer_index + 2])
                         debugstr += ";WMCount:"
                         if self.IsSensorAvailable(i_WMcount):
-                            debugstr += "{0}".format(i_WMcount)
+                            if tracing:
+                                debugstr += "{0}".format(i_WMcount)
                             self.__gdata.update(nickname, "C_heatcount_sig", i_WMcount)
                         else:
                             debugstr += "->NA"
@@ -3024,62 +2950,18 @@ class cht_decode(ht_utils.cht_utils):
         """
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
-        (msgid, offset) = msgtuple
         if not self.__DeviceIsModem(buffer[0]):
           self.__gdata.HeaterBusType(ht_const.BUS_TYPE_EMS)
 
-        debugstr = ""
         first_payload_index = 6
 
         # length > first index + crc-byte + break-byte
         if length > first_payload_index + 2:
-            # init values
-            raw_index = offset + first_payload_index
-
-            for buffer_index in range(first_payload_index, length - 2):
-                # read values from buffer and assign them
-                if raw_index == 9:
-                    solar_status = buffer[buffer_index]
-                    i_kollektor_aus = (1 if (solar_status & 0x02) else 0)
-                    i_speicher_voll = (1 if (solar_status & 0x01) else 0)
-                    self.__gdata.update(nickname, "Vkollektor_aus", i_kollektor_aus)
-                    self.__gdata.update(nickname, "Vspeicher_voll", i_speicher_voll)
-                    debugstr += ";collector_deactive:{};storage_full:{}".format(i_kollektor_aus, i_speicher_voll)
-
-                if raw_index == 15:
-                    pump_power = buffer[buffer_index]
-                    self.__gdata.update(nickname,"V_sol_pump_power", pump_power)
-                    debugstr += ";solarpump power:{0}%".format(pump_power)
-
-                if raw_index == 16:
-                    # Solar influence on CH := 868_10_0
-                    self.__gdata.update(nickname,"V_ch_optimize", buffer[buffer_index])
-                    debugstr += ";Optima CH:{}".format(buffer[buffer_index])
-
-                if raw_index == 17:
-                    # Optimazation DHW := 868_11_0
-                    self.__gdata.update(nickname,"V_dhw_optimize", buffer[buffer_index])
-                    debugstr += ";Optima DHW:{}".format(buffer[buffer_index])
-
-                if raw_index == 18:
-                    # Reduced DHW temperatur setup := 868_12_0
-                    debugstr += ";Reduced DHW temp:{}".format(buffer[buffer_index])
-
-                if raw_index == 19:
-                    # Reduced DHW temperatur setup := 868_13_0
-                    debugstr += ";Requ.Actuator power:{}".format(buffer[buffer_index])
-
-                if raw_index == 20:
-                    # Required Reload Pump Power := 868_14_0
-                    self.__gdata.update(nickname,"Vsol_pump2_power", buffer[buffer_index])
-                    debugstr += ";Requ.Reload Pump Power:{}".format(buffer[buffer_index])
-
-                if raw_index == 21:
-                    # Mixer Position := 868_15_0
-                    self.__gdata.update(nickname,"sol_V_spare_1", buffer[buffer_index])
-                    debugstr += ";MixerPosition VS3:{}%".format(buffer[buffer_index])
+            # Solar influence on CH := 868_10_0, Optimazation DHW := 868_11_0
+            # Reduced DHW temperatur setup := 868_12_0 and 868_13_0
+            # Required Reload Pump Power := 868_14_0, Mixer Position := 868_15_0
+            debugstr = self.__DecodeLayout(868, msgtuple, nickname, buffer, length)
 
-                raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
             self.__gdata.update(nickname, "hexdump", hexstr)
             self.__Debuglog(msgtuple, nickname, debugstr, buffer)
@@ -3165,6 +3047,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:874 -> solar message.
         """
+        tracing = self.IsTracing(msgtuple)
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
@@ -3186,27 +3069,32 @@ class cht_decode(ht_utils.cht_utils):
                     # Status VS1 3-Wege Mischer
                     vs1_status = self.Bitstatus(buffer[buffer_index], 2)
                     self.__gdata.update(nickname, "V_3weg_mixer_VS1", vs1_status)
-                    debugstr += ";VS1 status:{0}".format(vs1_status)
+                    if tracing:
+                        debugstr += ";VS1 status:{0}".format(vs1_status)
                 if raw_index == 7:
                     # Status PS2/PS3
                     b_pumpe2 = 1 if (self.Bitstatus(buffer[buffer_index], 2)) else 0
                     self.__gdata.update(nickname, "Vsol_pump2", b_pumpe2)
-                    debugstr += ";PS2/3/4 status:{0}".format(b_pumpe2)
+                    if tracing:
+                        debugstr += ";PS2/3/4 status:{0}".format(b_pumpe2)
                 if raw_index == 10:
                     # Status VS2 3-Wege Mischer
                     speicher_nr = 2 if (self.Bitstatus(buffer[buffer_index], 2)) else 1
                     self.__gdata.update(nickname, "V_3weg_mixer_VS2", speicher_nr)
-                    debugstr += ";speicherNr:{0}".format(speicher_nr)
+                    if tracing:
+                        debugstr += ";speicherNr:{0}".format(speicher_nr)
                 if raw_index == 16:
                     # Status PS1
                     b_pumpe = 1 if (self.Bitstatus(buffer[buffer_index], 2)) else 0
                     self.__gdata.update(nickname, "V_sol_pump", b_pumpe)
-                    debugstr += ";PS1 status:{0}".format(b_pumpe)
+                    if tracing:
+                        debugstr += ";PS1 status:{0}".format(b_pumpe)
                 if raw_index == 17:
                     # Status PS7
                     b_pumpe2 = 1 if (buffer[buffer_index] == 4) else 0
                     self.__gdata.update(nickname, "Vsol_pump2_reload", b_pumpe2)
-                    debugstr += ";PS7 status:{0}".format(b_pumpe2)
+                    if tracing:
+                        debugstr += ";PS7 status:{0}".format(b_pumpe2)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -3223,6 +3111,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:910 -> solar message.
         """
+        tracing = self.IsTracing(msgtuple)
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
@@ -3250,21 +3139,24 @@ class cht_decode(ht_utils.cht_utils):
                                                   buffer[buffer_index + 2] * 256 +
                                                   buffer[buffer_index + 3]) / 10
                     self.__gdata.update(nickname, "V_ertrag_stunde", f_ertrag_letztestunde)
-                    debugstr += ";Ertrag Stunde:{0}Wh".format(f_ertrag_letztestunde)
+                    if tracing:
+                        debugstr += ";Ertrag Stunde:{0}Wh".format(f_ertrag_letztestunde)
                 if raw_index == 10 and msg_bytecount >= 4:
                     f_ertrag_day = float(buffer[buffer_index] * 1048576 +
                                               buffer[buffer_index + 1] * 65536 +
                                               buffer[buffer_index + 2] * 256 +
                                               buffer[buffer_index + 3]) / 1000
                     self.__gdata.update(nickname, "V_ertrag_tag_calc", f_ertrag_day)
-                    debugstr += ";tag:{0}kWh".format(f_ertrag_day)
+                    if tracing:
+                        debugstr += ";tag:{0}kWh".format(f_ertrag_day)
                 if raw_index == 14 and msg_bytecount >= 4:
                     f_ertrag_total = float(buffer[buffer_index] * 1048576 +
                                               buffer[buffer_index + 1] * 65536 +
                                               buffer[buffer_index + 2] * 256 +
                                               buffer[buffer_index + 3]) / 10
                     self.__gdata.update(nickname, "V_ertrag_sum_calc", f_ertrag_total)
-                    debugstr += ";gesamt:{0}kWh".format(f_ertrag_total)
+                    if tracing:
+                        debugstr += ";gesamt:{0}kWh".format(f_ertrag_total)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -3280,6 +3172,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:913 -> solar message.
         """
+        tracing = self.IsTracing(msgtuple)
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
@@ -3307,7 +3200,8 @@ class cht_decode(ht_utils.cht_utils):
                                              buffer[buffer_index + 3])
                     f_laufzeit_stunden = float(i_laufzeit_minuten / 60)
                     self.__gdata.update(nickname, "Claufzeit", f_laufzeit_stunden)
-                    debugstr += ";Laufzeit minuten:{0}".format(i_laufzeit_minuten)
+                    if tracing:
+                        debugstr += ";Laufzeit minuten:{0}".format(i_laufzeit_minuten)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -3343,6 +3237,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:257 -> solar status/option message.
         """
+        tracing = self.IsTracing(msgtuple)
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
@@ -3400,20 +3295,24 @@ class cht_decode(ht_utils.cht_utils):
                 if raw_index == 9 and msg_bytecount >= 1:
                     # Einschalt Temperatur-diff := 257_3_0
                     f_diff = float(buffer[buffer_index]) / 10
-                    debugstr += ";Tdiff Ein:{}".format(f_diff)
+                    if tracing:
+                        debugstr += ";Tdiff Ein:{}".format(f_diff)
 
                 if raw_index == 10 and msg_bytecount >= 1:
                     # Ausschalt Temperatur-diff := 257_4_0
                     f_diff = float(buffer[buffer_index]) / 10
-                    debugstr += ";Tdiff Aus:{}".format(f_diff)
+                    if tracing:
+                        debugstr += ";Tdiff Aus:{}".format(f_diff)
 
                 if raw_index == 11 and msg_bytecount >= 1:
                     # Max Temperatur Kollektor := 257_5_0
-                    debugstr += ";Tmax Kollektor:{}".format(int(buffer[buffer_index]))
+                    if tracing:
+                        debugstr += ";Tmax Kollektor:{}".format(int(buffer[buffer_index]))
 
                 if raw_index == 12 and msg_bytecount >= 1:
                     # Max Temperatur T2 WW-Speicher := 257_6_0
-                    debugstr += ";Tmax T2 WW-Speicher:{}".format(int(buffer[buffer_index]))
+                    if tracing:
+                        debugstr += ";Tmax T2 WW-Speicher:{}".format(int(buffer[buffer_index]))
 
                 if raw_index == 18 and msg_bytecount >= 1:
                     # Betriebsart Solarfunktion := 257_12_0
@@ -3426,7 +3325,8 @@ class cht_decode(ht_utils.cht_utils):
 
                 if raw_index == 19 and msg_bytecount >= 1:
                     # Flaeche 1.Kollektorfeld := 257_13_0
-                    debugstr += ";Flaeche 1.Feld:{}".format(int(buffer[buffer_index]))
+                    if tracing:
+                        debugstr += ";Flaeche 1.Feld:{}".format(int(buffer[buffer_index]))
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -3443,6 +3343,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:259 -> solar message.
         """
+        tracing = self.IsTracing(msgtuple)
         self.__gdata.IsSolarAvailable(True)
         nickname = "SO"
         (msgid, offset) = msgtuple
@@ -3470,19 +3371,22 @@ class cht_decode(ht_utils.cht_utils):
                     i_ofaktorWW = int(buffer[buffer_index])
                     # Optimazation DHW := 259_0_0
                     self.__gdata.update(nickname,"V_dhw_optimize", i_ofaktorWW)
-                    debugstr += ";Optim.Faktor_WW:{0}".format(i_ofaktorWW)
+                    if tracing:
+                        debugstr += ";Optim.Faktor_WW:{0}".format(i_ofaktorWW)
 
                 if raw_index == 7 and msg_bytecount >= 1:
                     # Optimierungsfaktor f. HG und solarer Unterstuetzung  Byte: 7
                     i_ofaktorHG = int(buffer[buffer_index])
                     # Solar influence on CH := 259_1_0
                     self.__gdata.update(nickname,"V_ch_optimize", i_ofaktorHG)
-                    debugstr += ";Optim.Faktor_HG:{0}".format(i_ofaktorHG)
+                    if tracing:
+                        debugstr += ";Optim.Faktor_HG:{0}".format(i_ofaktorHG)
 
                 if raw_index == 8 and msg_bytecount >= 2:
                     i_ertrag_letztestunde = int(buffer[buffer_index] * 256 + buffer[buffer_index + 1])
                     self.__gdata.update(nickname, "V_ertrag_stunde", i_ertrag_letztestunde)
-                    debugstr += ";Ertrag letzte Std.:{0}".format(i_ertrag_letztestunde)
+                    if tracing:
+                        debugstr += ";Ertrag letzte Std.:{0}".format(i_ertrag_letztestunde)
 
                 if raw_index == 10 and msg_bytecount >= 2:
                     # Solarkreis1
@@ -3491,18 +3395,21 @@ class cht_decode(ht_utils.cht_utils):
                     else:
                         f_kollektor = float(255 - buffer[buffer_index + 1]) / (-10)
                     self.__gdata.update(nickname, "Tkollektor", self.__Check4MaxValue(nickname, "Tkollektor", f_kollektor))
-                    debugstr += ";Tkollektor:{0}".format(f_kollektor)
+                    if tracing:
+                        debugstr += ";Tkollektor:{0}".format(f_kollektor)
 
                 if raw_index == 12 and msg_bytecount >= 2:
                     f_speicherunten = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                     self.__gdata.update(nickname, "Tspeicher_unten", self.__Check4MaxValue(nickname, "Tspeicher_unten", f_speicherunten))
-                    debugstr += ";Tspeicher:{0}".format(f_speicherunten)
+                    if tracing:
+                        debugstr += ";Tspeicher:{0}".format(f_speicherunten)
 
                 if raw_index == 14 and msg_bytecount >= 1:
                     # Auswertung solar-pump status
                     b_pumpe = 1 if (buffer[buffer_index] & 0x01) else 0
                     self.__gdata.update(nickname, "V_sol_pump", b_pumpe)
-                    debugstr += ";pump status:{0}".format(b_pumpe)
+                    if tracing:
+                        debugstr += ";pump status:{0}".format(b_pumpe)
                     if b_pumpe:
                         # set power to 100% if solar-pump is on, else 0%
                         self.__gdata.update(nickname, "V_sol_pump_power", 100)
@@ -3515,14 +3422,16 @@ class cht_decode(ht_utils.cht_utils):
                     i_speicher_voll = 1 if(buffer[buffer_index] & 0x04) else 0
                     self.__gdata.update(nickname, "Vkollektor_aus", i_kollektor_aus)
                     self.__gdata.update(nickname, "Vspeicher_voll", i_speicher_voll)
-                    debugstr += ";Kollektor aus:{0}; Speicher voll:{1}".format(i_kollektor_aus, i_speicher_voll)
+                    if tracing:
+                        debugstr += ";Kollektor aus:{0}; Speicher voll:{1}".format(i_kollektor_aus, i_speicher_voll)
 
                 if raw_index == 16 and msg_bytecount >= 3:
                     # Auswertung der Solarlaufzeiten
                     i_laufzeit_minuten = int(buffer[buffer_index] * 65536 + buffer[buffer_index + 1] * 256 + buffer[buffer_index + 2])
                     f_laufzeit_stunden = float(i_laufzeit_minuten / 60)
                     self.__gdata.update(nickname, "Claufzeit", f_laufzeit_stunden)
-                    debugstr += ";laufzeit Min.:{0}".format(i_laufzeit_minuten)
+                    if tracing:
+                        debugstr += ";laufzeit Min.:{0}".format(i_laufzeit_minuten)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -3538,6 +3447,7 @@ class cht_decode(ht_utils.cht_utils):
         """
             decoding of msgID:260 -> solar message.
         """
+        tracing = self.IsTracing(msgtuple)
         self.__gdata.IsSolarAvailable(True)
         nickname    = "SO"
         nickname_HG = "HG"
@@ -3557,13 +3467,15 @@ class cht_decode(ht_utils.cht_utils):
                 if raw_index == 6 and msg_bytecount >= 2:
                     f_t41 = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                     self.__gdata.update(nickname, "Thybrid_buffer", f_t41)
-                    debugstr += ";T3 hybrid_buffer:{0}".format(f_t41)
+                    if tracing:
+                        debugstr += ";T3 hybrid_buffer:{0}".format(f_t41)
 
                 if raw_index == 8 and msg_bytecount >= 2:
                     f_t42 = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
                     # 25.10.2022 new assign to HG
                     self.__gdata.update(nickname_HG, "T_ruecklauf", f_t42)
-                    debugstr += ";T heizruecklauf:{0}".format(f_t42)
+                    if tracing:
+                        debugstr += ";T heizruecklauf:{0}".format(f_t42)
 
                 if raw_index == 14 and msg_bytecount >= 2:
                     f_t2collectorfeld = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
@@ -3571,18 +3483,21 @@ class cht_decode(ht_utils.cht_utils):
                         self.__gdata.update(nickname, "T_kollektor2", f_t2collectorfeld)
                         #setup flag for 2.collector-field values and GUI
                         self.__gdata.IsSecondCollectorValue_SO(True)
-                        debugstr += "; 2.Coll_feld Temperatur:{0}".format(f_t2collectorfeld)
+                        if tracing:
+                            debugstr += "; 2.Coll_feld Temperatur:{0}".format(f_t2collectorfeld)
 
                 if raw_index == 16 and msg_bytecount >= 2:
                     f_t3pufferspeicher = float(buffer[buffer_index] * 256 + buffer[buffer_index + 1]) / 10
-                    debugstr += ";TB buffer_cell top:{0}".format(f_t3pufferspeicher)
+                    if tracing:
+                        debugstr += ";TB buffer_cell top:{0}".format(f_t3pufferspeicher)
 
                 if raw_index == 22 and msg_bytecount >= 1:
                     so_pump_2collector = 1 if (buffer[buffer_index] & 0x04) else 0
                     self.__gdata.update(nickname, "Vsol_pump2", so_pump_2collector)
                     if so_pump_2collector > 0:
                         self.__gdata.IsSecondCollectorValue_SO(True)
-                    debugstr += "; 2.Coll_feld PumpStatus:{0}".format(so_pump_2collector)
+                    if tracing:
+                        debugstr += "; 2.Coll_feld PumpStatus:{0}".format(so_pump_2collector)
 
                 raw_index += 1
             hexstr = self.__CreateHexdump(msgtuple, nickname, buffer, length)
@@ -3694,6 +3609,7 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
     _STATE_PRERUN                   = 3  # preset values before running-mode
     _STATE_TRANSMITTER_MSG_HANDLING = 4  # transmitter-msg handling
     _STATE_PUR_RAWDATA_HANDLING     = 5  # None transmitter-msg handling
+    _MAX_DISPATCH_MSGID             = 2048  # size of dispatch-table, msgIDs are below
 
     def __init__(self, port, commondata, debug=0, filehandle=None, logger=None):
         """
@@ -3739,27 +3655,79 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
         ## protected variables
         self._run_state = cht_discode._STATE_INIT
         # buffer for read bus-data
-        self._rawdata = []
+        self._rawdata = ht_utils.cht_ringbuffer(8192)
+        # max. amount of bytes read at once from interface
+        self._readblocksize = 4096
         self._max_messagesize = 40
         self._ht_transceiver_header_found = False
-
-    def __read(self):
-        """
-            reading bytes from interface.
+        # preset transceiver-mode, header is searched until found (see: transceiver_mode())
+        self._transceiver_sync = False
+        # buffered bytes visible to the decoders in transceiver-mode, limited
+        #  like the former bytewise reading (see: _transceiver_fill())
+        self._transceiver_view = 0
+        # (msgid, offset, source, target, framesize) of last dispatched message
+        self._last_message = None
+        self._last_message_position = 0
+        # stream-position of first buffered byte and [(index, size), ...] of bytes
+        #  removed in front of buffer-index (black-sequences), see: _consume()
+        self._stream_position = 0
+        self._removed_gaps = []
+        # True while bytes are discarded after a candidate-frame with CRC-error (raw-data)
+        self._crc_resync = False
+        # black-sequences: predefined plus configured ones, compiled to one regex
+        self.black_sequence = dict(cht_discode.black_sequence)
+        self._black_sequence_regex = None
+        self._compile_black_sequences()
+        for sequence in commondata.black_sequences():
+            self.add_black_sequence(sequence)
+        # array-indexed dispatching
+        self._dispatch_table = []
+        self._build_dispatch_table()
+        # decoder-errors and decode-statistics per msgID and source-address, see: decode_stats()
+        self.reset_decode_stats()
+        # address- and msgID-filters: predefined plus configured ones, compiled to lookup-tables
+        self.deviceaddress_white_list = list(cht_discode.deviceaddress_white_list)
+        self.deviceadr_2msgid_blacklist = {address: list(msgids) for (address, msgids) in cht_discode.deviceadr_2msgid_blacklist.items()}
+        self.deviceadr_2msgid_mapping = {address: list(msgids) for (address, msgids) in cht_discode.deviceadr_2msgid_mapping.items()}
+        for address in commondata.deviceaddresses():
+            if not address in self.deviceaddress_white_list:
+                self.deviceaddress_white_list.append(address)
+        for (address, msgids) in commondata.msgid_blacklist().items():
+            self.deviceadr_2msgid_blacklist.setdefault(address, []).extend(msgids)
+        for (address, msgids) in commondata.msgid_mapping().items():
+            self.deviceadr_2msgid_mapping.setdefault(address, []).extend(msgids)
+        self._compile_address_filters()
+
+    def __read_block(self, size):
+        """
+            reading at least 'size' bytes from interface into raw-buffer.
+             All bytes already available are read as well, limited to
+             'readblocksize' and the free raw-buffer space.
              That interface can be:
              1. File if 'filehandle' is set,
              2. socket- or port-read else.
+            returns the number of bytes added to raw-buffer.
         """
+        blocksize = min(max(size, self._readblocksize), self._rawdata.free())
         if self.filehandle == None:
-            return ord(self.port.read())
+            if isinstance(self.port, ht_proxy_if.cht_socket_client):
+                readsize = self.port.read_into(self._rawdata.tail(blocksize), size)
+                self._rawdata.commit(readsize)
+                return readsize
+            else:
+                block = self.port.read(min(max(size, self.port.in_waiting), blocksize))
         else:
-            rtn = self.filehandle.read(1)
+            block = self.filehandle.read(blocksize)
 # ###########################
 #zs#only 4 test ############
 # #            import time
 # #            time.sleep(0.001)
 # ###########################
-            return ord(rtn) if len(rtn) > 0 else ord('0')
+            if len(block) < size:
+                # end of file, fill up with '0' like before
+                block += b'0' * (size - len(block))
+        self._rawdata.extend(block)
+        return len(block)
 
     def __dump_rawbuffer(self, size, offset=0):
         """
@@ -3776,56 +3744,216 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
             temptext += format(self._rawdata[dump_index], "02x") + " "
         print(temptext)
 
+    def _compile_address_filters(self):
+        """
+            compiles address-whitelist and msgID-lists to lookup-tables indexed by deviceaddress.
+        """
+        whitelist = frozenset(self.deviceaddress_white_list)
+        # source: whitelisted address, target: whitelisted address or 0 (broadcast)
+        self._valid_source = tuple(address in whitelist for address in range(0x80))
+        self._valid_target = tuple(address == 0 or address in whitelist for address in range(0x80))
+        # None := all msgIDs valid for that address
+        self._msgid_mapping = [None] * 0x80
+        for (address, msgids) in self.deviceadr_2msgid_mapping.items():
+            self._msgid_mapping[address & 0x7f] = frozenset(msgids)
+        self._msgid_blacklist = [frozenset()] * 0x80
+        for (address, msgids) in self.deviceadr_2msgid_blacklist.items():
+            self._msgid_blacklist[address & 0x7f] = frozenset(msgids)
+
+    def add_deviceaddress(self, address):
+        """
+            adds the deviceaddress (0...0x7f) to the address-whitelist.
+        """
+        address &= 0x7f
+        if not address in self.deviceaddress_white_list:
+            self.deviceaddress_white_list.append(address)
+            self._compile_address_filters()
+
+    def add_msgid_blacklist(self, address, msgids):
+        """
+            adds the msgIDs (list of int) to the blacklist of deviceaddress.
+        """
+        self.deviceadr_2msgid_blacklist.setdefault(address & 0x7f, []).extend(msgids)
+        self._compile_address_filters()
+
+    def add_msgid_mapping(self, address, msgids):
+        """
+            adds the msgIDs (list of int) to the valid msgIDs of deviceaddress.
+        """
+        self.deviceadr_2msgid_mapping.setdefault(address & 0x7f, []).extend(msgids)
+        self._compile_address_filters()
+
     def _ValidSourceTargetBytes(self, sourcebyte, targetbyte):
         """
             checking the source- and target-byte for valid range.
         """
-        rtn = False
         # source- and target-bytes with valid addresses
         #  remark: target without request (MSB) set
-        if (sourcebyte > 0x80 and targetbyte < 0x80):
-            # get the deviceaddress from sourcebyte
-            source_deviceaddress = (0x7f & sourcebyte)
-            # compare this bytes to the whitelist
-            if source_deviceaddress in self.deviceaddress_white_list and \
-                (targetbyte == 0 or targetbyte in self.deviceaddress_white_list):
-                rtn = True
-        return rtn
+        return (sourcebyte > 0x80 and targetbyte < 0x80 and
+                self._valid_source[sourcebyte & 0x7f] and self._valid_target[targetbyte])
+
+    def _compile_black_sequences(self):
+        """
+            compiles all black-sequences to one regex, longer sequences first.
+        """
+        sequences = sorted(self.black_sequence.values(), key=len, reverse=True)
+        pattern = b"|".join(re.escape(bytes(sequence)) for sequence in sequences)
+        self._black_sequence_regex = re.compile(pattern)
+
+    def add_black_sequence(self, sequence):
+        """
+            adds the byte-sequence (list of int, bytes) to the black-sequences.
+        """
+        sequence = list(sequence)
+        if len(sequence) > 0 and not sequence in self.black_sequence.values():
+            self.black_sequence[max(self.black_sequence.keys(), default=-1) + 1] = sequence
+            self._compile_black_sequences()
 
-    def _remove_black_sequences(self):
+    def _remove_black_sequences(self, size):
         """
-            removing unwanted bytes-sequences from raw-buffer using predefined black-sequences.
+            removing unwanted bytes-sequences from the first 'size' bytes of raw-buffer
+             using predefined black-sequences.
+             Only sequences ending in front of the last byte are removed and the
+             sequences are checked in order of 'black_sequence', like before.
+             The compiled regex is used as fast pre-check only.
+            returns the remaining size.
         """
+        if size < 2 or self._black_sequence_regex.search(self._rawdata[0:size - 1]) == None:
+            return size
         for value in self.black_sequence.values():
-            while bytearray(value) in bytearray(self._rawdata):
-                try:
-                    found_index = bytearray(self._rawdata).find(bytearray(value))
-#zs$ only 4 test #                   print("-----------------\nFOUND:{0};index:{1};\nraw_data:{2}".format(value, found_index, self._rawdata))
-                except:
-                    found_index = -1
-                if (found_index >= 0) and (len(self._rawdata) > found_index + len(value)):
-                    del self._rawdata[found_index:(found_index + len(value))]
+            sequence = bytes(value)
+            while True:
+                found_index = self._rawdata.find(sequence, 0, size)
+                if (found_index >= 0) and (size > found_index + len(sequence)):
+                    self._remove(found_index, len(sequence))
+                    size -= len(sequence)
+                    self._black_sequence_bytes += len(sequence)
                 else:
                     break
+        return size
+
+    def _build_dispatch_table(self):
+        """
+            builds the array-indexed dispatch-table from 'dispatch' with bound decoders.
+             Not mapped msgIDs are set to the unknown-handler.
+        """
+        unknown_handler = self._dispatch_unknown
+        self._dispatch_table = [unknown_handler] * cht_discode._MAX_DISPATCH_MSGID
+        for (msgid, decoder) in self.dispatch.items():
+            if 0 <= msgid < cht_discode._MAX_DISPATCH_MSGID:
+                self._dispatch_table[msgid] = decoder.__get__(self, cht_discode)
+
+    def _dispatch_unknown(self, msgtuple, buffer, length):
+        """
+            unknown-handler for not mapped msgIDs.
+        """
+        if msgtuple[0] < cht_discode._MAX_DISPATCH_MSGID:
+            self._msgid_unknown[msgtuple[0]] += 1
+        self.msgID_NN_unknown(msgtuple, buffer, length)
+        return ("", None)
+
+    def _dispatch_message(self, msgtuple, buffer, length):
+        """
+            calls the decoder for msgID from dispatch-table.
+             returns (nickname, values) from decoder or ("", None) on errors.
+        """
+        msgid = msgtuple[0]
+        self._source_frames[buffer[0] & 0x7f] += 1
+        if msgid >= cht_discode._MAX_DISPATCH_MSGID:
+            self._msgid_out_of_range += 1
+            return self._dispatch_unknown(msgtuple, buffer, length)
+        self._msgid_frames[msgid] += 1
+        starttime = time.perf_counter()
+        # all values of the message are written together (see: cdata.snapshot())
+        self.data.begin_write()
+        try:
+            return self._dispatch_table[msgid](msgtuple, buffer, length)
+        except Exception as e:
+            self._decoder_errors[msgid] += 1
+            if self._decoder_errors[msgid] == 1:
+                errorstr = "cht_discode._dispatch_message();Error;msgID:{0};<{1}>".format(msgid, e)
+                self._logging.error(errorstr)
+            self.msgID_NN_unknown(msgtuple, buffer, length)
+            return ("", None)
+        finally:
+            self.data.end_write()
+            self._msgid_decodetime[msgid] += time.perf_counter() - starttime
+
+    def decoder_errors(self):
+        """
+            returns a dictionary {msgID: errorcount} of all msgIDs with decoder-errors.
+        """
+        return {msgid: count for (msgid, count) in enumerate(self._decoder_errors) if count > 0}
+
+    def reset_decode_stats(self):
+        """
+            clears all decode-statistics.
+        """
+        self._decoder_errors = [0] * cht_discode._MAX_DISPATCH_MSGID
+        self._msgid_frames = [0] * cht_discode._MAX_DISPATCH_MSGID
+        self._msgid_unknown = [0] * cht_discode._MAX_DISPATCH_MSGID
+        self._msgid_rejects = [0] * cht_discode._MAX_DISPATCH_MSGID
+        self._msgid_decodetime = [0.0] * cht_discode._MAX_DISPATCH_MSGID
+        self._msgid_out_of_range = 0
+        self._source_frames = [0] * 0x80
+        self._source_crc_errors = [0] * 0x80
+        self._source_rejects = [0] * 0x80
+        self._discarded_bytes = 0
+        self._black_sequence_bytes = 0
+        self._stats_starttime = time.time()
+
+    def decode_stats(self):
+        """
+            returns a snapshot of the decode-statistics since start or 'reset_decode_stats()' as dict:
+             'since'               : start-time of statistics (epoch)
+             'discarded_bytes'     : bytes skipped while searching for messages (resync)
+             'black_sequence_bytes': bytes of removed polling-sequences
+             'msgid_out_of_range'  : messages with msgID not handled by dispatch-table
+             'msgids'  : {msgID  : {'frames', 'unknown', 'rejects', 'errors', 'decode_time'}}
+             'sources' : {address: {'frames', 'crc_errors', 'rejects'}}
+            'frames' are the dispatched messages, 'unknown' those without decoder,
+            'rejects' the messages dropped by msgID-blacklist or -mapping and
+            'decode_time' the cumulated decoder-time in seconds.
+            Only msgIDs and addresses with any counter > 0 are returned.
+        """
+        msgids = {}
+        for msgid in range(cht_discode._MAX_DISPATCH_MSGID):
+            if self._msgid_frames[msgid] or self._msgid_rejects[msgid]:
+                msgids[msgid] = {"frames": self._msgid_frames[msgid],
+                                 "unknown": self._msgid_unknown[msgid],
+                                 "rejects": self._msgid_rejects[msgid],
+                                 "errors": self._decoder_errors[msgid],
+                                 "decode_time": self._msgid_decodetime[msgid]}
+        sources = {}
+        for address in range(0x80):
+            if self._source_frames[address] or self._source_crc_errors[address] or self._source_rejects[address]:
+                sources[address] = {"frames": self._source_frames[address],
+                                    "crc_errors": self._source_crc_errors[address],
+                                    "rejects": self._source_rejects[address]}
+        return {"since": self._stats_starttime,
+                "discarded_bytes": self._discarded_bytes,
+                "black_sequence_bytes": self._black_sequence_bytes,
+                "msgid_out_of_range": self._msgid_out_of_range,
+                "msgids": msgids,
+                "sources": sources}
+
+    def _reject_message(self, deviceaddress, msgid):
+        """
+            counts a message dropped by msgID-blacklist or -mapping.
+        """
+        self._source_rejects[deviceaddress & 0x7f] += 1
+        if 0 < msgid < cht_discode._MAX_DISPATCH_MSGID:
+            self._msgid_rejects[msgid] += 1
 
     def _IsValidMessageID(self, deviceaddress, msgid):
         """
             checking msgid, must be > 0 and is compared to predefinitions.
         """
-        isvalid = False
-        if msgid > 0:
-            adr_found = False
-            deviceaddress = deviceaddress & 0x7f
-            for address in self.deviceadr_2msgid_mapping:
-                if deviceaddress == address:
-                    adr_found = True
-                    if msgid in self.deviceadr_2msgid_mapping[address]:
-                        isvalid = True
-                    break
-            # force this to True for all other unmapped device-addresses
-            if adr_found == False:
-                isvalid = True
-        return isvalid
+        if msgid <= 0:
+            return False
+        valid_msgids = self._msgid_mapping[deviceaddress & 0x7f]
+        # force this to True for all other unmapped device-addresses
+        return valid_msgids == None or msgid in valid_msgids
 
     def _IsInBlacklist(self, deviceaddress, msgid):
         """
@@ -3833,40 +3961,121 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
              returns True if messageid is in blacklist for this deviceaddress,
              returns False else.
         """
-        isinlist = False
-        if msgid > 0:
-            adr_found = False
-            deviceaddress = deviceaddress & 0x7f
-            for address in self.deviceadr_2msgid_blacklist:
-                if deviceaddress == address:
-                    adr_found = True
-                    if msgid in self.deviceadr_2msgid_blacklist[address]:
-                        isinlist = True
-                    break
-            # force this to False for all other unmapped device-addresses
-            if adr_found == False:
-                isinlist = False
-        return isinlist
+        return msgid > 0 and msgid in self._msgid_blacklist[deviceaddress & 0x7f]
+
+    def last_message(self):
+        """
+            returns (msgid, offset, source, target, framesize) of the last dispatched message
+             or None. 'framesize' is the number of bytes of that message in input-stream.
+        """
+        return self._last_message
+
+    def last_message_position(self):
+        """
+            returns the stream-position of the last dispatched message.
+        """
+        return self._last_message_position
+
+    def stream_position(self):
+        """
+            returns the stream-position of the first buffered byte, that is the number
+             of bytes consumed from input-stream including removed black-sequences.
+        """
+        return self._stream_position
+
+    def resync(self, position=0):
+        """
+            clears the raw-buffer and restarts the message-type detection,
+             used after the input-stream has been repositioned to 'position'.
+        """
+        self._rawdata.clear()
+        self._stream_position = position
+        self._removed_gaps = []
+        self._crc_resync = False
+        self._transceiver_view = 0
+        self._transceiver_sync = False
+        self._last_message = None
+        self._run_state = cht_discode._STATE_INIT
+
+    def transceiver_mode(self, transceiver=None):
+        """
+            returns True if ht_transceiver-messages are decoded, else False.
+             With 'transceiver' (True/False) the message-type detection is skipped and the
+             mode is preset, used if decoding starts at any position of a known input-stream.
+             In preset transceiver-mode the first header is searched until found.
+        """
+        if transceiver != None:
+            self._ht_transceiver_header_found = transceiver
+            self._transceiver_sync = transceiver
+            self._max_messagesize = 40
+            if transceiver:
+                self._run_state = cht_discode._STATE_TRANS_HEADER_SEARCH
+            else:
+                self._run_state = cht_discode._STATE_PRERUN
+        return self._ht_transceiver_header_found
+
+    def _transceiver_fill(self, size):
+        """
+            extends the decoder-visible bytes in transceiver-mode to at least 'size',
+             the decoders get the same buffer-view as with the former bytewise reading.
+        """
+        self._transceiver_view = min(max(self._transceiver_view, size), len(self._rawdata))
+
+    def _consume(self, size):
+        """
+            removes 'size' bytes from start of raw-buffer and updates the stream-position.
+        """
+        size = min(size, len(self._rawdata))
+        self._rawdata.consume(size)
+        self._stream_position += size
+        if len(self._removed_gaps) > 0:
+            gaps = []
+            for (index, gapsize) in self._removed_gaps:
+                if index <= size:
+                    self._stream_position += gapsize
+                else:
+                    gaps.append((index - size, gapsize))
+            self._removed_gaps = gaps
+
+    def _remove(self, index, size):
+        """
+            removes 'size' bytes at 'index' from raw-buffer, the gap is kept for the stream-position.
+        """
+        self._rawdata.remove(index, size)
+        gaps = []
+        for (gapindex, gapsize) in self._removed_gaps:
+            if gapindex < index:
+                gaps.append((gapindex, gapsize))
+            elif gapindex <= index + size:
+                size += gapsize
+            else:
+                gaps.append((gapindex - size, gapsize))
+        if index == 0:
+            self._stream_position += size
+        else:
+            gaps.append((index, size))
+        self._removed_gaps = gaps
+
+    def _stream_size(self, size):
+        """
+            returns the number of stream-bytes of the first 'size' buffered bytes.
+        """
+        return size + sum(gapsize for (index, gapsize) in self._removed_gaps if index < size)
+
+    def buffered_bytes(self):
+        """
+            returns the number of bytes read from interface, but not yet decoded.
+        """
+        return len(self._rawdata)
 
     def _read_rawdata(self):
         """
             reading raw-data to buffer for at least 'max_messagesize'.
         """
-        rtnvalue = 0
         if len(self._rawdata) < self._max_messagesize:
             #read data to rawbuffer
-            readcounter = self._max_messagesize - len(self._rawdata)
-            while readcounter > 0:
-                value = self.__read()
-                if value == None:
-                    rtnvalue = -1
-                    break
-                else:
-                    self._rawdata.append(value)
-                readcounter -= 1
-        if not rtnvalue == -1:
-            rtnvalue = len(self._rawdata)
-        return rtnvalue
+            self.__read_block(self._max_messagesize - len(self._rawdata))
+        return len(self._rawdata)
 
     def _IsTransceiverMsgHeader(self, buffer):
         """
@@ -3889,14 +4098,16 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
         try:
             transceiver_found = False
             self._max_messagesize = 40
-            size = self._read_rawdata()
+            size = min(self._read_rawdata(), self._max_messagesize)
+            self._transceiver_fill(self._max_messagesize)
             if size > 5:
                 size -= 5
                 # searching header from byte 0 to max-buffersize - header-size
                 for check_index in range(0, size):
                     transceiver_found = self._IsTransceiverMsgHeader(self._rawdata[check_index:])
                     if (transceiver_found):
-                        del self._rawdata[0:check_index]
+                        self._consume(check_index)
+                        self._transceiver_view -= check_index
                         break
             else:
                 transceiver_found = False
@@ -4176,6 +4387,15 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
         if self._run_state == cht_discode._STATE_TRANS_HEADER_SEARCH:
             self._max_messagesize = 40
             self._ht_transceiver_header_found = self._search_4_transceiver_message()
+            if self._transceiver_sync:
+                if not self._ht_transceiver_header_found:
+                    # preset transceiver-mode, skip the searched bytes and search again
+                    skipped = max(0, min(len(self._rawdata), self._max_messagesize) - 5)
+                    self._consume(skipped)
+                    self._transceiver_view = max(0, self._transceiver_view - skipped)
+                    self._discarded_bytes += skipped
+                    return ("", None)
+                self._transceiver_sync = False
             # setup next state
             self._run_state = cht_discode._STATE_PRERUN
 
@@ -4205,34 +4425,40 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
                     if ((payload_size > 5) and (payload_size < 35)):
                         # check current buffer-size and load the rest, if is less then msg-size
                         if len(self._rawdata) < message_size:
-                            readcounter = message_size - len(self._rawdata)
-                            while readcounter > 0:
-                                value = self.__read()
-                                self._rawdata.append(value)
-                                readcounter -= 1
+                            self.__read_block(message_size - len(self._rawdata))
+                        self._transceiver_fill(message_size)
+                        # zero-copy view of payload, decoders may read behind the message
+                        payload = self._rawdata[5:self._transceiver_view]
                         # check CRC
-                        crc_ok = self.crc_testen(self._rawdata[5:], payload_size)
+                        crc_ok = self.crc_testen(payload, payload_size)
                         # handle message if CRC is ok and terminating 'break' := 0 is available
                         if ((crc_ok == True) and self._rawdata[message_size - 2] == 0):
-                            (msgid, offset) = self.GetMessageID(self._rawdata[5:])
+                            (msgid, offset) = self.GetMessageID(payload)
                             if (msgid > 0):
-                                try:
-                                    (nickname, value) = self.dispatch[msgid](self, (msgid, offset), self._rawdata[5:], payload_size)
-                                except:
-                                    self.msgID_NN_unknown((msgid, offset), self._rawdata[5:], payload_size)
-                                    nickname = ""
-                                    value = None
+                                self._last_message = (msgid, offset, payload[0], payload[1], message_size)
+                                self._last_message_position = self._stream_position
+                                (nickname, value) = self._dispatch_message((msgid, offset), payload, payload_size)
                         else:
+                            self._source_crc_errors[payload[0] & 0x7f] += 1
+                            self._discarded_bytes += message_size
                             nickname = ""
                             value = None
+                    else:
+                        # invalid size, only the already visible bytes are deleted
+                        message_size = min(message_size, self._transceiver_view)
+                        self._discarded_bytes += message_size
 
                     # delete old message from buffer
-                    del self._rawdata[0:message_size]
+                    self._consume(message_size)
+                    self._transceiver_view -= message_size
                     # read new heaterbus-data
                     self._read_rawdata()
+                    self._transceiver_fill(self._max_messagesize)
                 else:
                     if len(self._rawdata) > 0:
-                        del self._rawdata[0]
+                        self._consume(1)
+                        self._transceiver_view -= 1
+                        self._discarded_bytes += 1
                     self._run_state = cht_discode._STATE_TRANS_HEADER_SEARCH
 
                 if len(nickname) < 2:
@@ -4258,43 +4484,54 @@ class cht_discode(cht_decode, ht_utils.cht_utils, ht_utils.clog):
                     if self._ValidSourceTargetBytes(self._rawdata[0], self._rawdata[1]):
                         break
                     else:
-                        del self._rawdata[0]
+                        self._consume(1)
+                        self._discarded_bytes += 1
                         self._read_rawdata()
 
                 if self._ValidSourceTargetBytes(self._rawdata[0], self._rawdata[1]):
                     # remove invalid byte-sequences (from bus-polling with break-signals)
-                    self._remove_black_sequences()
+                    size = self._remove_black_sequences(min(len(self._rawdata), self._max_messagesize))
+                    # zero-copy view of message-candidate
+                    message = self._rawdata[0:size]
                     # search for a valid CRC
-                    crc_ok = False
-                    message_size = 0
-                    for crc_checklength in range(6, (len(self._rawdata) - 2)):
-                        crc_ok = self.crc_testen(self._rawdata, crc_checklength)
-                        if crc_ok == True:
-                            # message_size includes that terminating 0 := break-signal
-                            message_size = crc_checklength
-                            break
+                    #  message_size includes that terminating 0 := break-signal
+                    message_size = self.crc_framesearch(message, 6, len(message) - 2)
+                    crc_ok = (message_size > 0)
 
                     # check valid crc for that current raw-buffer content and the terminating Break-Sign := 0
                     #  if valid then process message
                     if crc_ok == True and message_size > 6:
-                        (msgid, offset) = self.GetMessageID(self._rawdata)
-                        if self._IsValidMessageID(self._rawdata[0], msgid) and not self._IsInBlacklist(self._rawdata[0], msgid):
+                        self._crc_resync = False
+                        (msgid, offset) = self.GetMessageID(message)
+                        if self._IsValidMessageID(message[0], msgid) and not self._IsInBlacklist(message[0], msgid):
                             # dispatch data if terminating 0 := break-signal is available
-                            if self._rawdata[message_size - 1] == 0:
-                                try:
-                                    (nickname, value) = self.dispatch[msgid](self, (msgid, offset), self._rawdata, message_size)
-                                except:
-                                    self.msgID_NN_unknown((msgid, offset), self._rawdata, message_size)
-                                    nickname = ""
-                                    value = None
+                            if message[message_size - 1] == 0:
+                                self._last_message = (msgid, offset, message[0], message[1], self._stream_size(message_size))
+                                self._last_message_position = self._stream_position
+                                (nickname, value) = self._dispatch_message((msgid, offset), message, message_size)
+                            else:
+                                self._discarded_bytes += message_size
                         else:
+                            if msgid > 0:
+                                self._reject_message(message[0], msgid)
                             nickname = ""
                             value = None
-                        del self._rawdata[0:message_size]
+                        self._consume(message_size)
                     else:
-                        del self._rawdata[0]
+                        if not crc_ok and not self._crc_resync and len(message) > 7:
+                            # CRC-error only for a candidate-frame with valid source and known msgID,
+                            #  counted once until the next valid frame, other bytes are lost
+                            #  while searching the next frame
+                            (msgid, offset) = self.GetMessageID(message)
+                            if msgid in self.dispatch and self._IsValidMessageID(message[0], msgid) and \
+                               not self._IsInBlacklist(message[0], msgid):
+                                self._source_crc_errors[message[0] & 0x7f] += 1
+                                self._crc_resync = True
+                        self._consume(1)
+                        self._discarded_bytes += 1
                 else:
-                    del self._rawdata[0]
+                    self._consume(1)
+                    self._discarded_bytes += 1
 
                 if len(nickname) < 2:
                     value = None
@@ -4318,6 +4555,42 @@ if __name__ == "__main__":
     configurationfilename = './../etc/config/4test/HT3_4dispatcher_test.xml'
     testdata = data.cdata()
     testdata.read_db_config(configurationfilename)
+
+    def legacy_remove_black_sequences(black_sequence, rawdata):
+        # former handling on the bytewise filled raw-buffer, used as reference
+        for value in black_sequence.values():
+            while bytearray(value) in rawdata:
+                found_index = rawdata.find(bytearray(value))
+                if (found_index >= 0) and (len(rawdata) > found_index + len(value)):
+                    del rawdata[found_index:(found_index + len(value))]
+                else:
+                    break
+        return rawdata
+
+    print("-------------------- check black-sequence removal -------------------------")
+    import random
+    checkdecoder = cht_discode(None, testdata, 0, open(os.devnull, "rb"), logger=logging.getLogger("ht_discode_test"))
+    sequences = list(cht_discode.black_sequence.values())
+    testrandom = random.Random(1)
+    failed = 0
+    for testrun in range(5000):
+        rawdata = bytearray()
+        while len(rawdata) < checkdecoder._max_messagesize:
+            if testrandom.random() < 0.3:
+                rawdata += bytes(testrandom.choice(sequences))
+            else:
+                rawdata += bytes(testrandom.choice([0, 0x09, 0x18, 0x20, 0x89, 0x90, 0xa1, testrandom.randint(0, 255)])
+                                 for index in range(testrandom.randint(1, 6)))
+        rawdata = rawdata[0:checkdecoder._max_messagesize]
+        checkdecoder.resync()
+        checkdecoder._rawdata.extend(rawdata)
+        size = checkdecoder._remove_black_sequences(len(rawdata))
+        expected = legacy_remove_black_sequences(cht_discode.black_sequence, bytearray(rawdata))
+        if checkdecoder._rawdata.tobytes() != bytes(expected) or size != len(expected):
+            failed += 1
+    checkdecoder.filehandle.close()
+    print("+-> OK") if failed == 0 else print("+-> Error; {0} of 5000 buffers different".format(failed))
+
     #### reconfiguration has to be done in configuration-file ####
             # open socket for client and connect to server,
             #   socket-object is written to 'self.__port'
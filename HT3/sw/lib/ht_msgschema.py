@@ -0,0 +1,211 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+#                               compiler for declarative msgID field-layouts.
+# Ver:0.1.1  / 2026-10-18       decode() with parameter 'debug', debugstring only build if set.
+#################################################################
+
+import struct
+
+__author__ = "agent"
+__status__ = "draft"
+
+####################################
+# field-options used in layout-definitions
+CHECK_MAXVALUE = 0x01  # value limited to maxvalue (default) from configuration
+SENSOR         = 0x02  # value used only if sensor is available (see: IsSensorAvailable())
+BITFLAG        = 0x04  # value := 1 if (raw-value & bitmask) else 0
+SIGNED         = 0x08  # raw-value is signed
+NEG_FF         = 0x10  # negative temperature coded as: 0xff, (255 - value)
+IN_RANGE       = 0x20  # value used only if in range: -50.0 < value < 200.0
+VALID_TEMP     = 0x40  # value used only if: value < 200.0 and value != 0
+
+_UNSIGNED_FORMATS = {1: 'B', 2: 'H', 3: '3s', 4: 'I'}
+_SIGNED_FORMATS   = {1: 'b', 2: 'h', 4: 'i'}
+
+
+class cht_msgschema(object):
+    """
+    Class: cht_msgschema.
+     Compiles declarative field-layouts of heater-messages to 'struct.Struct'-
+     extractors and decodes messages with them.
+
+     layouts := {layoutkey: (first_payload_index, [field, ...])}
+     field   := (raw_index, width, logitem, divisor, bitmask, options, debugtag)
+       raw_index: byte-number in message counted from msg-start (offset included)
+       width    : 1...4 bytes (big-endian)
+       logitem  : target logitem, None for debug-only fields
+       divisor  : 0 := int-value, else float(raw-value) / divisor
+       bitmask  : 0 := not used, else raw-value & bitmask
+       options  : or-ed field-options (CHECK_MAXVALUE, SENSOR, ...)
+       debugtag : written as ';debugtag:value' to debugstring, "" := none
+
+     The extractors are compiled once for each (layoutkey, offset, length) and
+     unpack all fields of a message with one 'unpack_from()' call.
+    """
+    _MAX_COMPILED = 4096
+
+    def __init__(self, layouts):
+        """
+        Initialisation with layout-definitions.
+        """
+        self._layouts = {}
+        for (layoutkey, (first_payload_index, fields)) in layouts.items():
+            # stable sorted, so fields are handled in byte-order like before
+            self._layouts[layoutkey] = (first_payload_index, sorted(fields, key=lambda field: field[0]))
+        self._compiled = {}
+
+    def layoutkeys(self):
+        """
+        returns the available layout-keys.
+        """
+        return list(self._layouts.keys())
+
+    def compile(self, layoutkey, offset, length):
+        """
+        returns the extractor for message with 'offset' and 'length'.
+         extractor := ([(Struct, buffer_index), ...], [(position, logitem, divisor, bitmask, options, debugtag, is_bytes), ...])
+        """
+        key = (layoutkey, offset, length)
+        extractor = self._compiled.get(key)
+        if extractor != None:
+            return extractor
+
+        (first_payload_index, fields) = self._layouts[layoutkey]
+        msg_bytecount = length - first_payload_index - 2
+        # collect all fields available in that message and the required byte-slots
+        slots = []
+        active_fields = []
+        for (raw_index, width, logitem, divisor, bitmask, options, debugtag) in fields:
+            buffer_index = raw_index - offset
+            if first_payload_index <= buffer_index < length - 2 and msg_bytecount >= width:
+                slot = (buffer_index, width, bool(options & SIGNED))
+                if not slot in slots:
+                    slots.append(slot)
+                active_fields.append((slot, logitem, divisor, bitmask, options, debugtag))
+
+        # put slots into none overlapping struct-groups
+        groups = []
+        for slot in sorted(slots):
+            (buffer_index, width, signed) = slot
+            code = _SIGNED_FORMATS[width] if signed else _UNSIGNED_FORMATS[width]
+            for group in groups:
+                if group[1] <= buffer_index:
+                    break
+            else:
+                group = [buffer_index, buffer_index, ">", []]
+                groups.append(group)
+            group[2] += "{0}x{1}".format(buffer_index - group[1], code) if buffer_index > group[1] else code
+            group[1] = buffer_index + width
+            group[3].append(slot)
+
+        unpackers = []
+        positions = {}
+        for (start, end, structformat, groupslots) in groups:
+            for slot in groupslots:
+                positions[slot] = len(positions)
+            unpackers.append((struct.Struct(structformat), start))
+
+        compiled_fields = []
+        for (slot, logitem, divisor, bitmask, options, debugtag) in active_fields:
+            compiled_fields.append((positions[slot], logitem, divisor, bitmask, options, debugtag, slot[1] == 3))
+
+        extractor = (unpackers, compiled_fields)
+        if len(self._compiled) >= cht_msgschema._MAX_COMPILED:
+            self._compiled.clear()
+        self._compiled[key] = extractor
+        return extractor
+
+    def decode(self, layoutkey, offset, buffer, length, debug=True):
+        """
+        decodes the message in 'buffer' using the layout 'layoutkey'.
+         returns (updates, debugstr), with updates := [(logitem, value, check_maxvalue), ...]
+         debugstr is empty if 'debug' is False.
+        """
+        (unpackers, fields) = self.compile(layoutkey, offset, length)
+        if not isinstance(buffer, (bytes, bytearray, memoryview)):
+            buffer = bytes(buffer)
+        rawvalues = ()
+        for (unpacker, buffer_index) in unpackers:
+            rawvalues += unpacker.unpack_from(buffer, buffer_index)
+
+        updates = []
+        debugstr = ""
+        for (position, logitem, divisor, bitmask, options, debugtag, is_bytes) in fields:
+            raw = rawvalues[position]
+            if is_bytes:
+                raw = int.from_bytes(raw, 'big')
+            if bitmask:
+                raw &= bitmask
+                if options & BITFLAG:
+                    raw = 1 if raw else 0
+            if options & SENSOR and raw in (0xff, 0xffff, 0x8000, 32000):
+                value = None
+            elif options & NEG_FF and (raw >> 8) == 0xff:
+                value = float(255 - (raw & 0xff)) / (-divisor)
+            elif divisor:
+                value = float(raw) / divisor
+            else:
+                value = int(raw)
+
+            if value != None:
+                if options & IN_RANGE and not (-50.0 < value < 200.0):
+                    value = None
+                elif options & VALID_TEMP and not (value < 200.0 and value != 0.0):
+                    value = None
+
+            if debug and len(debugtag):
+                debugstr += ";{0}:{1}".format(debugtag, "->NA" if value == None else value)
+            if value != None and logitem != None:
+                updates.append((logitem, value, bool(options & CHECK_MAXVALUE)))
+        return (updates, debugstr)
+
+#--- class cht_msgschema end ---#
+################################################
+
+if __name__ == "__main__":
+    print("-------------------- do some schema-checks -------------------------")
+    layouts = {
+        1: (4, [
+            (4, 1, "T_int", 0, 0, 0, ""),
+            (5, 2, "T_float", 10, 0, CHECK_MAXVALUE, "T"),
+            (9, 1, "V_bit", 0, 0x08, BITFLAG, ""),
+            (9, 1, "V_mask", 0, 0x03, 0, ""),
+            (10, 3, "C_counter", 0, 0, 0, ""),
+            (13, 2, "T_sensor", 10, 0, SENSOR, "S"),
+            (15, 2, "T_neg", 10, 0, NEG_FF, ""),
+        ]),
+    }
+    schema = cht_msgschema(layouts)
+    # HG: 88 00 18 00 | 27 01 31 54 00 | 0b | 00 01 2c | 80 00 | ff f6 | crc 00
+    message = [0x88, 0x00, 0x18, 0x00, 0x27, 0x01, 0x31, 0x54, 0x00, 0x0b,
+               0x00, 0x01, 0x2c, 0x80, 0x00, 0xff, 0xf6, 0x00, 0x00]
+    (updates, debugstr) = schema.decode(1, 0, message, len(message))
+    print(updates)
+    print(debugstr)
+    expected = [("T_int", 0x27, False), ("T_float", 30.5, True), ("V_bit", 1, False),
+                ("V_mask", 3, False), ("C_counter", 300, False), ("T_neg", -0.9, False)]
+    print("+-> OK") if updates == expected else print("+-> Error")
+    print("-- check with offset:=5 --")
+    (updates, debugstr) = schema.decode(1, 5, message, len(message))
+    print(updates)
+    expected = [("V_bit", 0, False), ("V_mask", 3, False), ("C_counter", 78164, False),
+                ("T_sensor", 1.1, False), ("T_neg", 0.1, False)]
+    print("+-> OK") if updates == expected else print("+-> Error")
@@ -28,6 +28,7 @@
 # Ver:0.2      2022-11-22 ip_address() added.
 #                           redesign of exception-handling
 #                           modifications for issue:#23
+# Ver:0.2.1    2026-10-18 cht_socket_client.read_into() added for block-reads.
 #################################################################
 
 import socketserver, socket, serial
@@ -1461,6 +1462,36 @@ class cht_socket_client(cproxyconfig, ht_utils.clog):
 
         return bytes(read)
 
+    def read_into(self, buffer, minsize=1):
+        """Read available bytes from the connected socket directly into
+           'buffer' (writeable bytes-like object). It will block until
+           at least 'minsize' bytes are read, returns the number of read bytes.
+        """
+        if self._socket is None:
+            error_str = "socket_client.read_into(); Error; Client-ID:{0}; socket not initialised".format(self._clientID)
+            self.log_critical(error_str)
+            raise SystemExit(error_str)
+
+        view = memoryview(buffer)
+        readsize = 0
+        while readsize < minsize:
+            try:
+                received = self._socket.recv_into(view[readsize:])
+            except:
+                error_str = "socket_client.read_into(); Error; Client-ID:{0}; error on socket.recv_into".format(self._clientID)
+                self.log_critical(error_str)
+                self._socket.close()
+                raise ConnectionError(error_str)
+            else:
+                # check for empty buffer and raise if it is empty -->> socket connection broken
+                if received == 0:
+                    error_str = "socket_client.read_into(); Error; Client-ID:{0}; peer closed socket".format(self._clientID)
+                    self.log_critical(error_str)
+                    raise SystemExit(error_str)
+                readsize += received
+
+        return readsize
+
     def write(self, data):
         """write data to connected socket. It will block
            until all data is written.
@@ -0,0 +1,366 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+#                               replay of binlog-files with scaled time (1x, Nx, max),
+#                                served as ht_proxy-server or as pseudo-terminal.
+#################################################################
+#
+# The replay is used for load-tests of 'ht_proxy'-clients like 'ht_collgate'
+#  without heater-hardware:
+#   - 'cht_replayserver' works like the 'ht_proxy'-daemon: clients are registered
+#      with the same handshake as in 'ht_proxy_if.cht_RequestHandler', so
+#      'ht_proxy_if.cht_socket_client' can be used without changes.
+#      Data written by clients (devicetype:'MODEM') are ignored.
+#   - 'cht_replaypty' writes to a pseudo-terminal, the slave-device
+#      (like: /dev/pts/3) is then used instead of '/dev/serial0'.
+#  Every stream is running as own thread, so more heaters can be simulated
+#  with more streams (different ports or pseudo-terminals).
+#
+import os
+import tty
+import time
+import queue
+import socket
+import threading
+import socketserver
+import ht_binlog
+
+__author__ = "agent"
+__status__ = "draft"
+
+
+class cht_replaysource(object):
+    """
+    Class: cht_replaysource.
+     Generator for the bus-data of a binlog-file with the timing of the recording,
+     scaled with 'speed' (1.0 := realtime, 10.0 := ten times faster, 0 := maximum speed).
+     Binlog-files v2 are played with their frame-timestamps, plain binlog-files
+     are played with the byte-timing of 'baudrate' (8N1).
+     Pauses in the recording longer than 'maxgap' seconds are shortened to 'maxgap'.
+     With 'loop' the file is played endless.
+    """
+    _RAW_BLOCKSIZE = 32
+
+    def __init__(self, binlogfile, speed=1.0, loop=False, baudrate=9600, maxgap=10.0):
+        self._binlogfile = binlogfile
+        self._speed = float(speed)
+        self._loop = loop
+        self._bytetime = 10.0 / baudrate
+        self._maxgap = maxgap
+        self._stopped = False
+        self.frames = 0
+        self.bytecount = 0
+        self.loops = 0
+        self.maxlag = 0.0
+        self.starttime = 0.0
+
+    def __frames(self):
+        """
+        generator for (time, data) of one run through the binlog-file.
+        """
+        if ht_binlog.IsBinlogV2(self._binlogfile):
+            reader = ht_binlog.cht_binlogreader(self._binlogfile)
+            try:
+                for frame in reader.frames():
+                    yield frame
+            finally:
+                reader.close()
+        else:
+            frametime = 0.0
+            with open(self._binlogfile, "rb") as binfile:
+                while True:
+                    block = binfile.read(cht_replaysource._RAW_BLOCKSIZE)
+                    if len(block) == 0:
+                        break
+                    yield (frametime, block)
+                    frametime += len(block) * self._bytetime
+
+    def __iter__(self):
+        """
+        yields the bus-data at their (scaled) time, the delay to the
+        scheduled time is available as 'maxlag'.
+        """
+        self.starttime = time.monotonic()
+        playtime = 0.0
+        while not self._stopped:
+            lasttime = None
+            for (frametime, data) in self.__frames():
+                if self._stopped:
+                    return
+                if lasttime != None:
+                    playtime += min(max(0.0, frametime - lasttime), self._maxgap)
+                lasttime = frametime
+                if self._speed > 0.0:
+                    delay = self.starttime + playtime / self._speed - time.monotonic()
+                    if delay > 0.0:
+                        time.sleep(delay)
+                    elif -delay > self.maxlag:
+                        self.maxlag = -delay
+                self.frames += 1
+                self.bytecount += len(data)
+                yield data
+            self.loops += 1
+            if not self._loop or lasttime == None:
+                break
+
+    def stop(self):
+        """
+        stops the running replay.
+        """
+        self._stopped = True
+
+    def stats(self):
+        """
+        returns the replay-statistic as dict.
+        """
+        elapsed = time.monotonic() - self.starttime if self.starttime > 0.0 else 0.0
+        return {"frames": self.frames, "bytes": self.bytecount, "loops": self.loops,
+                "elapsed": elapsed, "maxlag": self.maxlag,
+                "bytes_per_s": self.bytecount / elapsed if elapsed > 0.0 else 0.0}
+
+#--- class cht_replaysource end ---#
+################################################
+
+
+class cht_replaypty(threading.Thread):
+    """
+    Class: cht_replaypty.
+     Thread writing the data of 'cht_replaysource' to a pseudo-terminal,
+     'devicename()' returns the slave-device to be used as serial-device.
+     The slave-device is kept open, so data are buffered by the pseudo-terminal
+     until the reader is connected and the replay waits if that buffer is full.
+    """
+    def __init__(self, source):
+        threading.Thread.__init__(self, name="replaypty_Thread", daemon=True)
+        self._source = source
+        (self._master, self._slave) = os.openpty()
+        # no line-discipline for the binary bus-data
+        tty.setraw(self._slave)
+        self._devicename = os.ttyname(self._slave)
+
+    def devicename(self):
+        """
+        returns the slave-device of the pseudo-terminal.
+        """
+        return self._devicename
+
+    def run(self):
+        try:
+            for data in self._source:
+                view = memoryview(data)
+                while len(view) > 0:
+                    view = view[os.write(self._master, view):]
+        except OSError:
+            # pseudo-terminal closed
+            pass
+
+    def stop(self):
+        self._source.stop()
+
+    def close(self):
+        self.stop()
+        os.close(self._master)
+        os.close(self._slave)
+
+#--- class cht_replaypty end ---#
+################################################
+
+
+class _creplay_requesthandler(socketserver.BaseRequestHandler):
+    """
+    handles one client of 'cht_replayserver' with the 'ht_proxy'-handshake:
+     1. receive the devicetype of the client
+     2. send the client-ID
+     3. send the replayed data until the client is disconnected
+    """
+    # pause between sending the client-ID and the data, 'cht_socket_client'
+    #  reads the client-ID with one recv() not separated from following data
+    _REGISTER_DELAY = 0.2
+
+    def handle(self):
+        replayserver = self.server.replayserver
+        self.request.settimeout(5)
+        try:
+            self.request.recv(20)
+            clientID = replayserver._next_clientID()
+            self.request.sendall(str(clientID).encode("utf-8"))
+        except (socket.timeout, OSError):
+            return
+        finally:
+            self.request.settimeout(None)
+        time.sleep(_creplay_requesthandler._REGISTER_DELAY)
+        replayserver._add_client(clientID)
+
+        clientqueue = replayserver._clientqueues[clientID]
+        try:
+            while True:
+                data = clientqueue.get()
+                if data == None:
+                    break
+                self.request.sendall(data)
+        except OSError:
+            # closed by peer
+            pass
+        finally:
+            replayserver._remove_client(clientID)
+
+
+class cht_replayserver(threading.Thread):
+    """
+    Class: cht_replayserver.
+     Thread serving the data of 'cht_replaysource' to all registered
+     'ht_proxy'-clients on (ip_address, port_number).
+     The replay is started with the registration of the first client and is
+     waiting if no client is registered (like 'ht_proxy_if.cportread').
+     Every client has a queue of 'queuesize' data-blocks, the replay is
+     waiting if a queue is full, so the slowest client determines the speed.
+    """
+    def __init__(self, source, ip_adr_and_port_t=("localhost", 48088), queuesize=1024):
+        threading.Thread.__init__(self, name="replayserver_Thread", daemon=True)
+        self._source = source
+        self._queuesize = queuesize
+        self._lock = threading.Lock()
+        self._clientavailable = threading.Condition(self._lock)
+        self._clientqueues = {}
+        self._clientcounter = 0
+        self._stopped = False
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._server = socketserver.ThreadingTCPServer(ip_adr_and_port_t, _creplay_requesthandler)
+        self._server.daemon_threads = True
+        self._server.replayserver = self
+        self._serverthread = threading.Thread(target=self._server.serve_forever,
+                                              name="replayserver_TCPserver", daemon=True)
+        self._serverthread.start()
+
+    def server_address(self):
+        """
+        returns the used (ip_address, port_number).
+        """
+        return self._server.server_address
+
+    def _next_clientID(self):
+        with self._lock:
+            self._clientcounter += 1
+            return self._clientcounter
+
+    def _add_client(self, clientID):
+        with self._lock:
+            self._clientqueues[clientID] = queue.Queue(self._queuesize)
+            self._clientavailable.notify_all()
+
+    def _remove_client(self, clientID):
+        with self._lock:
+            self._clientqueues.pop(clientID, None)
+
+    def get_clientcounter(self):
+        """
+        returns the number of currently registered clients.
+        """
+        with self._lock:
+            return len(self._clientqueues)
+
+    def __put(self, clientqueue, data):
+        """
+        puts data to the clientqueue, waiting while it is full and the client is still registered.
+        """
+        while True:
+            try:
+                clientqueue.put(data, timeout=0.5)
+                return
+            except queue.Full:
+                with self._lock:
+                    if self._stopped or not clientqueue in self._clientqueues.values():
+                        return
+
+    def run(self):
+        for data in self._source:
+            with self._lock:
+                while len(self._clientqueues) == 0 and not self._stopped:
+                    self._clientavailable.wait()
+                clientqueues = list(self._clientqueues.values())
+            if self._stopped:
+                break
+            for clientqueue in clientqueues:
+                self.__put(clientqueue, data)
+        # end of replay, terminate all clients
+        with self._lock:
+            for clientqueue in self._clientqueues.values():
+                clientqueue.put(None)
+
+    def stop(self):
+        self._source.stop()
+        with self._lock:
+            self._stopped = True
+            self._clientavailable.notify_all()
+
+    def close(self):
+        self.stop()
+        self._server.shutdown()
+        self._server.server_close()
+
+#--- class cht_replayserver end ---#
+################################################
+
+if __name__ == "__main__":
+    import tempfile
+    print("-------------------- do some replay-checks -------------------------")
+    testpath = os.path.join(tempfile.gettempdir(), "ht_replay_test.htb")
+    payload = bytes(range(256)) * 8
+    writer = ht_binlog.cht_binlogwriter(testpath, blocksize=512)
+    for index in range(0, len(payload), 16):
+        writer.write(payload[index:index + 16], timestamp=1000.0 + index / 640.0)
+    writer.close()
+
+    print("--- source with speed 4x (about 0.8 sec) ---")
+    source = cht_replaysource(testpath, speed=4.0)
+    data = b"".join(source)
+    print(source.stats())
+    print("+-> OK") if data == payload and 0.7 < source.stats()["elapsed"] < 1.5 else print("+-> Error")
+
+    print("--- pseudo-terminal with max. speed ---")
+    replaypty = cht_replaypty(cht_replaysource(testpath, speed=0))
+    replaypty.start()
+    fd = os.open(replaypty.devicename(), os.O_RDONLY)
+    data = b""
+    while len(data) < len(payload):
+        data += os.read(fd, 4096)
+    os.close(fd)
+    replaypty.close()
+    print("{0}: +-> OK".format(replaypty.devicename())) if data == payload else print("+-> Error")
+
+    print("--- server with two clients, 2 loops with max. speed ---")
+    replayserver = cht_replayserver(cht_replaysource(testpath, speed=0, loop=True), ("localhost", 0))
+    clients = []
+    for number in range(2):
+        client = socket.create_connection(replayserver.server_address())
+        client.sendall(b"RX")
+        print("client-ID:", client.recv(20).decode("utf-8"))
+        clients.append(client)
+    while replayserver.get_clientcounter() < 2:
+        time.sleep(0.1)
+    replayserver.start()
+    for client in clients:
+        data = b""
+        while len(data) < 2 * len(payload):
+            data += client.recv(4096)
+        print("+-> OK") if data[:2 * len(payload)] == payload * 2 else print("+-> Error")
+        client.close()
+    replayserver.close()
+    os.remove(testpath)
@@ -0,0 +1,246 @@
+#! /usr/bin/python3
+#
+#################################################################
+## Copyright (c) 2026 agent <agent@local>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#################################################################
+# Ver:0.1    / 2026-10-18       first release
+#                               generator for synthetic HT3-/EMS-telegrams with valid CRC
+#                                as raw bus-data or with ht_transceiver-header.
+# Ver:0.2    / 2026-10-18       telegram-length at least the message-size read by the decoder
+#                                of that msgID (see: layout_size()).
+#################################################################
+#
+# telegram-layout (raw bus-data):
+#  HT3 : source|0x80, target, msgID, offset, data..., CRC, 0 (break)
+#  EMS : source|0x80, target, 0xff, offset, (msgID-256)/256, (msgID-256)%256, data..., CRC, 0 (break)
+# with ht_transceiver-header:
+#  '#', 'H', 'R', 0x11, size of raw-telegram, raw-telegram, 'Z'
+#
+import ast
+import random
+import inspect
+import textwrap
+import ht_utils
+import ht_discode
+
+__author__ = "agent"
+__status__ = "draft"
+
+
+class cht_telegramgenerator(ht_utils.cht_utils):
+    """
+    Class: cht_telegramgenerator.
+     Creates synthetic telegrams for all msgIDs of 'cht_discode.dispatch' with valid CRC,
+     source-addresses are selected matching the address- and msgID-filters of 'cht_discode'.
+     The data-bytes are random, same 'seed' creates the same telegrams.
+     Random data-bytes are selected so that the telegram is found unambiguous
+     also in raw bus-data (no valid CRC at shorter length, no polling-sequence).
+     The telegrams are at least as long as the message read by the decoder of
+     that msgID, so all fields are decoded.
+    """
+    _TRANSCEIVER_HEADER = [0x23, 0x48, 0x52, 0x11]
+    _TRANSCEIVER_END    = 0x5a
+    _MAX_MESSAGESIZE    = 32  # telegram-size (+ CRC and break) is limited by ht_transceiver payload-size
+    _TARGETS            = [0x00, 0x08, 0x10, 0x18]
+    _MAX_ATTEMPTS       = 100
+
+    def __init__(self, seed=None):
+        ht_utils.cht_utils.__init__(self)
+        self._random = random.Random(seed)
+        self._msgids = sorted(ht_discode.cht_discode.dispatch.keys())
+        whitelist = ht_discode.cht_discode.deviceaddress_white_list
+        mapping = ht_discode.cht_discode.deviceadr_2msgid_mapping
+        blacklist = ht_discode.cht_discode.deviceadr_2msgid_blacklist
+        # valid source-addresses for every msgID
+        self._sources = {}
+        for msgid in self._msgids:
+            self._sources[msgid] = [address for address in whitelist
+                                    if (not address in mapping or msgid in mapping[address])
+                                    and not msgid in blacklist.get(address, [])]
+        self._black_sequences = list(ht_discode.cht_discode.black_sequence.values())
+        self._layout_sizes = {}
+        for msgid in self._msgids:
+            self._layout_sizes[msgid] = min(cht_telegramgenerator.layout_size(ht_discode.cht_discode.dispatch[msgid]),
+                                            cht_telegramgenerator._MAX_MESSAGESIZE)
+
+    @staticmethod
+    def layout_size(decoder):
+        """
+        returns the number of message-bytes (without CRC and break) read by 'decoder',
+         derived from its source-code:
+          'buffer[n]'                               -> n + 1
+          'raw_index == n and msg_bytecount >= m'   -> n + m
+          '__DecodeLayout(layoutkey, ...)'          -> fields of 'msgid_layouts[layoutkey]'
+          '__LayoutIndex(first, msgtuple, length, n, width)' -> n + width
+        """
+        size = 0
+        tree = ast.parse(textwrap.dedent(inspect.getsource(decoder)))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == "buffer":
+                if isinstance(node.slice, ast.Constant) and isinstance(node.slice.value, int):
+                    size = max(size, node.slice.value + 1)
+            elif isinstance(node, ast.Compare) and isinstance(node.left, ast.Name) and node.left.id == "raw_index":
+                if isinstance(node.ops[0], ast.Eq) and isinstance(node.comparators[0], ast.Constant):
+                    size = max(size, node.comparators[0].value + 1)
+            elif isinstance(node, ast.BoolOp):
+                (raw_index, bytecount) = (None, 1)
+                for value in node.values:
+                    if isinstance(value, ast.Compare) and isinstance(value.left, ast.Name) and \
+                       isinstance(value.comparators[0], ast.Constant):
+                        if value.left.id == "raw_index" and isinstance(value.ops[0], ast.Eq):
+                            raw_index = value.comparators[0].value
+                        if value.left.id == "msg_bytecount" and isinstance(value.ops[0], ast.GtE):
+                            bytecount = value.comparators[0].value
+                if raw_index != None:
+                    size = max(size, raw_index + bytecount)
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+                if node.func.attr.endswith("__DecodeLayout") and isinstance(node.args[0], ast.Constant):
+                    (first_payload_index, fields) = ht_discode.cht_decode.msgid_layouts[node.args[0].value]
+                    size = max([size] + [raw_index + width for (raw_index, width) in (field[0:2] for field in fields)])
+                if node.func.attr.endswith("__LayoutIndex") and len(node.args) >= 4 and \
+                   isinstance(node.args[3], ast.Constant):
+                    width = node.args[4].value if len(node.args) > 4 else 1
+                    size = max(size, node.args[3].value + width)
+        return size
+
+    def msgids(self):
+        """
+        returns the sorted list of msgIDs with decoder.
+        """
+        return list(self._msgids)
+
+    def telegram(self, msgid, source=None, target=None, offset=0, databytes=None):
+        """
+        returns the raw telegram (bytes) for msgID, with random 'source', 'target'
+         and 'databytes' if not set. Random 'databytes' are at least as many as read
+         by the decoder of msgID.
+        """
+        headersize = 4 if msgid < 256 else 6
+        minsize = max(4, self._layout_sizes.get(msgid, 0) - headersize)
+        maxsize = max(minsize, cht_telegramgenerator._MAX_MESSAGESIZE - headersize)
+        for attempt in range(cht_telegramgenerator._MAX_ATTEMPTS):
+            sourcebyte = self._random.choice(self._sources.get(msgid) or [0x10]) if source == None else source
+            targetbyte = self._random.choice(cht_telegramgenerator._TARGETS) if target == None else target
+            if msgid < 256:
+                header = [sourcebyte | 0x80, targetbyte, msgid, offset]
+            else:
+                header = [sourcebyte | 0x80, targetbyte, 0xff, offset, (msgid - 256) >> 8, (msgid - 256) & 0xff]
+            if databytes != None:
+                return self.__telegram(header, databytes)
+            telegram = self.__telegram(header, [self._random.randint(0, 255)
+                                                for index in range(self._random.randint(minsize, maxsize))])
+            if self.__IsUnambiguous(telegram):
+                break
+        return telegram
+
+    def __telegram(self, header, databytes):
+        telegram = header + list(databytes)
+        telegram.append(self.make_crc(telegram, len(telegram)))
+        telegram.append(0)
+        return bytes(telegram)
+
+    def __IsUnambiguous(self, telegram):
+        """
+        returns False if raw bus-data search could find a shorter telegram
+         (CRC valid at a shorter length) or a polling-sequence inside of it, else True.
+        """
+        for length in range(6, len(telegram)):
+            if self.crc_testen(telegram, length):
+                return False
+        return not any(bytes(sequence) in telegram for sequence in self._black_sequences)
+
+    def transceiver_telegram(self, telegram):
+        """
+        returns the raw telegram with ht_transceiver-header.
+        """
+        return bytes(cht_telegramgenerator._TRANSCEIVER_HEADER + [len(telegram)]) + telegram + \
+            bytes([cht_telegramgenerator._TRANSCEIVER_END])
+
+    def stream(self, count, msgids=None, transceiver=False, noise=0.0, black_sequences=0.0):
+        """
+        returns 'count' telegrams (bytes) with msgIDs selected random from 'msgids'
+         (None := all msgIDs with decoder).
+         'noise'          : probability of 1..8 random bytes before a telegram
+         'black_sequences': probability of a polling-sequence before a telegram
+         With 'transceiver' all telegrams get the ht_transceiver-header,
+         noise and polling-sequences are then added without header.
+        """
+        msgids = self._msgids if msgids == None else list(msgids)
+        parts = []
+        for index in range(count):
+            if noise > 0.0 and self._random.random() < noise:
+                parts.append(bytes(self._random.randint(0, 255) for index in range(self._random.randint(1, 8))))
+            if black_sequences > 0.0 and self._random.random() < black_sequences:
+                parts.append(bytes(self._random.choice(self._black_sequences)))
+            telegram = self.telegram(self._random.choice(msgids))
+            parts.append(self.transceiver_telegram(telegram) if transceiver else telegram)
+        return b"".join(parts)
+
+#--- class cht_telegramgenerator end ---#
+################################################
+
+if __name__ == "__main__":
+    import os
+    import logging
+    import tempfile
+    import data
+    import ht_bulkdecode
+    print("-------------------- do some telegram-checks -------------------------")
+    generator = cht_telegramgenerator(seed=1)
+    logger = logging.getLogger("ht_telegram")
+    logger.addHandler(logging.NullHandler())
+    testdata = data.cdata()
+    testdata.read_db_config("./../etc/config/HT3_db_cfg.xml", logger=logger)
+    testpath = os.path.join(tempfile.gettempdir(), "ht_telegram_test.bin")
+
+    for transceiver in (False, True):
+        # one telegram for every msgID, decoded msgIDs must be the same
+        telegrams = [generator.telegram(msgid) for msgid in generator.msgids()]
+        if transceiver:
+            telegrams = [generator.transceiver_telegram(telegram) for telegram in telegrams]
+        with open(testpath, "wb") as testfile:
+            testfile.write(b"".join(telegrams))
+        filehandle = ht_bulkdecode.cht_filesource(testpath)
+        decoder = ht_discode.cht_discode(None, testdata, 0, filehandle, logger=logger)
+        decoded = []
+        try:
+            while True:
+                decoder.discoder()
+                message = decoder.last_message()
+                if message != None and (len(decoded) == 0 or not decoded[-1] is message):
+                    decoded.append(message)
+        except EOFError:
+            filehandle.close()
+        ok = [message[0] for message in decoded] == generator.msgids()
+        print("transceiver:{0}; {1} msgIDs ".format(transceiver, len(decoded)), end="")
+        print("+-> OK") if ok else print("+-> Error")
+
+        # stream with noise and polling-sequences, all telegrams must be decoded without decoder-errors
+        with open(testpath, "wb") as testfile:
+            testfile.write(generator.stream(5000, transceiver=transceiver, noise=0.05, black_sequences=0.1))
+        filehandle = ht_bulkdecode.cht_filesource(testpath)
+        decoder = ht_discode.cht_discode(None, testdata, 0, filehandle, logger=logger)
+        try:
+            while True:
+                decoder.discoder()
+        except EOFError:
+            filehandle.close()
+        print("transceiver:{0}; stream decoder-errors:{1} ".format(transceiver, decoder.decoder_errors()), end="")
+        print("+-> OK") if len(decoder.decoder_errors()) == 0 else print("+-> Error")
+    os.remove(testpath)
+    print("message-sizes read by decoders:", {msgid: generator.layout_size(ht_discode.cht_discode.dispatch[msgid])
+                                               for msgid in generator.msgids()[0:12]}, "...")
@@ -35,6 +35,10 @@
 #                               IntegerToString() added.
 #                               Bitstatus() added.
 #                               Temperature-Limits set to 200.0.
+# Ver:0.4.2  / 2026-10-18       cht_ringbuffer added.
+#                                cht_ringbuffer: find() with 'end', tail() and commit()
+#                                 added for block-reads into buffer.
+#                                crc_framesearch() and crc_frameboundaries() added.
 #################################################################
 
 import os
@@ -101,6 +105,43 @@ class cht_utils(object):
             print("HT3_decode.__crc_testen();Error;{0}", e.args[0])
             return False
 
+    def crc_framesearch(self, buffer, minlength=6, maxlength=None):
+        """
+        returns the first bufferlength in range(minlength, maxlength) with
+         valid CRC (see: crc_testen()), else 0.
+        """
+        lengths = self.crc_frameboundaries(buffer, minlength, maxlength, 1)
+        return lengths[0] if len(lengths) else 0
+
+    def crc_frameboundaries(self, buffer, minlength=6, maxlength=None, maxcount=0):
+        """
+        returns a list of all bufferlengths in range(minlength, maxlength) with
+         valid CRC (see: crc_testen()), the list is limited to 'maxcount' entries
+         if 'maxcount' > 0.
+         The CRC is carried forward byte by byte, so the buffer is read only once
+         for all bufferlengths.
+        """
+        lengths = []
+        if maxlength == None or maxlength > len(buffer) + 2:
+            maxlength = len(buffer) + 2
+        if minlength < 3:
+            minlength = 3
+        if minlength >= maxlength:
+            return lengths
+        crc_table = self.__crc_table
+        crc = 0
+        # crc over buffer[0:i] is compared with buffer[i] := CRC-byte of bufferlength i+2
+        for i in range(0, minlength - 2):
+            crc = crc_table[crc] ^ buffer[i]
+        for i in range(minlength - 2, maxlength - 2):
+            value = buffer[i]
+            if crc == value:
+                lengths.append(i + 2)
+                if len(lengths) == maxcount:
+                    break
+            crc = crc_table[crc] ^ value
+        return lengths
+
     def make_crc(self, buffer, bufferlength):
         """
         returns crc-value if valid else False.
@@ -263,6 +304,165 @@ class cht_utils(object):
         
 #--- class cht_utils end ---#
 
+class cht_ringbuffer(object):
+    """
+    Class: cht_ringbuffer.
+     Fixed-capacity byte-buffer with read- and write-cursor used for
+     frame-reassembly of heater bus-data.
+     Bytes are always stored contiguous, so index 0 is the oldest unread byte
+     and slicing returns a zero-copy 'memoryview' of the buffer-content.
+     If the write-cursor reaches the end of buffer, the unread bytes are moved
+     once to the start of buffer (no allocation).
+    """
+    def __init__(self, capacity=4096):
+        """
+        Initialisation of buffer with 'capacity' bytes.
+        """
+        if capacity < 64:
+            capacity = 64
+        self._capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._rd = 0
+        self._wr = 0
+
+    def __len__(self):
+        """
+        returns the amount of unread bytes.
+        """
+        return self._wr - self._rd
+
+    def __getitem__(self, index):
+        """
+        returns the byte at 'index' (int) or a memoryview for a slice.
+         index 0 is the oldest unread byte.
+        """
+        if index.__class__ is int and 0 <= index < self._wr - self._rd:
+            return self._buffer[self._rd + index]
+        if isinstance(index, slice):
+            (start, stop, step) = index.indices(self._wr - self._rd)
+            if stop < start:
+                stop = start
+            return self._view[self._rd + start:self._rd + stop:step]
+        if index < 0:
+            index += self._wr - self._rd
+        if index < 0 or index >= self._wr - self._rd:
+            raise IndexError("cht_ringbuffer index out of range")
+        return self._buffer[self._rd + index]
+
+    def capacity(self):
+        """
+        returns the buffer-capacity in bytes.
+        """
+        return self._capacity
+
+    def free(self):
+        """
+        returns the amount of bytes which can be written.
+        """
+        return self._capacity - (self._wr - self._rd)
+
+    def clear(self):
+        """
+        removes all unread bytes.
+        """
+        self._rd = 0
+        self._wr = 0
+
+    def _compact(self, size):
+        """
+        moves unread bytes to start of buffer if 'size' bytes don't fit behind
+         the write-cursor. raises BufferError if the buffer is full.
+        """
+        if self._wr + size <= self._capacity:
+            return
+        used = self._wr - self._rd
+        if used + size > self._capacity:
+            raise BufferError("cht_ringbuffer overflow")
+        if used > 0:
+            self._buffer[0:used] = self._buffer[self._rd:self._wr]
+        self._rd = 0
+        self._wr = used
+
+    def append(self, value):
+        """
+        writes one byte (int) to buffer.
+        """
+        if self._wr >= self._capacity:
+            self._compact(1)
+        self._buffer[self._wr] = value
+        self._wr += 1
+
+    def extend(self, values):
+        """
+        writes bytes, bytearray, memoryview or list of ints to buffer.
+        """
+        size = len(values)
+        self._compact(size)
+        self._buffer[self._wr:self._wr + size] = values
+        self._wr += size
+
+    def tail(self, size):
+        """
+        returns a writeable memoryview of 'size' free bytes behind the
+         write-cursor. The written bytes must be taken over with 'commit()'.
+        """
+        self._compact(size)
+        return self._view[self._wr:self._wr + size]
+
+    def commit(self, size):
+        """
+        takes over 'size' bytes written to the view returned by 'tail()'.
+        """
+        if size > self._capacity - self._wr:
+            raise BufferError("cht_ringbuffer overflow")
+        self._wr += size
+
+    def consume(self, size=1):
+        """
+        removes 'size' bytes from the start (read-cursor) of buffer.
+        """
+        used = self._wr - self._rd
+        if size > used:
+            size = used
+        self._rd += size
+        if self._rd == self._wr:
+            self._rd = 0
+            self._wr = 0
+
+    def remove(self, index, size):
+        """
+        removes 'size' bytes at 'index' from buffer. The bytes in front of
+         'index' are moved to the end of the gap, so the read-cursor is moved
+         and not the (normally larger) rest of data.
+        """
+        used = self._wr - self._rd
+        if index < 0 or size <= 0 or index >= used:
+            return
+        if index + size > used:
+            size = used - index
+        if index > 0:
+            start = self._rd
+            self._buffer[start + size:start + size + index] = self._buffer[start:start + index]
+        self.consume(size)
+
+    def find(self, sequence, start=0, end=None):
+        """
+        returns the index of first 'sequence' found in unread bytes, else -1.
+         The search can be limited to the first 'end' bytes.
+        """
+        end = self._wr if end == None else min(self._wr, self._rd + end)
+        found_index = self._buffer.find(sequence, self._rd + start, end)
+        return found_index - self._rd if found_index >= 0 else -1
+
+    def tobytes(self):
+        """
+        returns a copy of all unread bytes.
+        """
+        return bytes(self._view[self._rd:self._wr])
+
+#--- class cht_ringbuffer end ---#
+
 class clog(object):
     """
     Class: clog.
@@ -452,6 +652,13 @@ if __name__ == "__main__":
     crc_ok = utils.crc_testen(heizgeraettestbuffer2, length)
     print("+-> OK") if crc_ok else print("+-> Error seen and so it's OK")
 
+    print("-- search frame-boundaries in concatenated Messages 1 and 3 --")
+    boundaries = utils.crc_frameboundaries(heizgeraet + heizkreistestbuffer, 6)
+    print("frame-boundaries:{0}".format(boundaries))
+    print("+-> OK") if 31 in boundaries else print("+-> Error")
+    length = utils.crc_framesearch(heizkreistestbuffer + heizgeraet, 6)
+    print("+-> OK") if length == 17 else print("+-> Error")
+
     print("-------------------- do some transceiver-header-checks -------------")
     transceiver_header = [0x23, 0x48, 0x52, 0x11, 1, 0, 4]
     if utils.Is_TransceiverHeader(transceiver_header):
@@ -27,6 +27,9 @@
 # Ver:0.4.1  / 2023-09-29 __TopicValue_modify() added and used
 #                          (see issue: #21)
 #                         send only defined values to broker.
+# Ver:0.4.2  / 2026-10-18 received set-topics are passed with the complete
+#                          subtopic below 'set/<topic_root_name>/' to the tx-queue,
+#                          so topic-prefixes of more heaters are available.
 #################################################################
 
 import xml.etree.ElementTree as ET
@@ -661,7 +664,11 @@ class cmqtt_client(cmqtt_baseclass):
             pass
         else:
             if len(topic) > 0 and len(payload) > 0:
-                if '/' in topic:
+                set_topic_root = "set/" + str(self.cfg_topic_root_name()) + "/"
+                if topic.startswith(set_topic_root):
+                    # subtopic with optional topic-prefix: [<prefix>/]<accessname>
+                    accessname = topic[len(set_topic_root):]
+                elif '/' in topic:
                     accessname = topic[topic.rfind('/')+1:]
                 else:
                     accessname = topic